@@ -1,9 +1,207 @@
 import os
+import argparse
 import src.neural_net as neural_net
+import src.fitness_measures as fitness_measures
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train a NEAT population to play Dino Jump.")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="train without drawing the game or limiting the frame rate",
+    )
+    parser.add_argument(
+        "--render-thread",
+        action="store_true",
+        help="draw the game on a separate thread, dropping frames rather than slowing training "
+        "(not supported on macOS)",
+    )
+    parser.add_argument(
+        "--record-replays",
+        metavar="DIR",
+        help="record every generation to a replay file within DIR",
+    )
+    parser.add_argument(
+        "--course-seed",
+        type=int,
+        metavar="SEED",
+        help="play every generation on the same course, allowing fitness values to be cached",
+    )
+    parser.add_argument(
+        "--fitness-cache-size",
+        type=int,
+        default=10000,
+        metavar="N",
+        help="number of genome fitness values cached when a course seed is set (0 disables)",
+    )
+    parser.add_argument(
+        "--courses",
+        type=int,
+        default=1,
+        metavar="K",
+        help="number of courses every genome plays each generation, played in parallel",
+    )
+    parser.add_argument(
+        "--fitness-aggregate",
+        choices=["mean", "min", "quantile"],
+        default="mean",
+        help="how the fitness values of a genome across courses are combined",
+    )
+    parser.add_argument(
+        "--fitness-quantile",
+        type=float,
+        default=0.25,
+        metavar="Q",
+        help="quantile used with --fitness-aggregate quantile",
+    )
+    parser.add_argument(
+        "--fitness-measure",
+        choices=list(fitness_measures.MEASURES),
+        default=fitness_measures.DEFAULT_MEASURE,
+        help="what a dino's run on a course is scored by",
+    )
+    parser.add_argument(
+        "--decision-interval",
+        type=int,
+        default=1,
+        metavar="K",
+        help="frames between network queries, each dino holding its last action in between",
+    )
+    parser.add_argument(
+        "--decision-window",
+        type=float,
+        metavar="PX",
+        help="query networks every frame while the next obstacle is within PX pixels",
+    )
+    parser.add_argument(
+        "--fast-forward",
+        type=float,
+        metavar="PX",
+        help="when headless, skip frames at once while every dino runs on the ground and the "
+        "next obstacle is over PX pixels away. A genome's fitness then depends on the rest of "
+        "its population, so fitness values aren't cached",
+    )
+    parser.add_argument(
+        "--plot-dir",
+        metavar="DIR",
+        help="draw fitness, speciation and champion network plots to DIR in the background",
+    )
+    parser.add_argument(
+        "--plot-every",
+        type=int,
+        default=10,
+        metavar="N",
+        help="generations between champion network plots when used with --plot-dir",
+    )
+    parser.add_argument(
+        "--stats-log",
+        default="statistics.csv",
+        metavar="FILE",
+        help="CSV file each generation's fitness and species statistics are appended to",
+    )
+    parser.add_argument(
+        "--islands",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of populations evolved side by side, each in its own headless process",
+    )
+    parser.add_argument(
+        "--island-ids",
+        type=int,
+        nargs="+",
+        metavar="ID",
+        help="islands run by this host, when the islands are spread over several hosts",
+    )
+    parser.add_argument(
+        "--migration-dir",
+        default="migration",
+        metavar="DIR",
+        help="directory, shared by every island, through which migrants are exchanged",
+    )
+    parser.add_argument(
+        "--migration-interval",
+        type=int,
+        default=5,
+        metavar="N",
+        help="generations between migrations when used with --islands",
+    )
+    parser.add_argument(
+        "--migrants",
+        type=int,
+        default=2,
+        metavar="N",
+        help="number of fittest genomes each island sends on at every migration",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="serve training metrics as plain text at http://127.0.0.1:PORT/metrics (islands use "
+        "PORT plus their id, or free ports for 0)",
+    )
+    parser.add_argument(
+        "--export-champion",
+        metavar="PATH",
+        help="after training, export a clip of the winner to PATH (.gif, a video file, or a "
+        "directory of PNG frames), drawn offscreen",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="play back a recorded generation instead of training",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="playback speed multiplier used with --replay",
+    )
+    parser.add_argument(
+        "--seek",
+        type=int,
+        default=0,
+        metavar="FRAME",
+        help="frame to start drawing from when used with --replay",
+    )
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
 
-    local_dir = os.path.dirname(__file__)
-    config_path = os.path.join(local_dir, "config/config-feedforward.txt")
+    args = parse_args()
+
+    if args.replay:
+        import src.replay as replay
+
+        replay.play(args.replay, speed=args.speed, start_frame=args.seek)
+    else:
+        local_dir = os.path.dirname(__file__)
+        config_path = os.path.join(local_dir, "config/config-feedforward.txt")
 
-    neural_net.run(config_path)
+        neural_net.run(
+            config_path,
+            run_headless=args.headless,
+            record_replay_dir=args.record_replays,
+            fixed_course_seed=args.course_seed,
+            cache_size=args.fitness_cache_size,
+            courses=args.courses,
+            aggregate=args.fitness_aggregate,
+            quantile=args.fitness_quantile,
+            plot_dir=args.plot_dir,
+            plot_every=args.plot_every,
+            stats_log=args.stats_log,
+            num_islands=args.islands,
+            island_ids=args.island_ids,
+            migration_dir=args.migration_dir,
+            migration_interval=args.migration_interval,
+            num_migrants=args.migrants,
+            interval=args.decision_interval,
+            window=args.decision_window,
+            render_in_thread=args.render_thread,
+            export_path=args.export_champion,
+            measure=args.fitness_measure,
+            skip_distance=args.fast_forward,
+            metrics_port=args.metrics_port,
+        )
@@ -1,6 +1,5 @@
 import random
-import pygame
-import os
+import src.sprites as sprites
 
 PIX_PER_METER = 15
 
@@ -9,12 +8,41 @@ DEFAULT_GAME_SPEED_MPS = 15
 DEFAULT_FPS = 60
 DEFAULT_FRAMES_PER_IMAGE = 5
 
+BIRD_HEIGHT_STEPS = 3
+
+# NOTE: Every (name, number of images) set loaded by the assets below.
+SPRITE_SETS = [
+    ("dino_jump", 1),
+    ("dino_run", 2),
+    ("dino_duck", 2),
+    ("cactus", 3),
+    ("bird", 2),
+]
+
+
+class AnimationClock:
+    """
+    Frame counter shared by everything animated in a game.
+
+    Rather than each asset counting frames to its next image, the image shown is worked out from
+    the clock, the asset's phase (the frame its animation started on) and its pose whenever it's
+    needed, e.g. to draw it or test it for collisions.
+    """
+
+    def __init__(self):
+        self.frame = 0
+
+    def tick(self, frames=1):
+        self.frame += frames
+
+    def get_index(self, phase, frames_per_image, num_images):
+        return (self.frame - phase) // frames_per_image % num_images
+
 
 def load_images(name, num):
-    return [
-        pygame.image.load(os.path.join("images", name + "_" + str(x) + ".png"))
-        for x in range(num)
-    ]
+    # NOTE: Images are shared between every asset using them, so each file is only read from
+    # disk once, and anything derived from an image (e.g. collision shapes) can be cached with it.
+    return sprites.load_sprites(name, num)
 
 
 class Dino:
@@ -33,37 +61,48 @@ class Dino:
         gravity_normal=-80,
         gravity_ducking=-100,
         jump_initial_velocity=DEFAULT_JUMP_SPEED_MPS,
+        clock=None,
     ):
         self.imgs_jump = load_images("dino_jump", 1)
         self.imgs_run = load_images("dino_run", 2)
         self.imgs_run_duck = load_images("dino_duck", 2)
         self.imgs_cur = self.imgs_run
-        self.img_index = 0
-        self.frames_since_last_img_update = 0
+
+        # NOTE: A dino without a game's clock keeps its own, ticked as it's updated.
+        self.owns_clock = clock is None
+        self.clock = AnimationClock() if clock is None else clock
+        self.phase = self.clock.frame
         self.fps = fps
         self.animation_rate = frames_per_img_animate
         self.floor_pos_y = floor_pos_y
         self.x = start_pos_x
-        self.y = self._get_cur_img_floor_y()
         self.duck_triggered = False
         self.jump_triggered = False
         self.frames_since_jump_start = 0
+        self.y = self._get_cur_img_floor_y()
         self.gravity_normal = gravity_normal
         self.gravity_ducking = gravity_ducking
         self.jump_velocity = jump_initial_velocity
         self.dead = False
 
     def _get_cur_img_floor_y(self):
-        return self.floor_pos_y - self.imgs_cur[self.img_index].get_height()
+        return self.floor_pos_y - self.get_image().get_height()
 
     def _is_jumping(self):
         return self.frames_since_jump_start > 0
 
-    def _animate_run(self):
-        self.frames_since_last_img_update += 1
-        if self.frames_since_last_img_update == self.animation_rate:
-            self.img_index = not self.img_index
-            self.frames_since_last_img_update = 0
+    def skip_run(self, frames):
+        """
+        Advances the dino by frames frames of running on the ground at once, as if update were
+        called that many times without it jumping or ducking.
+        """
+        self.imgs_cur = self.imgs_run
+        if self.owns_clock:
+            self.clock.tick(frames)
+        self.y = self._get_cur_img_floor_y()
+
+    def is_running(self):
+        return not (self.jump_triggered or self.duck_triggered or self._is_jumping())
 
     def _update_jump_elevation(self, gravity):
 
@@ -101,20 +140,25 @@ class Dino:
                 gravity = self.gravity_ducking
             else:
                 self.imgs_cur = self.imgs_jump
-                self.img_index = 0
                 gravity = self.gravity_normal
             self.frames_since_jump_start += 1
             self._update_jump_elevation(gravity)
         else:
             self.imgs_cur = self.imgs_run_duck if self.duck_triggered else self.imgs_run
-            self.y = self.floor_pos_y - self.imgs_cur[self.img_index].get_height()
-            self._animate_run()
+            self.y = self._get_cur_img_floor_y()
 
         self.jump_triggered = False
         self.duck_triggered = False
+        if self.owns_clock:
+            self.clock.tick()
 
     def get_image(self):
-        return self.imgs_cur[self.img_index]
+        # NOTE: The dino only animates while on the ground.
+        if self._is_jumping():
+            return self.imgs_cur[0]
+        return self.imgs_cur[
+            self.clock.get_index(self.phase, self.animation_rate, len(self.imgs_cur))
+        ]
 
     def get_image_pos_x(self):
         return self.x
@@ -125,6 +169,21 @@ class Dino:
     def get_elevation(self):
         return self._get_cur_img_floor_y() - self.y
 
+    def get_state(self):
+        """
+        Returns everything that decides how the dino moves and collides from here on, so dinos
+        with equal states behave identically given the same actions.
+        """
+        return (
+            id(self.imgs_cur),
+            self.phase,
+            self.y,
+            self.frames_since_jump_start,
+            self.jump_triggered,
+            self.duck_triggered,
+            self.dead,
+        )
+
     def set_dead(self):
         self.dead = True
 
@@ -153,7 +212,6 @@ class _SceneElement:
 
         self.x = start_x
         self.y = None
-        self.img = None
         self.fps = fps
         self.set_game_speed(game_speed)
 
@@ -164,6 +222,12 @@ class _SceneElement:
         distance = round(self.game_speed / self.fps)
         self.x -= distance
 
+    def skip(self, frames, distance):
+        """
+        Moves the element distance pixels at once, the sum of its moves over frames frames.
+        """
+        self.x -= distance
+
     def get_image(self):
         return self.img
 
@@ -196,6 +260,7 @@ class Cactus(_SceneElement):
         if cactus_size >= 3:
             raise ValueError("Cactus size should be either 0, 1 or 2")
 
+        self.cactus_size = cactus_size
         self.img = load_images("cactus", 3)[cactus_size]
         self.y = floor_y_pos - self.img.get_height()
 
@@ -220,6 +285,9 @@ class Bird(_SceneElement):
         game_speed=DEFAULT_GAME_SPEED_MPS,
         fps=DEFAULT_FPS,
         frames_per_img_animate=DEFAULT_FRAMES_PER_IMAGE,
+        rng=random,
+        height_step=None,
+        clock=None,
     ):
 
         if not isinstance(frames_per_img_animate, int):
@@ -230,32 +298,38 @@ class Bird(_SceneElement):
 
         super().__init__(fps, start_x, game_speed)
         self.img_set = load_images("bird", 2)
-        self.img_index = 0
-        self.img = self.img_set[self.img_index]
+        self.frames_per_img_animate = frames_per_img_animate
 
-        num_increments = 3
+        # NOTE: A bird without a game's clock keeps its own, ticked as it's updated.
+        self.owns_clock = clock is None
+        self.clock = AnimationClock() if clock is None else clock
+        self.phase = self.clock.frame
 
-        max_y = max_y - self.img.get_height()
-        bird_height_increment = (max_y - min_y) / (num_increments - 1)
+        if height_step is None:
+            height_step = rng.randint(0, BIRD_HEIGHT_STEPS - 1)
+        self.height_step = height_step
 
-        self.y = round(
-            min_y + (bird_height_increment * random.randint(0, num_increments - 1))
-        )
-        self.frames_since_img_update = 0
-        self.frames_per_img_animate = frames_per_img_animate
+        max_y = max_y - self.img.get_height()
+        bird_height_increment = (max_y - min_y) / (BIRD_HEIGHT_STEPS - 1)
 
-    def _animate(self):
-        self.frames_since_img_update += 1
-        if self.frames_since_img_update >= self.frames_per_img_animate:
-            self.img_index = not self.img_index
-            self.img = self.img_set[self.img_index]
+        self.y = round(min_y + (bird_height_increment * height_step))
 
-            self.frames_since_img_update = 0
+    @property
+    def img(self):
+        return self.img_set[
+            self.clock.get_index(self.phase, self.frames_per_img_animate, len(self.img_set))
+        ]
 
     def update(self):
-        self._animate()
+        if self.owns_clock:
+            self.clock.tick()
         self._update()
 
+    def skip(self, frames, distance):
+        if self.owns_clock:
+            self.clock.tick(frames)
+        super().skip(frames, distance)
+
 
 class Dirt(_SceneElement):
     """
@@ -273,6 +347,7 @@ class Dirt(_SceneElement):
         max_rad=4,
         game_speed=DEFAULT_GAME_SPEED_MPS,
         fps=DEFAULT_FPS,
+        rng=random,
     ):
         if min_y >= max_y:
             raise ValueError("min_y is greater or equal to max_y")
@@ -283,9 +358,9 @@ class Dirt(_SceneElement):
         self.y = min_y + round(
             (max_y - min_y)
             / (num_increments - 1)
-            * random.randint(0, num_increments - 1)
+            * rng.randint(0, num_increments - 1)
         )
-        self.radius = random.randint(min_rad, max_rad)
+        self.radius = rng.randint(min_rad, max_rad)
 
     def set_x(self, x):
         self.x = x
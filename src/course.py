@@ -0,0 +1,131 @@
+import src.game as game
+import src.assets as assets
+import src.sprites as sprites
+import src.shared_arrays as shared_arrays
+
+import numpy as np
+
+SCHEDULE_LENGTH = 1000
+
+_RANDOM_STATE_VERSION = 3
+
+_shared_sprites = None
+
+
+class ObstacleSchedule:
+    """
+    The obstacles of a course in the order they appear, as (kind, gap, bird height step) rows.
+
+    Given to a Game, obstacles are taken from the schedule rather than drawn at random, and once
+    it runs out the game's generator is set to the state it would have been in, so the course is
+    the same as that of a game created with the seed alone.
+    """
+
+    def __init__(self, kinds, gaps, height_steps, random_state):
+        self.kinds = kinds
+        self.gaps = gaps
+        self.height_steps = height_steps
+        self.random_state = random_state
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def get_spec(self, index):
+        return int(self.kinds[index]), int(self.gaps[index]), int(self.height_steps[index])
+
+    def get_rng_state(self):
+        return (_RANDOM_STATE_VERSION, tuple(int(word) for word in self.random_state), None)
+
+
+def _initial_spec(obstacle, previous):
+    # NOTE: Obstacles haven't moved when the game is created, so their spacing is the gap drawn.
+    gap = obstacle.x - previous.x if previous is not None else 0
+    if isinstance(obstacle, assets.Bird):
+        return game.BIRD_OBSTACLE_KIND, gap, obstacle.height_step
+    return obstacle.cactus_size, gap, 0
+
+
+def generate_schedule(seed, win_width, win_height, length=SCHEDULE_LENGTH):
+    course_game = game.Game(1, win_width, win_height, seed=seed, headless=True)
+
+    specs = []
+    previous = None
+    for obstacle in course_game.obstacles:
+        specs.append(_initial_spec(obstacle, previous))
+        previous = obstacle
+    while len(specs) < length:
+        specs.append(course_game.draw_obstacle_spec())
+
+    kinds, gaps, height_steps = zip(*specs[:length])
+    version, random_state, _gauss_next = course_game.random.getstate()
+    if version != _RANDOM_STATE_VERSION:
+        raise ValueError("Unsupported random state version {}".format(version))
+
+    return ObstacleSchedule(
+        np.array(kinds, dtype=np.int8),
+        np.array(gaps, dtype=np.int32),
+        np.array(height_steps, dtype=np.int8),
+        np.array(random_state, dtype=np.uint32),
+    )
+
+
+def publish_schedules(schedules):
+    """
+    Publishes the schedules of several courses, as one block of stacked arrays, to shared memory.
+    """
+    return shared_arrays.SharedArrays.publish(
+        {
+            "kinds": np.stack([schedule.kinds for schedule in schedules]),
+            "gaps": np.stack([schedule.gaps for schedule in schedules]),
+            "height_steps": np.stack([schedule.height_steps for schedule in schedules]),
+            "random_states": np.stack([schedule.random_state for schedule in schedules]),
+        }
+    )
+
+
+def get_shared_schedule(shared, course):
+    arrays = shared.arrays
+    return ObstacleSchedule(
+        arrays["kinds"][course],
+        arrays["gaps"][course],
+        arrays["height_steps"][course],
+        arrays["random_states"][course],
+    )
+
+
+def _sprite_key(name, index):
+    return "{}_{}".format(name, index)
+
+
+def publish_sprites():
+    """
+    Publishes the collision mask of every game sprite to shared memory.
+    """
+    masks = {}
+    for name, num in assets.SPRITE_SETS:
+        for sprite in sprites.load_sprites(name, num):
+            masks[_sprite_key(name, sprite.index)] = sprite.mask
+    return shared_arrays.SharedArrays.publish(masks)
+
+
+def install_shared_sprites(handle):
+    """
+    Makes this process use the sprite masks published by publish_sprites, rather than decoding
+    the images itself. The block stays attached for the life of the process.
+    """
+    global _shared_sprites
+    _shared_sprites = shared_arrays.SharedArrays.attach(handle)
+
+    for name, num in assets.SPRITE_SETS:
+        sprites.add_sprites(
+            name,
+            [
+                sprites.Sprite(
+                    name,
+                    index,
+                    sprites.sprite_path(name, index),
+                    _shared_sprites.arrays[_sprite_key(name, index)],
+                )
+                for index in range(num)
+            ],
+        )
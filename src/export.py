@@ -0,0 +1,233 @@
+import src.game as game
+import src.neural_net as neural_net
+
+import os
+import queue
+import shutil
+import subprocess
+import threading
+
+DEFAULT_SEED = 0
+DEFAULT_MAX_FRAMES = 3000
+FRAME_QUEUE_SIZE = 8
+FRAME_NAME = "frame_{:05d}.png"
+GIF_EXTENSION = ".gif"
+
+
+class _ImageSequenceEncoder:
+    def __init__(self, directory, size, fps):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.size = size
+        self.frames_written = 0
+
+    def write(self, frame):
+        import pygame
+
+        surface = pygame.image.frombytes(frame, self.size, "RGB")
+        pygame.image.save(
+            surface, os.path.join(self.directory, FRAME_NAME.format(self.frames_written))
+        )
+        self.frames_written += 1
+
+    def close(self):
+        pass
+
+
+class _GifEncoder:
+    def __init__(self, path, size, fps):
+        try:
+            from PIL import GifImagePlugin, Image
+        except ImportError as error:
+            raise ImportError("Exporting a GIF requires Pillow") from error
+
+        self.image = Image
+        self.gif = GifImagePlugin
+        self.path = path
+        self.size = size
+        self.frame_duration = round(1000 / fps)
+        self.file = None
+
+    def write(self, frame):
+        # NOTE: Frames are appended to the file as they arrive, each with a palette of its own,
+        # so only one is ever held in memory.
+        image = self.image.frombytes("RGB", self.size, frame).quantize()
+        if self.file is None:
+            self.file = open(self.path, "wb")
+            header, _palette = self.gif.getheader(image, info={"loop": 0})
+            self.file.writelines(header)
+        self.file.writelines(
+            self.gif.getdata(
+                image, duration=self.frame_duration, include_color_table=True
+            )
+        )
+
+    def close(self):
+        if self.file is None:
+            return
+        self.file.write(b";")
+        self.file.close()
+
+
+class _VideoEncoder:
+    def __init__(self, path, size, fps):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise ValueError("Exporting {} requires ffmpeg".format(os.path.basename(path)))
+
+        self.process = subprocess.Popen(
+            [
+                ffmpeg,
+                "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                "rgb24",
+                "-s",
+                "{}x{}".format(*size),
+                "-r",
+                str(fps),
+                "-i",
+                "-",
+                "-pix_fmt",
+                "yuv420p",
+                path,
+            ],
+            stdin=subprocess.PIPE,
+        )
+
+    def write(self, frame):
+        self.process.stdin.write(frame)
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError("ffmpeg failed with exit code {}".format(self.process.returncode))
+
+
+def _create_encoder(path, size, fps):
+    extension = os.path.splitext(path)[1].lower()
+    if not extension:
+        return _ImageSequenceEncoder(path, size, fps)
+    if extension == GIF_EXTENSION:
+        return _GifEncoder(path, size, fps)
+    return _VideoEncoder(path, size, fps)
+
+
+class ClipExporter:
+    """
+    Draws published frame snapshots offscreen and streams them to a clip file.
+
+    A path without an extension is written as a directory of numbered PNG images, a .gif path
+    as an animated GIF, and any other path as a video encoded by ffmpeg. Frames are encoded on a
+    background thread, while the bounded frame queue stops a slow encoder piling frames up.
+    """
+
+    def __init__(
+        self,
+        path,
+        window_width,
+        window_height,
+        floor_height,
+        frame_rate,
+        frame_step=1,
+        scale=1.0,
+    ):
+        if frame_step < 1:
+            raise ValueError("Frame step must be at least 1")
+        if scale <= 0:
+            raise ValueError("Scale must be positive")
+
+        import src.render as render
+
+        self.renderer = render.Render(
+            game.TITLE, window_width, window_height, floor_height, offscreen=True
+        )
+        # NOTE: Video encoders need frames of even width and height.
+        self.size = (
+            max(2, int(window_width * scale) // 2 * 2),
+            max(2, int(window_height * scale) // 2 * 2),
+        )
+        self.frame_step = frame_step
+        self.frames_seen = 0
+        self.encoder = _create_encoder(path, self.size, frame_rate / frame_step)
+        self.error = None
+
+        self.frames = queue.Queue(FRAME_QUEUE_SIZE)
+        self.thread = threading.Thread(target=self._encode_frames, daemon=True)
+        self.thread.start()
+
+    def wants_frame(self):
+        self.frames_seen += 1
+        return (self.frames_seen - 1) % self.frame_step == 0
+
+    def publish(self, snapshot, generation):
+        self.renderer.draw_snapshot(snapshot)
+        self.renderer.display_generation(generation)
+        self.frames.put(self.renderer.get_frame(self.size))
+
+    def _encode_frames(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                break
+            if self.error is None:
+                try:
+                    self.encoder.write(frame)
+                except Exception as error:
+                    self.error = error
+
+    def close(self):
+        """
+        Waits for every frame to be encoded and finishes the clip.
+        """
+        self.frames.put(None)
+        self.thread.join()
+        if self.error is None:
+            self.encoder.close()
+            return
+
+        # NOTE: The encoder is still closed (e.g. so ffmpeg is waited on), but the write that
+        # failed is the error worth reporting.
+        try:
+            self.encoder.close()
+        except Exception:
+            pass
+        raise self.error
+
+
+def export_champion(
+    genome,
+    config,
+    path,
+    seed=DEFAULT_SEED,
+    max_frames=DEFAULT_MAX_FRAMES,
+    frame_step=1,
+    scale=1.0,
+):
+    """
+    Plays genome alone on the course generated from seed, exporting the run as a clip to path.
+    """
+    exporter = ClipExporter(
+        path,
+        neural_net.WINDOW_WIDTH,
+        neural_net.WINDOW_HEIGHT,
+        game.get_floor_height(neural_net.WINDOW_HEIGHT),
+        neural_net.FRAME_RATE,
+        frame_step,
+        scale,
+    )
+    try:
+        neural_net.play_course(
+            [genome],
+            config,
+            seed,
+            interval=neural_net.decision_interval,
+            window=neural_net.decision_window,
+            pipeline=exporter,
+            max_frames=max_frames,
+        )
+    finally:
+        exporter.close()
@@ -0,0 +1,58 @@
+import hashlib
+
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+def genome_hash(genome, course_seed):
+    """
+    Canonical hash of everything that affects how a genome plays a given course.
+
+    Disabled connections are left out as they take no part in the resulting network.
+    """
+    nodes = sorted(
+        (key, node.bias, node.response, node.activation, node.aggregation)
+        for key, node in genome.nodes.items()
+    )
+    connections = sorted(
+        (key, conn.weight) for key, conn in genome.connections.items() if conn.enabled
+    )
+    return hashlib.sha1(repr((course_seed, nodes, connections)).encode()).digest()
+
+
+class FitnessCache:
+    """
+    Least recently used store of genome fitness values, keyed by genome_hash.
+
+    Elite genomes are carried unchanged into the next generation, so on a deterministic course
+    their fitness can be looked up rather than simulated again.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        if max_entries <= 0:
+            raise ValueError("Cache must hold at least one entry")
+
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        fitness = self.entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return fitness
+
+    def put(self, key, fitness):
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.entries)
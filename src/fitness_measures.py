@@ -0,0 +1,51 @@
+SURVIVAL_REWARD = 0.1
+DEATH_PENALTY = 1
+DEFAULT_MEASURE = "survival"
+
+
+class CourseResult:
+    """
+    How every dino of a course fared, as integer arrays indexed by dino.
+
+    death_frames holds the frame each dino died on, or the last frame played for dinos still
+    alive when the course ended, as marked by died. obstacles_cleared holds the obstacles that
+    had passed each dino when it died (or the course ended) and jump_frames the frames it asked
+    to jump on.
+    """
+
+    def __init__(self, death_frames, died, obstacles_cleared, jump_frames):
+        self.death_frames = death_frames
+        self.died = died
+        self.obstacles_cleared = obstacles_cleared
+        self.jump_frames = jump_frames
+
+
+def survival(result):
+    return SURVIVAL_REWARD * result.death_frames - DEATH_PENALTY * result.died
+
+
+def obstacles_cleared(result):
+    return result.obstacles_cleared.astype(float)
+
+
+def jump_efficiency(result):
+    # NOTE: Birds can be ducked under, so a dino clearing obstacles without jumping scores best.
+    return result.obstacles_cleared / (1 + result.jump_frames)
+
+
+MEASURES = {
+    "survival": survival,
+    "obstacles": obstacles_cleared,
+    "jump_efficiency": jump_efficiency,
+}
+
+
+def get_measure(name):
+    """
+    Returns the fitness measure called name, a function from a CourseResult to an array of
+    fitness values.
+    """
+    measure = MEASURES.get(name)
+    if measure is None:
+        raise ValueError("Unknown fitness measure '{}'".format(name))
+    return measure
@@ -1,9 +1,9 @@
 import src.assets as assets
-import src.render as render
 import src.mechanics as mechanics
 
+import copy
 import random
-import pygame
+import numpy as np
 
 from collections import namedtuple
 
@@ -13,12 +13,21 @@ Obstacle = namedtuple(
     "Obstacle", ["height", "width", "distance", "elevation", "is_cactus"]
 )
 
+# NOTE: Dinos and obstacles are (sprite, x, y) tuples and dirt (radius, x, y) tuples.
+FrameSnapshot = namedtuple("FrameSnapshot", ["score", "dinos", "dirt", "obstacles"])
+
 NUM_DIRT_PIECES = 20
 DIRT_SPREAD = 30
 
 DINO_JUMP_VELOCITY = 50
 DINO_SPEED_INCREMENT = 0.005
 
+BIRD_OBSTACLE_KIND = 3
+
+
+def get_floor_height(win_height):
+    return round((win_height * 7) / 8)
+
 
 class Game:
     """
@@ -26,48 +35,98 @@ class Game:
     
     Handles game initialisation, game state management, updates game elements, and renders the game scene.
     """
-    def __init__(self, numDinos, win_width, win_height, frame_rate=30, start_speed=15):
+    def __init__(
+        self,
+        numDinos,
+        win_width,
+        win_height,
+        frame_rate=30,
+        start_speed=15,
+        seed=None,
+        on_obstacle_spawn=None,
+        headless=False,
+        schedule=None,
+    ):
+
+        floor_height = get_floor_height(win_height)
+        self.win_width = win_width
+        self.win_height = win_height
+        self.floor_height = floor_height
+
+        # NOTE: The simulation only works with sprite data, so pygame is only imported (and
+        # initialised) when the game is to be drawn.
+        self.render = None
+        if not headless:
+            import src.render as render
+
+            self.render = render.Render(
+                TITLE,
+                win_width,
+                win_height,
+                floor_height,
+            )
+        self.frame_rate = frame_rate
+        self.start_speed = start_speed
+
+        self.floor_dirt: list[assets.Dirt] = []
+        self.dinos: list[assets.Dino] = []
+        self.jump_requests = []
+        self.duck_requests = []
+        self.obstacles = []
+        self.reset(numDinos, seed, on_obstacle_spawn, schedule)
+
+    def reset(self, numDinos, seed=None, on_obstacle_spawn=None, schedule=None):
+        """
+        Starts a new game in place, keeping the renderer (and its window) and the game's lists.
+        """
 
         if numDinos == 0:
             raise ValueError("Can't init game without dinos")
 
-        floor_height = round((win_height * 7) / 8)
-        self.render = render.Render(
-            TITLE,
-            win_width,
-            win_height,
-            floor_height,
-        )
-        self.frame_rate = frame_rate
-        self.clock = pygame.time.Clock()
-        self.dino_speed = start_speed
-        self.floor_dirt: list[assets.Dirt] = []
+        # NOTE: The course (obstacles and dirt) only draws from this generator, so a game
+        # created with the same seed always produces the same course.
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.on_obstacle_spawn = on_obstacle_spawn
+
+        # NOTE: A schedule holds the obstacles this generator would draw, so it can stand in for
+        # it, producing the same course.
+        self.schedule = schedule
+        self.obstacles_spawned = 0
+
+        self.dino_speed = self.start_speed
+        self.obstacles_cleared = 0
+        self.clock = assets.AnimationClock()
+        self.floor_dirt.clear()
         self._generate_dirt()
 
-        start_pos_x = win_width / 10
-        self.dinos: list[assets.Dino] = [
-            assets.Dino(
-                start_pos_x,
-                floor_height,
-                frame_rate,
-                jump_initial_velocity=DINO_JUMP_VELOCITY,
-            )
-            for _ in range(numDinos)
-        ]
+        # NOTE: Dinos in the same physical state share a Dino object, so their physics and
+        # collisions are only worked out once. Every dino starts out in the same state.
+        dino = assets.Dino(
+            self.win_width / 10,
+            self.floor_height,
+            self.frame_rate,
+            jump_initial_velocity=DINO_JUMP_VELOCITY,
+            clock=self.clock,
+        )
+        self.dinos[:] = [dino] * numDinos
+        self.jump_requests[:] = [False] * numDinos
+        self.duck_requests[:] = [False] * numDinos
         self.score = 0
-        self.obstacles = []
+        self.obstacles.clear()
         self._populate_screen_with_obstacles()
 
     def _generate_dirt(self):
         for i in range(NUM_DIRT_PIECES):
-            dirt_x = i * (self.render.win_width / NUM_DIRT_PIECES)
+            dirt_x = i * (self.win_width / NUM_DIRT_PIECES)
             self.floor_dirt.append(
                 assets.Dirt(
                     int(dirt_x),
-                    self.render.floor_height,
-                    self.render.floor_height + DIRT_SPREAD,
+                    self.floor_height,
+                    self.floor_height + DIRT_SPREAD,
                     game_speed=self.dino_speed,
                     fps=self.frame_rate,
+                    rng=self.random,
                 )
             )
 
@@ -79,49 +138,82 @@ class Game:
             if self._obstacle_off_screen(obst):
                 self.obstacles.remove(obst)
 
+    def draw_obstacle_spec(self):
+        """
+        Draws the kind, gap to the previous obstacle and bird height step of the next obstacle.
+        """
+        gap = 0
+        if self.obstacles:
+            gap = self.random.randint(int(self.win_width / 3), int(self.win_width / 2))
+
+        kind = self.random.randint(0, 3)
+        height_step = 0
+        if kind == BIRD_OBSTACLE_KIND:
+            height_step = self.random.randint(0, assets.BIRD_HEIGHT_STEPS - 1)
+        return kind, gap, height_step
+
+    def _next_obstacle_spec(self):
+        if self.schedule is None:
+            return self.draw_obstacle_spec()
+
+        if self.obstacles_spawned < len(self.schedule):
+            return self.schedule.get_spec(self.obstacles_spawned)
+
+        # NOTE: Past the end of the schedule, carry on drawing from where it left off.
+        if self.obstacles_spawned == len(self.schedule):
+            self.random.setstate(self.schedule.get_rng_state())
+        return self.draw_obstacle_spec()
+
     def _populate_screen_with_obstacles(self):
         while len(self.obstacles) != 3:
 
+            kind, gap, height_step = self._next_obstacle_spec()
+            self.obstacles_spawned += 1
+
             if self.obstacles:
-                x_pos = self.obstacles[-1].x + random.randint(
-                    int(self.render.win_width / 3), int(self.render.win_width / 2)
-                )
+                x_pos = self.obstacles[-1].x + gap
             else:
-                x_pos = self.render.win_width + 50
-
-            rand_num = random.randint(0, 3)
-            if rand_num == 3:
-                self.obstacles.append(
-                    assets.Bird(
-                        x_pos,
-                        self.render.win_height / 5,
-                        self.render.floor_height,
-                        game_speed=self.dino_speed,
-                        fps=self.frame_rate,
-                    )
+                x_pos = self.win_width + 50
+
+            if kind == BIRD_OBSTACLE_KIND:
+                obstacle = assets.Bird(
+                    x_pos,
+                    self.win_height / 5,
+                    self.floor_height,
+                    game_speed=self.dino_speed,
+                    fps=self.frame_rate,
+                    height_step=height_step,
+                    clock=self.clock,
                 )
             else:
-                self.obstacles.append(
-                    assets.Cactus(
-                        x_pos,
-                        self.render.floor_height,
-                        cactus_size=rand_num,
-                        game_speed=self.dino_speed,
-                        fps=self.frame_rate,
-                    )
+                obstacle = assets.Cactus(
+                    x_pos,
+                    self.floor_height,
+                    cactus_size=kind,
+                    game_speed=self.dino_speed,
+                    fps=self.frame_rate,
                 )
+            self.obstacles.append(obstacle)
+
+            if self.on_obstacle_spawn is not None:
+                self.on_obstacle_spawn(kind, obstacle.x, obstacle.y)
 
     def _update_dirt(self):
         for dirt in self.floor_dirt:
             dirt.set_game_speed(self.dino_speed)
             dirt.update()
             if dirt.get_image_pos_x() < 0:
-                dirt.set_x(self.render.win_width + 10)
+                dirt.set_x(self.win_width + 10)
 
     def _update_obstacles(self):
+        # NOTE: Every dino stands at the same x, so they all clear an obstacle on the same frame.
+        dino_x = self.dinos[0].x
         for obst in self.obstacles:
+            in_front = obst.x + obst.img.get_width() > dino_x
             obst.set_game_speed(self.dino_speed)
             obst.update()
+            if in_front and obst.x + obst.img.get_width() <= dino_x:
+                self.obstacles_cleared += 1
 
     def _obstacle_in_front_of_dino(self, obstacle, dino):
         return obstacle.x + obstacle.img.get_width() > dino.x
@@ -136,19 +228,20 @@ class Game:
         return self.obstacles[obstacle_index]
 
     def restrict_game_loop_speed(self):
-        self.clock.tick(self.frame_rate)
+        if self.render is not None:
+            self.render.tick(self.frame_rate)
 
     def increment_game_speed(self):
         self.dino_speed += DINO_SPEED_INCREMENT
 
     def window_closed(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return True
-        return False
+        if self.render is None:
+            return False
+        return self.render.window_closed()
 
     def quit_game(self):
-        self.render.close_window()
+        if self.render is not None:
+            self.render.close_window()
 
     def get_dino_elevation(self, dinoIndex):
         return self.dinos[dinoIndex].get_elevation()
@@ -168,63 +261,268 @@ class Game:
         )
         height = next_obstacle.img.get_height()
         width = next_obstacle.img.get_width()
-        elevation = self.render.floor_height - (
+        elevation = self.floor_height - (
             next_obstacle.y + next_obstacle.img.get_height()
         )
         is_cactus = isinstance(next_obstacle, assets.Cactus)
 
         return Obstacle(height, width, distance, elevation, is_cactus)
 
+    def get_obstacles_ahead(self, count):
+        """
+        Returns up to count of the obstacles in front of the dinos, nearest first.
+        """
+        dino = self.dinos[0]
+        return [
+            obstacle
+            for obstacle in self.obstacles
+            if self._obstacle_in_front_of_dino(obstacle, dino)
+        ][:count]
+
+    def get_dino_extents(self, dinoIds):
+        """
+        Returns arrays of the x of the front and of the elevation of each of the dinos.
+        """
+        dinos = [self.dinos[dinoId] for dinoId in dinoIds]
+        fronts = np.array([dino.x + dino.get_image().get_width() for dino in dinos], dtype=float)
+        elevations = np.array([dino.get_elevation() for dino in dinos], dtype=float)
+        return fronts, elevations
+
+    def get_next_obstacle_distances(self, dinoIds):
+        fronts, _elevations = self.get_dino_extents(dinoIds)
+        return self.get_obstacles_ahead(1)[0].x - fronts
+
     def update_environment(self):
         self._delete_obstacles_not_visible()
         self._populate_screen_with_obstacles()
         self._update_dirt()
         self._update_obstacles()
+        self.clock.tick()
+
+    def fast_forward(self, dinoIds, max_frames, min_distance):
+        """
+        Advances up to max_frames frames at once while every dino in dinoIds runs on the ground
+        and the next obstacle stays more than min_distance pixels in front of them, returning the
+        frames advanced (0 if they can't be).
+
+        Gives the same game as stepping frame by frame (increment_game_speed, update_environment,
+        update_dinos(dinoIds) and increment_score) with no dino jumping or ducking. Skips stop
+        short of an obstacle leaving the screen, so that new obstacles are only ever spawned by
+        stepping a frame.
+        """
+        if max_frames <= 0 or min_distance < 0:
+            return 0
+
+        dinos = {}
+        for dinoId in dinoIds:
+            dino = self.dinos[dinoId]
+            if self.jump_requests[dinoId] or self.duck_requests[dinoId] or not dino.is_running():
+                return 0
+            dinos[id(dino)] = dino
+        if not dinos:
+            return 0
+
+        front = max(dino.x + dino.imgs_run[0].get_width() for dino in dinos.values())
+        ahead = self.get_obstacles_ahead(1)
+        clearance = ahead[0].x - front - min_distance if ahead else np.inf
+        if clearance <= 0:
+            return 0
+
+        # NOTE: Repeated additions are reproduced exactly by a sequential cumulative sum, and
+        # every scene element moves by the same rounded distance each frame.
+        speeds = np.cumsum(np.r_[self.dino_speed, np.full(max_frames, DINO_SPEED_INCREMENT)])[1:]
+        moves = np.cumsum(np.round(speeds * assets.PIX_PER_METER / self.frame_rate)).astype(
+            np.int64
+        )
+
+        frames = min(max_frames, int(np.searchsorted(moves, clearance, side="left")))
+        for obstacle in self.obstacles:
+            edge = obstacle.x + obstacle.img.get_width()
+            if edge < 0:
+                return 0
+            frames = min(frames, int(np.searchsorted(moves, edge, side="right")) + 1)
+        if frames <= 0:
+            return 0
+
+        moved = int(moves[frames - 1])
+        self.dino_speed = float(speeds[frames - 1])
+        for obstacle in self.obstacles:
+            obstacle.set_game_speed(self.dino_speed)
+            obstacle.skip(frames, moved)
+        for dirt in self.floor_dirt:
+            dirt.set_game_speed(self.dino_speed)
+            self._skip_dirt(dirt, moves[:frames])
+        for dino in dinos.values():
+            dino.skip_run(frames)
+        self.score += frames
+        self.clock.tick(frames)
+        return frames
+
+    def _skip_dirt(self, dirt, moves):
+        # NOTE: Dirt wraps back round to the right of the window each time it passes the left.
+        start = 0
+        while True:
+            wrap = int(np.searchsorted(moves, dirt.get_image_pos_x() + start, side="right"))
+            if wrap >= len(moves):
+                dirt.skip(len(moves), int(moves[-1]) - start)
+                return
+            dirt.set_x(self.win_width + 10)
+            start = int(moves[wrap])
 
     def dino_jump(self, dinoIndex):
-        self.dinos[dinoIndex].jump()
+        self.jump_requests[dinoIndex] = True
 
     def dino_duck(self, dinoIndex):
-        self.dinos[dinoIndex].duck()
+        self.duck_requests[dinoIndex] = True
 
-    def update_dino(self, dinoIndex):
-        self.dinos[dinoIndex].update()
+    def _detach_dino(self, dinoIndex):
+        dino = copy.copy(self.dinos[dinoIndex])
+        self.dinos[dinoIndex] = dino
+        return dino
 
-    def dino_object_collision(self, dinoIndex):
-        for obstacle in self.obstacles:
-
-            dino = self.dinos[dinoIndex]
+    def _apply_dino_requests(self, dino, dinoIndex):
+        if self.jump_requests[dinoIndex]:
+            dino.jump()
+            self.jump_requests[dinoIndex] = False
+        if self.duck_requests[dinoIndex]:
+            dino.duck()
+            self.duck_requests[dinoIndex] = False
 
-            if mechanics.collision(
+    def update_dino(self, dinoIndex):
+        dino = self._detach_dino(dinoIndex)
+        self._apply_dino_requests(dino, dinoIndex)
+        dino.update()
+
+    def update_dinos(self, dinoIds):
+        """
+        Updates every dino in dinoIds, applying the actions requested for each.
+
+        Dinos sharing a state are only split up when their requested actions differ, and dinos
+        left in the same state afterwards are joined up again. Dinos not in dinoIds mustn't share
+        a state with those in it.
+        """
+        groups = {}
+        for dinoId in dinoIds:
+            key = (
+                id(self.dinos[dinoId]),
+                self.jump_requests[dinoId],
+                self.duck_requests[dinoId],
+            )
+            group = groups.get(key)
+            if group is None:
+                group = []
+                groups[key] = group
+            group.append(dinoId)
+
+        # NOTE: Groups are split off before any are updated, so each copy starts from the state
+        # the group had this frame.
+        claimed = set()
+        group_dinos = []
+        for group in groups.values():
+            dino = self.dinos[group[0]]
+            if id(dino) in claimed:
+                dino = copy.copy(dino)
+            claimed.add(id(dino))
+            group_dinos.append(dino)
+
+        states = {}
+        for group, dino in zip(groups.values(), group_dinos):
+            for dinoId in group:
+                self._apply_dino_requests(dino, dinoId)
+            dino.update()
+
+            dino = states.setdefault(dino.get_state(), dino)
+            for dinoId in group:
+                self.dinos[dinoId] = dino
+
+    def _collisions(self, image, pos_x, pos_ys):
+        hits = np.zeros(len(pos_ys), dtype=bool)
+        for obstacle in self.obstacles:
+            hits |= mechanics.collisions(
                 obstacle.get_image(),
                 obstacle.get_image_pos_x(),
                 obstacle.get_image_pos_y(),
-                dino.get_image(),
-                dino.get_image_pos_x(),
-                dino.get_image_pos_y(),
-            ):
-                dino.set_dead()
-                return True
-        return False
-
-    def draw_game(self):
-        self.render.set_background_white()
-        self.render.display_floor()
-        self.render.display_score(self.score)
-        for dino in self.dinos:
-            if dino.is_dead():
-                continue
-            self.render.draw_img(
-                dino.get_image(), dino.get_image_pos_x(), dino.get_image_pos_y()
-            )
-        for dirt in self.floor_dirt:
-            self.render.draw_circle(
-                dirt.get_radius(), dirt.get_image_pos_x(), dirt.get_image_pos_y()
-            )
-        for obst in self.obstacles:
-            self.render.draw_img(
-                obst.get_image(), obst.get_image_pos_x(), obst.get_image_pos_y()
+                image,
+                pos_x,
+                pos_ys,
             )
+        return hits
+
+    def _dino_collides(self, dino):
+        return bool(
+            self._collisions(
+                dino.get_image(), dino.get_image_pos_x(), [dino.get_image_pos_y()]
+            )[0]
+        )
+
+    def dino_object_collision(self, dinoIndex):
+        if not self._dino_collides(self.dinos[dinoIndex]):
+            return False
+
+        self.kill_dino(dinoIndex)
+        return True
+
+    def dino_object_collisions(self, dinoIds):
+        """
+        Returns the dinos in dinoIds colliding with an obstacle, which are set as dead.
+
+        Dinos are grouped by pose (image and x position), so each obstacle is tested against the
+        heights of a whole group at once.
+        """
+        poses = {}
+        for dinoId in dinoIds:
+            dino = self.dinos[dinoId]
+            states = poses.setdefault((dino.get_image(), dino.get_image_pos_x()), {})
+            states[id(dino)] = dino
+
+        collided_states = set()
+        for (image, pos_x), states in poses.items():
+            dinos = list(states.values())
+            hits = self._collisions(image, pos_x, [dino.get_image_pos_y() for dino in dinos])
+            for dino, hit in zip(dinos, hits):
+                if hit:
+                    dino.set_dead()
+                    collided_states.add(id(dino))
+
+        return [dinoId for dinoId in dinoIds if id(self.dinos[dinoId]) in collided_states]
+
+    def kill_dino(self, dinoIndex):
+        self._detach_dino(dinoIndex).set_dead()
+
+    def get_snapshot(self, dinoIds=None):
+        """
+        Returns what is to be drawn this frame, which is left unchanged by the game carrying on.
+
+        dinoIds, if given, holds every dino still alive, so dead dinos aren't looked at.
+        """
+        if dinoIds is None:
+            dinoIds = range(len(self.dinos))
+
+        # NOTE: Dinos sharing a state, or just a sprite and position, only need drawing once.
+        dino_states = {
+            id(self.dinos[dinoId]): self.dinos[dinoId] for dinoId in dinoIds
+        }.values()
+        dinos = dict.fromkeys(
+            (dino.get_image(), dino.get_image_pos_x(), dino.get_image_pos_y())
+            for dino in dino_states
+            if not dino.is_dead()
+        )
+
+        return FrameSnapshot(
+            self.score,
+            tuple(dinos),
+            tuple(
+                (dirt.get_radius(), dirt.get_image_pos_x(), dirt.get_image_pos_y())
+                for dirt in self.floor_dirt
+            ),
+            tuple(
+                (obst.get_image(), obst.get_image_pos_x(), obst.get_image_pos_y())
+                for obst in self.obstacles
+            ),
+        )
+
+    def draw_game(self, dinoIds=None):
+        self.render.draw_snapshot(self.get_snapshot(dinoIds))
 
     def get_renderer(self):
         return self.render
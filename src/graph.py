@@ -7,15 +7,22 @@ import graphviz
 import matplotlib.pyplot as plt
 import numpy as np
 
+import src.statistics_log as statistics_log
+
 
 def plot_stats(statistics, ylog=False, view=False, filename="avg_fitness.svg"):
-    """Plots the population's average and best fitness."""
+    """Plots the population's average and best fitness.
+
+    statistics may also be the path of a log written by statistics_log.StatisticsLogReporter."""
     if plt is None:
         warnings.warn(
             "This display is not available due to a missing optional dependency (matplotlib)"
         )
         return
 
+    if isinstance(statistics, str):
+        statistics = statistics_log.StatisticsLog(statistics)
+
     generation = range(len(statistics.most_fit_genomes))
     best_fitness = [c.fitness for c in statistics.most_fit_genomes]
     avg_fitness = np.array(statistics.get_fitness_mean())
@@ -91,13 +98,18 @@ def plot_spikes(spikes, view=False, filename=None, title=None):
 
 
 def plot_species(statistics, view=False, filename="speciation.svg"):
-    """Visualizes speciation throughout evolution."""
+    """Visualizes speciation throughout evolution.
+
+    statistics may also be the path of a log written by statistics_log.StatisticsLogReporter."""
     if plt is None:
         warnings.warn(
             "This display is not available due to a missing optional dependency (matplotlib)"
         )
         return
 
+    if isinstance(statistics, str):
+        statistics = statistics_log.StatisticsLog(statistics)
+
     species_sizes = statistics.get_species_sizes()
     num_generations = len(species_sizes)
     curves = np.array(species_sizes).T
@@ -0,0 +1,149 @@
+import neat
+
+import copy
+import os
+import pickle
+import time
+import warnings
+
+MIGRATION_POLL_INTERVAL = 0.1
+MIGRATION_TIMEOUT = 600
+
+
+def island_path(path, island):
+    """
+    Returns the per-island variant of a file path, e.g. statistics.csv -> statistics_island_2.csv.
+    """
+    root, ext = os.path.splitext(path)
+    return "{}_island_{}{}".format(root, island, ext)
+
+
+def source_island(island, num_islands):
+    # NOTE: Islands form a ring, each receiving migrants from the one before it.
+    return (island - 1) % num_islands
+
+
+class MigrationDirectory:
+    """
+    Exchanges migrant genomes between islands through files in a shared directory.
+
+    Any directory every island can reach will do, so islands can be spread over several hosts by
+    pointing them all at a shared filesystem. Files are written under a temporary name and then
+    renamed, so a reader never sees a partly written file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def _migrants_path(self, island, generation):
+        return os.path.join(self.path, "island_{}_gen_{:04d}.pkl".format(island, generation))
+
+    def _winner_path(self, island):
+        return os.path.join(self.path, "island_{}_winner.pkl".format(island))
+
+    def _write(self, path, data):
+        temp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(temp_path, "wb") as data_file:
+            pickle.dump(data, data_file)
+        os.replace(temp_path, path)
+
+    def _read(self, path):
+        with open(path, "rb") as data_file:
+            return pickle.load(data_file)
+
+    def clear(self, island):
+        """
+        Removes files left by an earlier run of the island.
+        """
+        prefix = "island_{}_".format(island)
+        for name in os.listdir(self.path):
+            if name.startswith(prefix):
+                os.remove(os.path.join(self.path, name))
+
+    def send(self, island, generation, genomes):
+        self._write(self._migrants_path(island, generation), genomes)
+
+    def receive(self, island, generation, timeout=MIGRATION_TIMEOUT):
+        """
+        Waits for the migrants island sends at generation, returning None if the island finishes
+        (or timeout seconds pass) without sending any.
+        """
+        path = self._migrants_path(island, generation)
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(path):
+            if self.finished(island) or time.monotonic() > deadline:
+                return None
+            time.sleep(MIGRATION_POLL_INTERVAL)
+        return self._read(path)
+
+    def finish(self, island, winner):
+        self._write(self._winner_path(island), winner)
+
+    def finished(self, island):
+        return os.path.exists(self._winner_path(island))
+
+    def load_winner(self, island):
+        if not self.finished(island):
+            return None
+        return self._read(self._winner_path(island))
+
+
+class MigrationReporter(neat.reporting.BaseReporter):
+    """
+    Swaps genomes between islands every migration_interval generations.
+
+    The fittest num_migrants genomes of the generation are sent on, and the migrants received
+    take the place of the newest offspring in the next generation, which is then speciated again.
+    """
+
+    def __init__(
+        self, population, exchange, island, num_islands, migration_interval, num_migrants
+    ):
+        self.population = population
+        self.exchange = exchange
+        self.island = island
+        self.num_islands = num_islands
+        self.migration_interval = migration_interval
+        self.num_migrants = num_migrants
+        self.generation = 0
+        self.emigrants = []
+
+    def is_migration_generation(self):
+        return (self.generation + 1) % self.migration_interval == 0
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        if not self.is_migration_generation():
+            return
+
+        fittest = sorted(population.values(), key=lambda genome: genome.fitness, reverse=True)
+        self.emigrants = [copy.deepcopy(genome) for genome in fittest[: self.num_migrants]]
+
+    def end_generation(self, config, population, species_set):
+        if not self.is_migration_generation():
+            return
+
+        self.exchange.send(self.island, self.generation, self.emigrants)
+        source = source_island(self.island, self.num_islands)
+        immigrants = self.exchange.receive(source, self.generation)
+        if immigrants is None:
+            warnings.warn(
+                "No migrants received from island {} at generation {}".format(
+                    source, self.generation
+                )
+            )
+            return
+
+        immigrants = immigrants[: len(population)]
+        reproduction = self.population.reproduction
+        for old_key, genome in zip(list(population)[-len(immigrants) :], immigrants):
+            del population[old_key]
+            genome.key = next(reproduction.genome_indexer)
+            genome.fitness = None
+            population[genome.key] = genome
+            reproduction.ancestors[genome.key] = tuple()
+
+        species_set.speciate(config, population, self.generation)
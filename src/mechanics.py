@@ -1,13 +1,192 @@
-import pygame
+import numpy as np
+
+HITBOX_BAND_HEIGHT = 8
+
+_collision_shapes = {}
+_collision_tables = {}
+
+
+class CollisionShape:
+    """
+    A sprite's pixel mask together with two rectangle approximations of it.
+
+    The image is split into horizontal bands, each contributing an outer rectangle covering every
+    set pixel within the band, and an inner rectangle (where one exists) holding only set pixels.
+    Outer rectangles that don't overlap prove there is no collision, and inner rectangles that do
+    overlap prove there is one, so the mask only needs testing around the sprite edges.
+
+    Rectangles are stored as (left, top, right, bottom) rows, with right and bottom exclusive.
+    """
+
+    def __init__(self, mask, band_height=HITBOX_BAND_HEIGHT):
+        self.mask = mask
+        outer = []
+        inner = []
+
+        height = mask.shape[0]
+        for band_top in range(0, height, band_height):
+            band = mask[band_top : band_top + band_height]
+            set_rows = band.any(axis=1).nonzero()[0]
+            if not len(set_rows):
+                continue
+
+            set_cols = band.any(axis=0).nonzero()[0]
+            outer.append(
+                (
+                    int(set_cols[0]),
+                    band_top + int(set_rows[0]),
+                    int(set_cols[-1]) + 1,
+                    band_top + int(set_rows[-1]) + 1,
+                )
+            )
+
+            all_set = band.all(axis=0).tolist() + [False]
+            run_start, best_start, best_width = 0, 0, 0
+            for c, is_set in enumerate(all_set):
+                if is_set:
+                    continue
+                if c - run_start > best_width:
+                    best_start, best_width = run_start, c - run_start
+                run_start = c + 1
+
+            if best_width:
+                inner.append(
+                    (best_start, band_top, best_start + best_width, band_top + len(band))
+                )
+
+        self.outer = np.array(outer, dtype=np.int64).reshape(-1, 4)
+        self.inner = np.array(inner, dtype=np.int64).reshape(-1, 4)
+        self.bounds = (
+            tuple(int(v) for v in self.outer[:, :2].min(axis=0))
+            + tuple(int(v) for v in self.outer[:, 2:].max(axis=0))
+            if len(outer)
+            else (0, 0, 0, 0)
+        )
 
 
 def get_pixel_locations(image):
-    return pygame.mask.from_surface(image)
+    return image.mask
+
+
+def get_collision_shape(image):
+    shape = _collision_shapes.get(image)
+    if shape is None:
+        shape = CollisionShape(get_pixel_locations(image))
+        _collision_shapes[image] = shape
+    return shape
+
+
+def _bounds_overlap(bounds1, bounds2, offset):
+    dx, dy = offset
+    return (
+        max(bounds1[0], bounds2[0] + dx) < min(bounds1[2], bounds2[2] + dx)
+        and max(bounds1[1], bounds2[1] + dy) < min(bounds1[3], bounds2[3] + dy)
+    )
+
+
+def _first_rect_overlap(rects1, rects2, offset):
+    dx, dy = offset
+    moved = rects2 + (dx, dy, dx, dy)
+    left = np.maximum(rects1[:, None, 0], moved[None, :, 0])
+    top = np.maximum(rects1[:, None, 1], moved[None, :, 1])
+    overlapping = (left < np.minimum(rects1[:, None, 2], moved[None, :, 2])) & (
+        top < np.minimum(rects1[:, None, 3], moved[None, :, 3])
+    )
+    if not overlapping.any():
+        return None
 
+    index = np.unravel_index(overlapping.argmax(), overlapping.shape)
+    return int(left[index]), int(top[index])
 
-def collision(img1, x1, y1, img2, x2, y2):
-    mask1 = get_pixel_locations(img1)
-    mask2 = get_pixel_locations(img2)
+
+def mask_overlap(mask1, mask2, offset):
+    """
+    Returns a point (in mask1 coordinates) set in both masks, with mask2 placed at offset
+    relative to mask1, or None if the masks don't overlap.
+    """
+    dx, dy = offset
+    height1, width1 = mask1.shape
+    height2, width2 = mask2.shape
+
+    left, right = max(0, dx), min(width1, dx + width2)
+    top, bottom = max(0, dy), min(height1, dy + height2)
+    if left >= right or top >= bottom:
+        return None
+
+    both = (
+        mask1[top:bottom, left:right]
+        & mask2[top - dy : bottom - dy, left - dx : right - dx]
+    )
+    if not both.any():
+        return None
+
+    row, col = divmod(int(both.argmax()), right - left)
+    return left + col, top + row
+
+
+def collision(img1, x1, y1, img2, x2, y2, exact=False):
+    shape1 = get_collision_shape(img1)
+    shape2 = get_collision_shape(img2)
     offset = (round(x2 - x1), round(y2 - y1))
 
-    return mask1.overlap(mask2, offset)
+    if exact:
+        return mask_overlap(shape1.mask, shape2.mask, offset)
+
+    if not _bounds_overlap(shape1.bounds, shape2.bounds, offset):
+        return None
+
+    if _first_rect_overlap(shape1.outer, shape2.outer, offset) is None:
+        return None
+
+    point = _first_rect_overlap(shape1.inner, shape2.inner, offset)
+    if point is not None:
+        return point
+
+    return mask_overlap(shape1.mask, shape2.mask, offset)
+
+
+def get_collision_table(img1, img2, dx):
+    """
+    Returns whether the masks of img1 and img2 overlap, with img2 placed dx pixels to the right
+    of img1, for every vertical offset of img2 at which they could, from -(img2 height - 1) up
+    to img1 height - 1.
+
+    Rows of both masks are packed into bit arrays, so every pair of rows is compared at once.
+    """
+    key = (img1, img2, dx)
+    table = _collision_tables.get(key)
+    if table is None:
+        mask1 = get_pixel_locations(img1)
+        mask2 = get_pixel_locations(img2)
+        height1, width1 = mask1.shape
+        height2, width2 = mask2.shape
+
+        table = np.zeros(height1 + height2 - 1, dtype=bool)
+        left, right = max(0, dx), min(width1, dx + width2)
+        if left < right:
+            rows1 = np.packbits(mask1[:, left:right], axis=1)
+            rows2 = np.packbits(mask2[:, left - dx : right - dx], axis=1)
+            overlapping = (rows1[:, None, :] & rows2[None, :, :]).any(axis=2)
+            row1, row2 = overlapping.nonzero()
+            table[row1 - row2 + height2 - 1] = True
+
+        _collision_tables[key] = table
+    return table
+
+
+def collisions(img1, x1, y1, img2, x2, y2s):
+    """
+    Returns whether img1 at (x1, y1) collides with img2 at x2 and each of the heights in y2s,
+    giving the same results as collision for each height.
+    """
+    hits = np.zeros(len(y2s), dtype=bool)
+    height2, width2 = get_pixel_locations(img2).shape
+    dx = round(x2 - x1)
+    if not -width2 < dx < get_pixel_locations(img1).shape[1]:
+        return hits
+
+    table = get_collision_table(img1, img2, dx)
+    index = np.round(np.asarray(y2s, dtype=float) - y1).astype(np.int64) + height2 - 1
+    in_table = (index >= 0) & (index < len(table))
+    hits[in_table] = table[index[in_table]]
+    return hits
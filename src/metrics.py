@@ -0,0 +1,144 @@
+import neat
+
+import os
+import sys
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_HOST = "127.0.0.1"
+METRIC_PREFIX = "dinojump_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# NOTE: Every metric served, with its help text, in the order they're listed.
+DESCRIPTIONS = {
+    "generation": "Generation being evaluated.",
+    "best_fitness": "Fitness of the best genome of the last generation evaluated.",
+    "mean_fitness": "Mean fitness of the last generation evaluated.",
+    "evaluation_seconds": "Time spent playing the last generation's courses.",
+    "reproduction_seconds": "Time spent reproducing and speciating after the last evaluation.",
+    "dino_frames_per_second": "Dino frames played per second over the last evaluation.",
+    "network_queries_per_second": "Network queries made per second over the last evaluation.",
+    "alive_dinos": "Dinos alive on the course being played in the training process.",
+    "resident_memory_bytes": "Current resident memory of the training process.",
+    "max_resident_memory_bytes": "Peak resident memory of the training process.",
+}
+
+STATM_PATH = "/proc/self/statm"
+
+
+def get_resident_memory():
+    """
+    Returns the current resident memory of this process in bytes, or None where it can't be read.
+    """
+    try:
+        with open(STATM_PATH) as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def get_max_resident_memory():
+    """
+    Returns the peak resident memory of this process in bytes, or None where it can't be read.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # NOTE: macOS reports bytes, other platforms kilobytes.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def format_metrics(values):
+    """
+    Formats {name: value} as plain-text metrics, leaving out any that aren't known yet.
+    """
+    lines = []
+    for name, description in DESCRIPTIONS.items():
+        value = values.get(name)
+        if value is None:
+            continue
+        lines.append("# HELP {}{} {}".format(METRIC_PREFIX, name, description))
+        lines.append("# TYPE {}{} gauge".format(METRIC_PREFIX, name))
+        lines.append("{}{} {!r}".format(METRIC_PREFIX, name, value))
+    return "\n".join(lines) + "\n"
+
+
+class MetricsReporter(neat.reporting.BaseReporter):
+    """
+    Keeps the metrics of the latest generation, timing each phase of it.
+
+    profile is the dict of the generation's work counters (see statistics_log.PROFILE_FIELDS).
+    Values are only written at generation boundaries, so the training loop never waits on a
+    scrape.
+    """
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.values = {}
+        self.phase_start = time.perf_counter()
+
+    def start_generation(self, generation):
+        self.values["generation"] = generation
+        self.phase_start = time.perf_counter()
+
+    def post_evaluate(self, config, population, species, best_genome):
+        now = time.perf_counter()
+        seconds = max(now - self.phase_start, 1e-9)
+        fitnesses = [genome.fitness for genome in population.values()]
+        self.values.update(
+            best_fitness=best_genome.fitness,
+            mean_fitness=sum(fitnesses) / len(fitnesses),
+            evaluation_seconds=seconds,
+            dino_frames_per_second=self.profile.get("dino_frames", 0) / seconds,
+            network_queries_per_second=self.profile.get("network_queries", 0) / seconds,
+        )
+        self.phase_start = now
+
+    def end_generation(self, config, population, species_set):
+        self.values["reproduction_seconds"] = time.perf_counter() - self.phase_start
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+
+        body = format_metrics(self.server.collect()).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsServer:
+    """
+    Serves plain-text metrics over HTTP from a background thread.
+
+    collect is called on every request, from the server thread, and returns {name: value} for
+    the metrics in DESCRIPTIONS. Only localhost is listened on by default, and port 0 picks a
+    free port, given by the port attribute.
+    """
+
+    def __init__(self, collect, port, host=DEFAULT_HOST):
+        self.server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        self.server.daemon_threads = True
+        self.server.collect = collect
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
@@ -0,0 +1,88 @@
+import neat
+
+from collections import OrderedDict
+from neat.graphs import feed_forward_layers
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+def topology_key(genome, config):
+    """
+    Everything deciding which nodes a genome's network evaluates, and in what order.
+    """
+    return (
+        tuple(config.genome_config.input_keys),
+        tuple(config.genome_config.output_keys),
+        frozenset(cg.key for cg in genome.connections.values() if cg.enabled),
+    )
+
+
+class NetworkCache:
+    """
+    Least recently used store of compiled network topologies, building feed forward networks.
+
+    Working out a network's layers is what makes neat.nn.FeedForwardNetwork.create slow, but
+    most offspring share a topology with their parent, only their weights and biases differing.
+    The evaluation order of each topology is kept, so a genome with a known topology only needs
+    its genes filled in.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        if max_entries <= 0:
+            raise ValueError("Cache must hold at least one entry")
+
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_evaluation_order(self, genome, config):
+        key = topology_key(genome, config)
+        order = self.entries.get(key)
+        if order is None:
+            self.misses += 1
+            layers = feed_forward_layers(
+                config.genome_config.input_keys, config.genome_config.output_keys, key[2]
+            )
+            order = [node for layer in layers for node in layer]
+            self.entries[key] = order
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return order
+
+    def create(self, genome, config):
+        """
+        Returns the same network as neat.nn.FeedForwardNetwork.create(genome, config).
+        """
+        genome_config = config.genome_config
+        order = self._get_evaluation_order(genome, config)
+
+        # NOTE: Each node's inputs keep the order of the genome's connections, as neat's do, so
+        # they're summed in the same order.
+        links = {node: [] for node in order}
+        for cg in genome.connections.values():
+            if cg.enabled and cg.key[1] in links:
+                links[cg.key[1]].append((cg.key[0], cg.weight))
+
+        node_evals = []
+        for node in order:
+            ng = genome.nodes[node]
+            node_evals.append(
+                (
+                    node,
+                    genome_config.activation_defs.get(ng.activation),
+                    genome_config.aggregation_function_defs.get(ng.aggregation),
+                    ng.bias,
+                    ng.response,
+                    links[node],
+                )
+            )
+        return neat.nn.FeedForwardNetwork(
+            genome_config.input_keys, genome_config.output_keys, node_evals
+        )
+
+    def __len__(self):
+        return len(self.entries)
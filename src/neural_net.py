@@ -1,25 +1,66 @@
 import neat
-import src.graph as graph
 import src.game as game
+import src.replay as replay
+import src.fitness_cache as fitness_cache
+import src.fitness_measures as fitness_measures
+import src.network_cache as network_cache
+import src.plot_worker as plot_worker
+import src.statistics_log as statistics_log
+import src.speciation as speciation
+import src.sensors as sensors
+import src.islands as islands
+import src.course as course
+import src.shared_arrays as shared_arrays
+import src.render_thread as render_thread
+import src.metrics as metrics
+
+import os
+import random
+import multiprocessing
+import numpy as np
 
 WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 400
+FRAME_RATE = 30
+START_SPEED = 15
+FAST_FORWARD_FRAMES = 500
+
+OUTPUT_NAMES = {
+    0: "Jump",
+    1: "Duck",
+}
 
 generation = 0
+headless = False
+replay_dir = None
+course_seed = None
+evaluation_cache = None
+num_courses = 1
+fitness_aggregate = "mean"
+fitness_quantile = 0.25
+fitness_measure = fitness_measures.DEFAULT_MEASURE
+course_pool = None
+decision_interval = 1
+decision_window = None
+fast_forward_distance = None
+threaded_render = False
+render_pipeline = None
+
+# NOTE: The headless and visual games last played, keyed by whether they are drawn.
+games = {}
+
+# NOTE: Compiled network topologies, shared by every course this process plays.
+compiled_networks = network_cache.NetworkCache()
+
+# NOTE: Work done evaluating the current generation, logged with its statistics.
+profile = dict.fromkeys(statistics_log.PROFILE_FIELDS, 0)
+
+# NOTE: Progress through the course being played in this process, read by the metrics server.
+status = {"alive_dinos": 0}
 
 
 def calculate_output_neuron(net, inputNeurons):
-    return net.activate(
-        (
-            inputNeurons[0],
-            inputNeurons[1],
-            inputNeurons[2],
-            inputNeurons[3],
-            inputNeurons[4],
-            inputNeurons[5],
-            inputNeurons[6],
-        )
-    )
+    return net.activate(inputNeurons)
 
 
 def is_above_trigger_threshold(neuron):
@@ -27,97 +68,399 @@ def is_above_trigger_threshold(neuron):
 
 
 def generate_neural_network(genome, config):
-    return neat.nn.FeedForwardNetwork.create(genome, config)
+    return compiled_networks.create(genome, config)
 
 
-def fitness_function(population, config):
+def create_replay_recorder(numDinos, seed):
+    if replay_dir is None:
+        return None
 
-    global generation
-    generation += 1
-
-    dinoAI = game.Game(len(population), WINDOW_WIDTH, WINDOW_HEIGHT)
+    header = replay.ReplayHeader(
+        seed,
+        numDinos,
+        generation,
+        WINDOW_WIDTH,
+        WINDOW_HEIGHT,
+        FRAME_RATE,
+        START_SPEED,
+    )
+    path = os.path.join(replay_dir, "generation_{:04d}.djr".format(generation))
+    return replay.ReplayRecorder(path, header)
+
+
+def get_game(numDinos, seed, visual, on_obstacle_spawn=None, schedule=None):
+    """
+    Returns a game ready to play, resetting the one this process last played where possible.
+    """
+    dinoAI = games.get(visual)
+    if dinoAI is None:
+        dinoAI = game.Game(
+            numDinos,
+            WINDOW_WIDTH,
+            WINDOW_HEIGHT,
+            frame_rate=FRAME_RATE,
+            start_speed=START_SPEED,
+            seed=seed,
+            on_obstacle_spawn=on_obstacle_spawn,
+            headless=not visual,
+            schedule=schedule,
+        )
+        games[visual] = dinoAI
+    else:
+        dinoAI.reset(numDinos, seed, on_obstacle_spawn, schedule)
+    return dinoAI
+
+
+def is_decision_frame(frame, interval):
+    return (frame - 1) % interval == 0
+
+
+def play_course(
+    genomes,
+    config,
+    seed,
+    visual=False,
+    recorder=None,
+    schedule=None,
+    interval=1,
+    window=None,
+    pipeline=None,
+    max_frames=None,
+    measure=fitness_measures.survival,
+    fast_forward=None,
+):
+    """
+    Plays every genome on the course generated from seed, returning their fitness values.
+
+    schedule, if given, holds the course's precomputed obstacles. Networks are only queried every
+    interval frames, holding their last action in between, unless window is given and the next
+    obstacle is within window pixels of the dino. pipeline, if given, is a RenderThread each frame
+    is published to, in place of drawing the game in this thread. The course ends after
+    max_frames frames, if given, even if dinos are left alive.
+
+    Only the frame each dino dies on (and what it had done by then) is recorded while playing,
+    with measure turning the resulting CourseResult into fitness values once the course ends.
+
+    fast_forward, if given, skips frames at once while every dino runs on the ground without
+    acting and the next obstacle is more than fast_forward pixels away. Networks aren't queried
+    over skipped frames, so their dinos are taken not to act there. As frames are only skipped
+    while no alive dino is acting, a dino's run then depends on the others played alongside it.
+    Frames are never skipped while the course is drawn, published or recorded.
+    """
+
+    dinoAI = get_game(
+        len(genomes),
+        seed,
+        visual,
+        recorder.record_spawn if recorder else None,
+        schedule,
+    )
 
+    dinoSensors = config.genome_config.sensors
     nets: list[neat.nn.FeedForwardNetwork] = []
-    genomes = []
-    dinoAliveIndex = list(range(0, len(population)))
+    deathFrames = np.zeros(len(genomes), dtype=np.int64)
+    died = np.zeros(len(genomes), dtype=bool)
+    obstaclesCleared = np.zeros(len(genomes), dtype=np.int64)
+    jumpFrames = [0] * len(genomes)
+    dinoAliveIndex = list(range(0, len(genomes)))
+    heldActions = [0] * len(genomes)
+    frame = 0
+    skipping = (
+        fast_forward is not None and not visual and recorder is None and pipeline is None
+    )
 
-    for genome_id, genome in population:
+    compiled = compiled_networks.misses
+    for genome in genomes:
         nets.append(generate_neural_network(genome, config))
-        genome.fitness = 0
-        genomes.append(genome)
+    profile["networks_compiled"] += compiled_networks.misses - compiled
+
+    while len(dinoAliveIndex) > 0 and (max_frames is None or frame < max_frames):
+
+        if skipping and not any(heldActions[dinoId] for dinoId in dinoAliveIndex):
+            # NOTE: At least one frame is always left to step, which spawns new obstacles.
+            skipLimit = FAST_FORWARD_FRAMES
+            if max_frames is not None:
+                skipLimit = min(skipLimit, max_frames - frame - 1)
+            skipped = dinoAI.fast_forward(dinoAliveIndex, skipLimit, fast_forward)
+            frame += skipped
+            profile["dino_frames"] += skipped * len(dinoAliveIndex)
 
-    while len(dinoAliveIndex) > 0:
+        frame += 1
+        if recorder:
+            recorder.set_frame(frame)
 
-        dinoAI.restrict_game_loop_speed()
+        if visual:
+            dinoAI.restrict_game_loop_speed()
         dinoAI.increment_game_speed()
         dinoAI.update_environment()
 
         if dinoAI.window_closed():
             dinoAI.quit_game()
 
+        actions = []
+        dinoAI.update_dinos(dinoAliveIndex)
+        profile["dino_frames"] += len(dinoAliveIndex)
+
+        queried = dinoAliveIndex
+        if not is_decision_frame(frame, interval):
+            queried = []
+            if window is not None:
+                distances = dinoAI.get_next_obstacle_distances(dinoAliveIndex)
+                queried = [
+                    dinoId
+                    for dinoId, distance in zip(dinoAliveIndex, distances)
+                    if distance <= window
+                ]
+
+        if queried:
+            profile["network_queries"] += len(queried)
+            observations = dinoSensors.observe(dinoAI, queried).tolist()
+            for dinoId, inputNeurons in zip(queried, observations):
+                outputNeurons = calculate_output_neuron(nets[dinoId], inputNeurons)
+                heldActions[dinoId] = 0
+                if is_above_trigger_threshold(outputNeurons[0]):
+                    heldActions[dinoId] |= replay.JUMP_BIT
+                if is_above_trigger_threshold(outputNeurons[1]):
+                    heldActions[dinoId] |= replay.DUCK_BIT
+
         for dinoId in dinoAliveIndex:
-            dinoAI.update_dino(dinoId)
-            genomes[dinoId].fitness += 0.1
-
-            nextObstacle = dinoAI.get_next_obstacle_info(dinoId)
-            dinoElevation = dinoAI.get_dino_elevation(dinoId)
-            dinoSpeed = dinoAI.get_game_speed()
-
-            inputNerons = [
-                nextObstacle.distance,
-                nextObstacle.height,
-                nextObstacle.width,
-                nextObstacle.elevation,
-                dinoSpeed,
-                dinoElevation,
-                nextObstacle.distance,
-            ]
-
-            outputNeurons = calculate_output_neuron(nets[dinoId], inputNerons)
-            if is_above_trigger_threshold(outputNeurons[0]):
+            action = heldActions[dinoId]
+            if action & replay.JUMP_BIT:
                 dinoAI.dino_jump(dinoId)
-            if is_above_trigger_threshold(outputNeurons[1]):
+                jumpFrames[dinoId] += 1
+            if action & replay.DUCK_BIT:
                 dinoAI.dino_duck(dinoId)
-
-            if dinoAI.dino_object_collision(dinoId):
-                genomes[dinoId].fitness -= 1
-                dinoAliveIndex.remove(dinoId)
+            actions.append(action)
+
+        deaths = dinoAI.dino_object_collisions(dinoAliveIndex)
+        if deaths:
+            deathFrames[deaths] = frame
+            died[deaths] = True
+            obstaclesCleared[deaths] = dinoAI.obstacles_cleared
+        for dinoId in deaths:
+            dinoAliveIndex.remove(dinoId)
+        status["alive_dinos"] = len(dinoAliveIndex)
+
+        if recorder:
+            recorder.record_actions(actions)
+            for dinoId in deaths:
+                recorder.record_death(dinoId)
 
         dinoAI.increment_score()
-        dinoAI.draw_game()
+        if pipeline is not None and pipeline.wants_frame():
+            pipeline.publish(dinoAI.get_snapshot(dinoAliveIndex), generation)
+        if not visual:
+            continue
+        dinoAI.draw_game(dinoAliveIndex)
         dinoAI.get_renderer().display_generation(generation)
         dinoAI.get_renderer().update_display()
 
+    if recorder:
+        recorder.close()
+
+    deathFrames[dinoAliveIndex] = frame
+    obstaclesCleared[dinoAliveIndex] = dinoAI.obstacles_cleared
+    result = fitness_measures.CourseResult(
+        deathFrames, died, obstaclesCleared, np.array(jumpFrames, dtype=np.int64)
+    )
+    return measure(result).tolist()
+
+
+def _play_course_worker(args):
+    (
+        genomes,
+        config,
+        seed,
+        schedules_handle,
+        schedule_index,
+        interval,
+        window,
+        measure,
+        skip_distance,
+    ) = args
+
+    for field in profile:
+        profile[field] = 0
+
+    schedules = shared_arrays.SharedArrays.attach(schedules_handle)
+    try:
+        schedule = course.get_shared_schedule(schedules, schedule_index)
+        fitnesses = play_course(
+            genomes,
+            config,
+            seed,
+            schedule=schedule,
+            interval=interval,
+            window=window,
+            measure=measure,
+            fast_forward=skip_distance,
+        )
+        # NOTE: The game is kept for the next course, so it mustn't go on pointing into the
+        # shared block once that's closed.
+        games[False].schedule = None
+        del schedule
+    finally:
+        schedules.close()
+    return fitnesses, dict(profile)
+
+
+def get_course_seeds():
+    if course_seed is not None:
+        return [(course_seed + course) % 2**32 for course in range(num_courses)]
+    return [random.getrandbits(32) for _ in range(num_courses)]
+
+
+def aggregate_fitness(values, method="mean", quantile=0.25):
+    if method == "mean":
+        return sum(values) / len(values)
+    if method == "min":
+        return min(values)
+    if method == "quantile":
+        if not 0 <= quantile <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+
+        ordered = sorted(values)
+        position = quantile * (len(ordered) - 1)
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    raise ValueError("Unknown fitness aggregate '{}'".format(method))
+
+
+def play_courses(genomes, config, seeds):
+    """
+    Plays every genome on each course, returning a list of per-course fitness values per genome.
+
+    The first course is played in this process, so it can be watched and recorded, while the
+    remaining courses are played at the same time by the course worker pool.
+    """
+
+    pending = None
+    schedules = None
+    if len(seeds) > 1:
+        # NOTE: Each worker maps the courses' obstacles from shared memory, so the work sent to
+        # the pool doesn't grow with the courses.
+        schedules = course.publish_schedules(
+            [course.generate_schedule(seed, WINDOW_WIDTH, WINDOW_HEIGHT) for seed in seeds[1:]]
+        )
+        pending = course_pool.map_async(
+            _play_course_worker,
+            [
+                (
+                    genomes,
+                    config,
+                    seed,
+                    schedules.handle,
+                    index,
+                    decision_interval,
+                    decision_window,
+                    fitness_measures.get_measure(fitness_measure),
+                    fast_forward_distance,
+                )
+                for index, seed in enumerate(seeds[1:])
+            ],
+        )
+
+    try:
+        results = [
+            play_course(
+                genomes,
+                config,
+                seeds[0],
+                visual=not headless and render_pipeline is None,
+                recorder=create_replay_recorder(len(genomes), seeds[0]),
+                interval=decision_interval,
+                window=decision_window,
+                pipeline=render_pipeline,
+                measure=fitness_measures.get_measure(fitness_measure),
+                fast_forward=fast_forward_distance,
+            )
+        ]
+        if pending is not None:
+            for fitnesses, course_profile in pending.get():
+                results.append(fitnesses)
+                for field, count in course_profile.items():
+                    profile[field] += count
+    finally:
+        if schedules is not None:
+            schedules.close()
+            schedules.unlink()
+
+    return list(zip(*results))
+
+
+def fitness_function(population, config):
+
+    global generation
+    generation += 1
+    for field in profile:
+        profile[field] = 0
+
+    seeds = get_course_seeds()
+    cache_seed = (
+        tuple(seeds),
+        fitness_aggregate,
+        fitness_quantile,
+        fitness_measure,
+        fast_forward_distance,
+    )
+
+    # NOTE: Without fast forwarding, a dino's run never depends on the other dinos, so genomes
+    # already evaluated on these courses can be left out of the game entirely.
+    uncached_genomes = []
+    uncached_keys = []
+    for genome_id, genome in population:
+        if evaluation_cache is None:
+            uncached_genomes.append(genome)
+            continue
+
+        key = fitness_cache.genome_hash(genome, cache_seed)
+        fitness = evaluation_cache.get(key)
+        if fitness is None:
+            uncached_genomes.append(genome)
+            uncached_keys.append(key)
+        else:
+            genome.fitness = fitness
+
+    if uncached_genomes:
+        course_fitnesses = play_courses(uncached_genomes, config, seeds)
+        for genome, values in zip(uncached_genomes, course_fitnesses):
+            genome.fitness = aggregate_fitness(values, fitness_aggregate, fitness_quantile)
+
+    if evaluation_cache is not None:
+        for key, genome in zip(uncached_keys, uncached_genomes):
+            evaluation_cache.put(key, genome.fitness)
+
 
 def loadConfigFile(configFile):
     return neat.config.Config(
-        neat.DefaultGenome,
+        sensors.SensorGenome,
         neat.DefaultReproduction,
-        neat.DefaultSpeciesSet,
+        speciation.VectorizedSpeciesSet,
         neat.DefaultStagnation,
         configFile,
     )
 
 
-def set_genome_statistics_reporter(population):
-    stats = neat.StatisticsReporter()
+def set_genome_statistics_reporter(population, log_path):
+    stats = statistics_log.StatisticsLogReporter(log_path, profile)
     population.add_reporter(stats)
+    return stats
+
+
+def get_node_names(config):
+    genome_config = config.genome_config
+    node_names = dict(zip(genome_config.input_keys, genome_config.sensors.names))
+    node_names.update(OUTPUT_NAMES)
+    return node_names
 
 
 def plotNetwork(config, winner):
+    # NOTE: matplotlib and graphviz are slow to import and only needed once training has ended.
+    import src.graph as graph
 
-    node_names = {
-        -1: "obst_dist",
-        -2: "obst_height",
-        -3: "obst_width",
-        -4: "obst_y",
-        -5: "dino_speed",
-        -6: "dino.y",
-        -7: "is_cactus",
-        0: "Jump",
-        1: "Duck",
-    }
-    graph.draw_net(config, winner, True, node_names)
+    graph.draw_net(config, winner, True, node_names=get_node_names(config))
     print("\nBest genome:\n{!s}".format(winner))
 
 
@@ -125,12 +468,329 @@ def evolve_generations(population, num_generations):
     return population.run(fitness_function, num_generations)
 
 
-def run(configFile):
+def set_run_options(
+    run_headless=False,
+    record_replay_dir=None,
+    fixed_course_seed=None,
+    cache_size=fitness_cache.DEFAULT_MAX_ENTRIES,
+    courses=1,
+    aggregate="mean",
+    quantile=0.25,
+    interval=1,
+    window=None,
+    render_in_thread=False,
+    measure=fitness_measures.DEFAULT_MEASURE,
+    skip_distance=None,
+):
+
+    if fixed_course_seed is not None and not 0 <= fixed_course_seed < 2**32:
+        raise ValueError("Course seed must be a 32 bit unsigned integer")
+    if courses < 1:
+        raise ValueError("At least one course must be played")
+    if interval < 1:
+        raise ValueError("Decision interval must be at least one frame")
+    if window is not None and window < 0:
+        raise ValueError("Decision window can't be negative")
+    if skip_distance is not None and skip_distance < 0:
+        raise ValueError("Fast forward distance can't be negative")
+    if render_in_thread and not render_thread.is_supported():
+        raise ValueError("Drawing on a render thread isn't supported on macOS")
+    aggregate_fitness([0], aggregate, quantile)
+    fitness_measures.get_measure(measure)
+
+    global headless, replay_dir, course_seed, evaluation_cache
+    global num_courses, fitness_aggregate, fitness_quantile, fitness_measure
+    global decision_interval, decision_window, threaded_render, fast_forward_distance
+    headless = run_headless
+    replay_dir = record_replay_dir
+    course_seed = fixed_course_seed
+    num_courses = courses
+    fitness_aggregate = aggregate
+    fitness_quantile = quantile
+    fitness_measure = measure
+    decision_interval = interval
+    decision_window = window
+    threaded_render = render_in_thread
+    fast_forward_distance = skip_distance
+
+    # NOTE: Cached fitness values are only reusable when every generation plays the same course,
+    # and fast forwarding makes a genome's fitness depend on the rest of its population.
+    evaluation_cache = None
+    if course_seed is not None and cache_size > 0 and skip_distance is None:
+        evaluation_cache = fitness_cache.FitnessCache(cache_size)
+
+    if replay_dir is not None:
+        os.makedirs(replay_dir, exist_ok=True)
+
+
+def evolve(
+    configFile, stats_log, plot_dir=None, plot_every=10, migration=None, metrics_port=None
+):
+    """
+    Evolves a population with the current run options, returning the config and winning genome.
+
+    migration, if given, is called with the population to create the reporter exchanging genomes
+    with the other islands. metrics_port, if given, is the localhost port training metrics are
+    served on while evolving.
+    """
+
+    global course_pool, render_pipeline
+    shared_sprites = None
+    plotter = None
+    metrics_server = None
+    stats = None
+
+    # NOTE: Every resource is acquired inside the try, so one failing to start (e.g. the
+    # metrics port already in use) still releases those started before it.
+    try:
+        if not headless and threaded_render:
+            render_pipeline = render_thread.RenderThread(
+                game.TITLE,
+                WINDOW_WIDTH,
+                WINDOW_HEIGHT,
+                game.get_floor_height(WINDOW_HEIGHT),
+                FRAME_RATE,
+            )
+
+        if num_courses > 1:
+            shared_sprites = course.publish_sprites()
+            course_pool = multiprocessing.Pool(
+                min(num_courses - 1, os.cpu_count() or 1),
+                initializer=course.install_shared_sprites,
+                initargs=(shared_sprites.handle,),
+            )
+
+        config = loadConfigFile(configFile)
+        population = neat.Population(config)
+        stats = set_genome_statistics_reporter(population, stats_log)
+
+        if plot_dir is not None:
+            plotter = plot_worker.PlotWorker(
+                config, plot_dir, get_node_names(config), plot_every
+            )
+            population.add_reporter(plotter.reporter)
+
+        if migration is not None:
+            population.add_reporter(migration(population))
+
+        if metrics_port is not None:
+            metrics_reporter = metrics.MetricsReporter(profile)
+            population.add_reporter(metrics_reporter)
+            metrics_server = metrics.MetricsServer(
+                lambda: dict(
+                    metrics_reporter.values,
+                    alive_dinos=status["alive_dinos"],
+                    resident_memory_bytes=metrics.get_resident_memory(),
+                    max_resident_memory_bytes=metrics.get_max_resident_memory(),
+                ),
+                metrics_port,
+            )
+
+        winner = evolve_generations(population, 100)
+    finally:
+        if course_pool is not None:
+            course_pool.close()
+            course_pool.join()
+            course_pool = None
+        if shared_sprites is not None:
+            shared_sprites.close()
+            shared_sprites.unlink()
+        if render_pipeline is not None:
+            render_pipeline.close()
+            render_pipeline = None
+        if plotter is not None:
+            plotter.close()
+        if metrics_server is not None:
+            metrics_server.close()
+        if stats is not None:
+            stats.close()
+
+    return config, winner
+
+
+def _run_island(
+    island,
+    num_islands,
+    configFile,
+    options,
+    stats_log,
+    plot_dir,
+    plot_every,
+    migration_dir,
+    migration_interval,
+    num_migrants,
+    metrics_port,
+):
+    record_replay_dir = options["record_replay_dir"]
+    if record_replay_dir is not None:
+        record_replay_dir = os.path.join(record_replay_dir, "island_{}".format(island))
+    if plot_dir is not None:
+        plot_dir = os.path.join(plot_dir, "island_{}".format(island))
+    # NOTE: Port 0 has every island pick a free port of its own.
+    if metrics_port:
+        metrics_port += island
+
+    # NOTE: Forked islands start with the same random state, which would evolve every island
+    # identically.
+    random.seed()
+    set_run_options(**dict(options, run_headless=True, record_replay_dir=record_replay_dir))
+
+    exchange = islands.MigrationDirectory(migration_dir)
+    winner = None
+    try:
+        _config, winner = evolve(
+            configFile,
+            islands.island_path(stats_log, island),
+            plot_dir,
+            plot_every,
+            lambda population: islands.MigrationReporter(
+                population, exchange, island, num_islands, migration_interval, num_migrants
+            ),
+            metrics_port,
+        )
+    finally:
+        exchange.finish(island, winner)
+
+
+def evolve_islands(
+    configFile,
+    options,
+    stats_log,
+    plot_dir,
+    plot_every,
+    num_islands,
+    island_ids,
+    migration_dir,
+    migration_interval,
+    num_migrants,
+    metrics_port=None,
+):
+    """
+    Evolves the islands in island_ids, one process each, returning the config and the fittest of
+    their winning genomes.
+
+    options holds the keyword arguments of set_run_options each island is run with.
+
+    metrics_port, if given, is the port island 0 serves its metrics on, each island using the
+    port that many past it (or a free port of its own for port 0).
+    """
+
+    exchange = islands.MigrationDirectory(migration_dir)
+    for island in island_ids:
+        exchange.clear(island)
+
+    processes = []
+    for island in island_ids:
+        process = multiprocessing.Process(
+            target=_run_island,
+            kwargs=dict(
+                island=island,
+                num_islands=num_islands,
+                configFile=configFile,
+                options=options,
+                stats_log=stats_log,
+                plot_dir=plot_dir,
+                plot_every=plot_every,
+                migration_dir=migration_dir,
+                migration_interval=migration_interval,
+                num_migrants=num_migrants,
+                metrics_port=metrics_port,
+            ),
+        )
+        process.start()
+        processes.append(process)
+
+    for process in processes:
+        process.join()
+
+    winners = [exchange.load_winner(island) for island in island_ids]
+    winners = [winner for winner in winners if winner is not None]
+    if not winners:
+        raise RuntimeError("No island finished evolving")
+
+    return loadConfigFile(configFile), max(winners, key=lambda genome: genome.fitness)
+
+
+def run(
+    configFile,
+    run_headless=False,
+    record_replay_dir=None,
+    fixed_course_seed=None,
+    cache_size=fitness_cache.DEFAULT_MAX_ENTRIES,
+    courses=1,
+    aggregate="mean",
+    quantile=0.25,
+    plot_dir=None,
+    plot_every=10,
+    stats_log="statistics.csv",
+    num_islands=1,
+    island_ids=None,
+    migration_dir="migration",
+    migration_interval=5,
+    num_migrants=2,
+    interval=1,
+    window=None,
+    render_in_thread=False,
+    export_path=None,
+    measure=fitness_measures.DEFAULT_MEASURE,
+    skip_distance=None,
+    metrics_port=None,
+):
+
+    options = dict(
+        run_headless=run_headless,
+        record_replay_dir=record_replay_dir,
+        fixed_course_seed=fixed_course_seed,
+        cache_size=cache_size,
+        courses=courses,
+        aggregate=aggregate,
+        quantile=quantile,
+        interval=interval,
+        window=window,
+        render_in_thread=render_in_thread,
+        measure=measure,
+        skip_distance=skip_distance,
+    )
+    set_run_options(**options)
 
-    config = loadConfigFile(configFile)
-    population = neat.Population(config)
-    set_genome_statistics_reporter(population)
+    if num_islands < 1:
+        raise ValueError("At least one island must be evolved")
+    if metrics_port is not None and not 0 <= metrics_port < 2**16:
+        raise ValueError("Metrics port must be between 0 and 65535")
 
-    winner = evolve_generations(population, 100)
+    if num_islands == 1:
+        config, winner = evolve(
+            configFile, stats_log, plot_dir, plot_every, metrics_port=metrics_port
+        )
+    else:
+        if island_ids is None:
+            island_ids = list(range(num_islands))
+        if not island_ids or any(not 0 <= island < num_islands for island in island_ids):
+            raise ValueError("Island ids must be between 0 and {}".format(num_islands - 1))
+        if migration_interval < 1 or num_migrants < 0:
+            raise ValueError("Migration interval must be positive and migrants non-negative")
+        if metrics_port and metrics_port + max(island_ids) >= 2**16:
+            raise ValueError("Metrics ports of every island must be below 65536")
+
+        config, winner = evolve_islands(
+            configFile,
+            options,
+            stats_log,
+            plot_dir,
+            plot_every,
+            num_islands=num_islands,
+            island_ids=sorted(set(island_ids)),
+            migration_dir=migration_dir,
+            migration_interval=migration_interval,
+            num_migrants=num_migrants,
+            metrics_port=metrics_port,
+        )
 
     plotNetwork(config, winner)
+
+    if export_path is not None:
+        # NOTE: Imported here as the exporter plays courses through this module.
+        import src.export as export
+
+        seed = course_seed if course_seed is not None else export.DEFAULT_SEED
+        export.export_champion(winner, config, export_path, seed)
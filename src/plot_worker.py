@@ -0,0 +1,109 @@
+import neat
+import src.statistics_log as statistics_log
+
+import copy
+import os
+import multiprocessing
+import warnings
+
+
+class PlotReporter(neat.reporting.BaseReporter):
+    """
+    Sends a snapshot of every generation to the plot worker.
+
+    Only per-generation aggregates are sent, along with a copy of the champion genome every
+    champion_interval generations, so reporting costs the training loop next to nothing.
+    """
+
+    def __init__(self, plot_queue, champion_interval):
+        self.plot_queue = plot_queue
+        self.champion_interval = champion_interval
+        self.generation = 0
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        self.plot_queue.put(
+            (
+                "stats",
+                self.generation,
+                statistics_log.generation_aggregates(population, species, best_genome),
+            )
+        )
+
+        if self.champion_interval and self.generation % self.champion_interval == 0:
+            self.plot_queue.put(("champion", self.generation, copy.deepcopy(best_genome)))
+
+
+def _plot(draw, *args, **kwargs):
+    # NOTE: A failed plot (e.g. Graphviz missing) shouldn't take the worker, and with it every
+    # later plot, down.
+    try:
+        draw(*args, **kwargs)
+    except Exception as error:
+        warnings.warn("Plot failed: {}".format(error))
+
+
+def _plot_stats(graph, history, output_dir):
+    _plot(
+        graph.plot_stats,
+        history,
+        filename=os.path.join(output_dir, "avg_fitness.svg"),
+    )
+    _plot(
+        graph.plot_species,
+        history,
+        filename=os.path.join(output_dir, "speciation.svg"),
+    )
+
+
+def _run_plot_worker(plot_queue, config, output_dir, node_names):
+    os.environ["MPLBACKEND"] = "Agg"
+    import src.graph as graph
+
+    history = statistics_log.StatisticsLog()
+    while True:
+        snapshot = plot_queue.get()
+        if snapshot is None:
+            break
+
+        kind, generation, data = snapshot
+        if kind == "stats":
+            history.add(*data)
+        elif kind == "champion":
+            _plot(
+                graph.draw_net,
+                config,
+                data,
+                filename=os.path.join(output_dir, "champion_{:04d}".format(generation)),
+                node_names=node_names,
+            )
+            _plot_stats(graph, history, output_dir)
+
+    if history.best_fitness:
+        _plot_stats(graph, history, output_dir)
+
+
+class PlotWorker:
+    """
+    Background process drawing network and statistics plots from training snapshots.
+    """
+
+    def __init__(self, config, output_dir, node_names=None, champion_interval=10):
+        os.makedirs(output_dir, exist_ok=True)
+        self.plot_queue = multiprocessing.Queue()
+        self.process = multiprocessing.Process(
+            target=_run_plot_worker,
+            args=(self.plot_queue, config, output_dir, node_names),
+            daemon=True,
+        )
+        self.process.start()
+        self.reporter = PlotReporter(self.plot_queue, champion_interval)
+
+    def close(self):
+        """
+        Waits for every queued plot to be drawn.
+        """
+        self.plot_queue.put(None)
+        self.process.join()
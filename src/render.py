@@ -5,6 +5,46 @@ BLACK = (0, 0, 0)
 
 FLOOR_OFFSET = 20
 
+FONT_NAME = "arial"
+FONT_SIZE = 30
+
+_sprite_surfaces = {}
+_font = None
+
+
+def get_sprite_surface(sprite):
+    surface = _sprite_surfaces.get(sprite.path)
+    if surface is None:
+        surface = pygame.image.load(sprite.path)
+        # NOTE: Surfaces in the display's pixel format blit faster, but converting needs one.
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        _sprite_surfaces[sprite.path] = surface
+    return surface
+
+
+def get_font():
+    """
+    Returns the font text is drawn in, found once per process as looking up system fonts is slow.
+    """
+    global _font
+    # NOTE: Fonts become unusable once pygame (or its font module) has been quit.
+    if _font is None or not pygame.font.get_init():
+        pygame.font.init()
+        _font = pygame.font.SysFont(FONT_NAME, FONT_SIZE)
+    return _font
+
+
+def get_window(window_width, window_height):
+    """
+    Returns a window of the given size, reusing the open window where it is the same size.
+    """
+    pygame.display.init()
+    window = pygame.display.get_surface()
+    if window is None or window.get_size() != (window_width, window_height):
+        window = pygame.display.set_mode((window_width, window_height))
+    return window
+
 
 class Render:
     """
@@ -12,7 +52,9 @@ class Render:
 
     """
 
-    def __init__(self, game_title, window_width, window_height, floor_height):
+    def __init__(
+        self, game_title, window_width, window_height, floor_height, offscreen=False
+    ):
 
         if not game_title and type(game_title) is str:
             raise ValueError("Title cannot be empty")
@@ -20,11 +62,31 @@ class Render:
         self.win_width = window_width
         self.win_height = window_height
         self.floor_height = floor_height
-        pygame.init()
-        self.font = pygame.font.SysFont("arial", 30)
-        self.window = pygame.display.set_mode((window_width, window_height))
-        pygame.font.init()
-        pygame.display.set_caption(game_title)
+        self.offscreen = offscreen
+
+        # NOTE: Only the display and font modules are used, so the rest of pygame (e.g. audio)
+        # is never initialised. An offscreen renderer draws to a plain surface, so doesn't need
+        # a display either.
+        if offscreen:
+            if not isinstance(game_title, str):
+                raise TypeError("Title must be of type str")
+            self.window = pygame.Surface((window_width, window_height))
+        else:
+            self.window = get_window(window_width, window_height)
+            pygame.display.set_caption(game_title)
+        self.font = get_font()
+        self.clock = pygame.time.Clock()
+
+    def tick(self, frame_rate):
+        self.clock.tick(frame_rate)
+
+    def window_closed(self):
+        if self.offscreen:
+            return False
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return True
+        return False
 
     def close_window(self):
         pygame.quit()
@@ -56,8 +118,41 @@ class Render:
     def draw_img(self, file, posX, posY):
         self.window.blit(file, (posX, posY))
 
+    def draw_sprite(self, sprite, posX, posY):
+        self.window.blit(get_sprite_surface(sprite), (posX, posY))
+
     def draw_circle(self, radius, pos_x, pos_y):
         pygame.draw.circle(self.window, BLACK, (pos_x, pos_y), radius)
 
+    def draw_snapshot(self, snapshot):
+        self.set_background_white()
+        self.display_floor()
+        self.display_score(snapshot.score)
+        for radius, pos_x, pos_y in snapshot.dirt:
+            self.draw_circle(radius, pos_x, pos_y)
+        self.draw_sprites(snapshot.dinos + snapshot.obstacles)
+
+    def draw_sprites(self, sprites):
+        """
+        Draws (sprite, x, y) tuples in order, with a single blit call.
+        """
+        self.window.blits(
+            [
+                (get_sprite_surface(sprite), (pos_x, pos_y))
+                for sprite, pos_x, pos_y in sprites
+            ],
+            doreturn=False,
+        )
+
     def update_display(self):
-        pygame.display.update()
+        if not self.offscreen:
+            pygame.display.update()
+
+    def get_frame(self, size=None):
+        """
+        Returns the drawn frame as RGB bytes, scaled to size if given.
+        """
+        surface = self.window
+        if size is not None and size != surface.get_size():
+            surface = pygame.transform.smoothscale(surface, size)
+        return pygame.image.tobytes(surface, "RGB")
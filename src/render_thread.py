@@ -0,0 +1,107 @@
+import queue
+import sys
+import threading
+
+SNAPSHOT_QUEUE_SIZE = 2
+CLOSE_POLL_INTERVAL = 0.1
+
+
+def is_supported(platform=None):
+    """
+    Returns whether platform (the current one by default) lets a window be created and serviced
+    off the main thread.
+
+    SDL on macOS only allows window creation and event handling on the main thread.
+    """
+    if platform is None:
+        platform = sys.platform
+    return platform != "darwin"
+
+
+class RenderThread:
+    """
+    Draws frame snapshots published by the simulation on a thread of its own.
+
+    The simulation never waits on drawing: while the queue of snapshots is full, frames are
+    dropped rather than published, and the window is redrawn at the game frame rate at most.
+    Closing the window stops drawing while the simulation carries on.
+    """
+
+    def __init__(
+        self,
+        game_title,
+        window_width,
+        window_height,
+        floor_height,
+        frame_rate,
+        queue_size=SNAPSHOT_QUEUE_SIZE,
+    ):
+        if not is_supported():
+            raise ValueError("Drawing on a render thread isn't supported on macOS")
+
+        self.snapshots = queue.Queue(queue_size)
+        self.frame_rate = frame_rate
+        self.frames_drawn = 0
+        self.frames_dropped = 0
+        self.window_open = True
+        self.thread = threading.Thread(
+            target=self._run,
+            args=(game_title, window_width, window_height, floor_height),
+            daemon=True,
+        )
+        self.thread.start()
+
+    def wants_frame(self):
+        """
+        Returns whether a snapshot published now would be drawn, counting a dropped frame if not.
+        """
+        if self.window_open and not self.snapshots.full():
+            return True
+
+        self.frames_dropped += 1
+        return False
+
+    def publish(self, snapshot, generation):
+        try:
+            self.snapshots.put_nowait((snapshot, generation))
+        except queue.Full:
+            self.frames_dropped += 1
+
+    def _run(self, game_title, window_width, window_height, floor_height):
+        # NOTE: pygame is only used from this thread, which owns the window.
+        import src.render as render
+
+        try:
+            renderer = render.Render(game_title, window_width, window_height, floor_height)
+            self._draw_snapshots(renderer)
+            renderer.close_window()
+        finally:
+            self.window_open = False
+
+    def _draw_snapshots(self, renderer):
+        while True:
+            frame = self.snapshots.get()
+            if frame is None:
+                return
+
+            snapshot, generation = frame
+            renderer.draw_snapshot(snapshot)
+            renderer.display_generation(generation)
+            renderer.update_display()
+            self.frames_drawn += 1
+
+            renderer.tick(self.frame_rate)
+            if renderer.window_closed():
+                return
+
+    def close(self):
+        """
+        Waits for every published snapshot to be drawn, then closes the window.
+        """
+        while self.thread.is_alive():
+            try:
+                self.snapshots.put(None, timeout=CLOSE_POLL_INTERVAL)
+                break
+            except queue.Full:
+                continue
+        self.thread.join()
@@ -0,0 +1,260 @@
+import src.game as game
+
+import struct
+import numpy as np
+
+MAGIC = b"DJRP"
+VERSION = 1
+
+JUMP_BIT = 1
+DUCK_BIT = 2
+
+_HEADER = struct.Struct("<4sHIIIHHHd")
+_FRAME = struct.Struct("<II")
+_SPAWN = struct.Struct("<IBii")
+_DEATH = struct.Struct("<II")
+_END = struct.Struct("<I")
+
+TAG_FRAME = b"F"
+TAG_SPAWN = b"S"
+TAG_DEATH = b"D"
+TAG_END = b"E"
+
+
+class ReplayHeader:
+    """
+    Settings needed to rebuild the course a generation was played on.
+    """
+
+    def __init__(
+        self, seed, num_dinos, generation, win_width, win_height, frame_rate, start_speed
+    ):
+        self.seed = seed
+        self.num_dinos = num_dinos
+        self.generation = generation
+        self.win_width = win_width
+        self.win_height = win_height
+        self.frame_rate = frame_rate
+        self.start_speed = start_speed
+
+
+class ReplayFrame:
+    """
+    Everything recorded for a single frame of a generation.
+
+    actions holds one entry per dino alive at the start of the frame (in ascending dino id
+    order), each a combination of JUMP_BIT and DUCK_BIT.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.spawns = []
+        self.alive = []
+        self.actions = []
+        self.deaths = []
+
+
+def pack_actions(actions):
+    actions = np.asarray(actions, dtype=np.uint8)
+    bits = np.empty(len(actions) * 2, dtype=np.uint8)
+    bits[0::2] = actions & JUMP_BIT
+    bits[1::2] = (actions & DUCK_BIT) >> 1
+    return np.packbits(bits).tobytes()
+
+
+def unpack_actions(data, num_actions):
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=num_actions * 2)
+    return bits[0::2] | (bits[1::2] << 1)
+
+
+class ReplayRecorder:
+    """
+    Streams a generation to an append-only binary replay file, replacing any earlier file.
+
+    Each record is written as soon as it happens, so the file stays readable up to the last
+    completed record if training is interrupted. Dino actions are stored as two bits per
+    alive dino, keeping the recording cheap enough to leave on for large populations.
+    """
+
+    def __init__(self, path, header):
+        self.file = open(path, "wb")
+        self.frame = 0
+        self.file.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                header.seed,
+                header.num_dinos,
+                header.generation,
+                header.win_width,
+                header.win_height,
+                header.frame_rate,
+                header.start_speed,
+            )
+        )
+
+    def set_frame(self, frame):
+        self.frame = frame
+
+    def record_spawn(self, kind, x, y):
+        self.file.write(TAG_SPAWN + _SPAWN.pack(self.frame, kind, int(x), int(y)))
+
+    def record_actions(self, actions):
+        self.file.write(
+            TAG_FRAME + _FRAME.pack(self.frame, len(actions)) + pack_actions(actions)
+        )
+
+    def record_death(self, dinoId):
+        self.file.write(TAG_DEATH + _DEATH.pack(self.frame, dinoId))
+
+    def close(self):
+        self.file.write(TAG_END + _END.pack(self.frame))
+        self.file.close()
+
+
+def read_replay(path):
+    """
+    Reads a replay file, returning its header and the list of recorded frames.
+    """
+    with open(path, "rb") as replay_file:
+        data = replay_file.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError("Replay file is truncated")
+
+    (
+        magic,
+        version,
+        seed,
+        num_dinos,
+        generation,
+        win_width,
+        win_height,
+        frame_rate,
+        start_speed,
+    ) = _HEADER.unpack_from(data, 0)
+
+    if magic != MAGIC:
+        raise ValueError("Not a replay file")
+    if version != VERSION:
+        raise ValueError("Unsupported replay version {}".format(version))
+
+    header = ReplayHeader(
+        seed, num_dinos, generation, win_width, win_height, frame_rate, start_speed
+    )
+
+    frames = []
+    alive = list(range(num_dinos))
+    pos = _HEADER.size
+
+    def frame_at(index):
+        while len(frames) <= index:
+            frames.append(ReplayFrame(len(frames)))
+        return frames[index]
+
+    # NOTE: A record cut off by an interrupted recording ends the replay at the last whole one.
+    while pos < len(data):
+        tag = data[pos : pos + 1]
+        pos += 1
+        if tag == TAG_SPAWN:
+            if pos + _SPAWN.size > len(data):
+                break
+            index, kind, x, y = _SPAWN.unpack_from(data, pos)
+            pos += _SPAWN.size
+            frame_at(index).spawns.append((kind, x, y))
+        elif tag == TAG_FRAME:
+            if pos + _FRAME.size > len(data):
+                break
+            index, num_actions = _FRAME.unpack_from(data, pos)
+            num_bytes = (num_actions * 2 + 7) // 8
+            if pos + _FRAME.size + num_bytes > len(data):
+                break
+            pos += _FRAME.size
+            frame = frame_at(index)
+            frame.alive = list(alive)
+            frame.actions = unpack_actions(data[pos : pos + num_bytes], num_actions)
+            pos += num_bytes
+        elif tag == TAG_DEATH:
+            if pos + _DEATH.size > len(data):
+                break
+            index, dinoId = _DEATH.unpack_from(data, pos)
+            pos += _DEATH.size
+            frame_at(index).deaths.append(dinoId)
+            alive.remove(dinoId)
+        elif tag == TAG_END:
+            break
+        else:
+            raise ValueError("Corrupt replay record at byte {}".format(pos - 1))
+
+    return header, frames
+
+
+def _replay_frame(replay_game, frame):
+    replay_game.increment_game_speed()
+    replay_game.update_environment()
+
+    replay_game.update_dinos(frame.alive)
+    for dinoId, action in zip(frame.alive, frame.actions):
+        if action & JUMP_BIT:
+            replay_game.dino_jump(dinoId)
+        if action & DUCK_BIT:
+            replay_game.dino_duck(dinoId)
+
+    for dinoId in frame.deaths:
+        replay_game.kill_dino(dinoId)
+
+    replay_game.increment_score()
+
+
+def play(path, speed=1.0, start_frame=0):
+    """
+    Renders a recorded generation.
+
+    Frames before start_frame are simulated without drawing, allowing playback to seek to any
+    point of the run. speed scales the recorded frame rate.
+    """
+    if speed <= 0:
+        raise ValueError("Replay speed must be positive")
+
+    header, frames = read_replay(path)
+    if not frames:
+        raise ValueError("Replay holds no frames")
+
+    spawns = []
+
+    replay_game = game.Game(
+        header.num_dinos,
+        header.win_width,
+        header.win_height,
+        frame_rate=header.frame_rate,
+        start_speed=header.start_speed,
+        seed=header.seed,
+        on_obstacle_spawn=lambda kind, x, y: spawns.append((kind, x, y)),
+    )
+    play_rate = header.frame_rate * speed
+
+    # NOTE: Frame 0 holds the obstacles spawned while the game was being created.
+    if spawns != frames[0].spawns:
+        raise ValueError("Replay was recorded on a different course")
+
+    for frame in frames[1:]:
+        del spawns[:]
+        _replay_frame(replay_game, frame)
+
+        if spawns != frame.spawns:
+            raise ValueError(
+                "Replay diverged from recording at frame {}".format(frame.index)
+            )
+
+        if frame.index < start_frame:
+            continue
+
+        if replay_game.window_closed():
+            break
+
+        replay_game.get_renderer().tick(play_rate)
+        replay_game.draw_game(frame.alive)
+        replay_game.get_renderer().display_generation(header.generation)
+        replay_game.get_renderer().update_display()
+
+    replay_game.quit_game()
@@ -0,0 +1,170 @@
+import neat
+import numpy as np
+import src.assets as assets
+
+# NOTE: Features sensed for each of the next obstacles in front of the dinos, and of the dinos
+# themselves, in the order they're fed to the networks.
+OBSTACLE_FEATURES = [
+    "distance",
+    "gap",
+    "height",
+    "width",
+    "elevation",
+    "time_to_impact",
+    "is_cactus",
+]
+DINO_FEATURES = ["speed", "elevation"]
+
+DEFAULT_NUM_OBSTACLES = 1
+DEFAULT_OBSTACLE_FEATURES = ["distance", "height", "width", "elevation", "is_cactus"]
+DEFAULT_DINO_FEATURES = ["speed", "elevation"]
+
+
+def _parse_bool(name, value):
+    if value.lower() in ("true", "1", "yes", "on"):
+        return True
+    if value.lower() in ("false", "0", "no", "off"):
+        return False
+    raise ValueError("Expected {} to be true or false, not '{}'".format(name, value))
+
+
+class Sensors:
+    """
+    Builds the observation matrix fed to the networks, one row per dino.
+
+    The next num_obstacles obstacles are sensed by every dino, as they all stand at the same x,
+    so each feature is a whole column worked out with one array operation per frame, however many
+    dinos are alive. Missing obstacles (fewer being in front of the dinos than are sensed) read as
+    empty space a window's width beyond the last. With normalize, distances are given in window
+    widths, heights in window heights, times in seconds and the speed relative to the start speed.
+    """
+
+    def __init__(
+        self,
+        num_obstacles=DEFAULT_NUM_OBSTACLES,
+        obstacle_features=DEFAULT_OBSTACLE_FEATURES,
+        dino_features=DEFAULT_DINO_FEATURES,
+        normalize=False,
+    ):
+        if num_obstacles < 0:
+            raise ValueError("Number of sensed obstacles can't be negative")
+        for feature in obstacle_features:
+            if feature not in OBSTACLE_FEATURES:
+                raise ValueError("Unknown obstacle feature '{}'".format(feature))
+        for feature in dino_features:
+            if feature not in DINO_FEATURES:
+                raise ValueError("Unknown dino feature '{}'".format(feature))
+
+        self.num_obstacles = num_obstacles
+        self.obstacle_features = list(obstacle_features)
+        self.dino_features = list(dino_features)
+        self.normalize = normalize
+
+    @property
+    def num_inputs(self):
+        return self.num_obstacles * len(self.obstacle_features) + len(self.dino_features)
+
+    @property
+    def names(self):
+        names = []
+        for index in range(self.num_obstacles):
+            prefix = "obst_" if self.num_obstacles == 1 else "obst{}_".format(index + 1)
+            names += [prefix + feature for feature in self.obstacle_features]
+        return names + ["dino_" + feature for feature in self.dino_features]
+
+    def _obstacle_columns(self, dino_game, fronts):
+        # NOTE: Obstacles move a whole number of pixels each frame, but the unrounded speed
+        # serves as well for telling how soon one arrives.
+        pixels_per_frame = (
+            dino_game.get_game_speed() * assets.PIX_PER_METER / dino_game.frame_rate
+        )
+        width_scale = dino_game.win_width if self.normalize else 1
+        height_scale = dino_game.win_height if self.normalize else 1
+        time_scale = dino_game.frame_rate if self.normalize else 1
+
+        obstacles = dino_game.get_obstacles_ahead(self.num_obstacles)
+        previous_end = None
+        for index in range(self.num_obstacles):
+            if index < len(obstacles):
+                obstacle = obstacles[index]
+                x = obstacle.x
+                height = obstacle.img.get_height()
+                width = obstacle.img.get_width()
+                elevation = dino_game.floor_height - (obstacle.y + height)
+                is_cactus = isinstance(obstacle, assets.Cactus)
+            else:
+                x = (previous_end if previous_end is not None else fronts) + dino_game.win_width
+                height = width = elevation = 0
+                is_cactus = False
+
+            distance = x - fronts
+            gap = distance if previous_end is None else x - previous_end
+            values = {
+                "distance": distance / width_scale,
+                "gap": gap / width_scale,
+                "height": height / height_scale,
+                "width": width / width_scale,
+                "elevation": elevation / height_scale,
+                "time_to_impact": distance / pixels_per_frame / time_scale,
+                "is_cactus": float(is_cactus),
+            }
+            for feature in self.obstacle_features:
+                yield values[feature]
+            previous_end = x + width
+
+    def observe(self, dino_game, dinoIds):
+        """
+        Returns the (len(dinoIds), num_inputs) matrix of what each of the dinos senses.
+        """
+        fronts, elevations = dino_game.get_dino_extents(dinoIds)
+        observations = np.empty((len(dinoIds), self.num_inputs))
+
+        column = 0
+        for values in self._obstacle_columns(dino_game, fronts):
+            observations[:, column] = values
+            column += 1
+
+        dino_values = {
+            "speed": dino_game.get_game_speed()
+            / (dino_game.start_speed if self.normalize else 1),
+            "elevation": elevations / (dino_game.win_height if self.normalize else 1),
+        }
+        for feature in self.dino_features:
+            observations[:, column] = dino_values[feature]
+            column += 1
+        return observations
+
+
+class SensorGenome(neat.DefaultGenome):
+    """
+    neat.DefaultGenome configured with the Sensors its networks are fed by.
+
+    The sensor options (sensor_obstacles, sensor_obstacle_features, sensor_dino_features and
+    sensor_normalize) are read from the genome section of the config, and num_inputs is derived
+    from them, so it needn't be given.
+    """
+
+    @classmethod
+    def parse_config(cls, param_dict):
+        param_dict = dict(param_dict)
+        sensors = Sensors(
+            int(param_dict.pop("sensor_obstacles", DEFAULT_NUM_OBSTACLES)),
+            param_dict.pop(
+                "sensor_obstacle_features", " ".join(DEFAULT_OBSTACLE_FEATURES)
+            ).split(),
+            param_dict.pop("sensor_dino_features", " ".join(DEFAULT_DINO_FEATURES)).split(),
+            _parse_bool("sensor_normalize", param_dict.pop("sensor_normalize", "false")),
+        )
+
+        num_inputs = param_dict.get("num_inputs")
+        if num_inputs is not None and int(num_inputs) != sensors.num_inputs:
+            raise ValueError(
+                "num_inputs is {}, but the sensors give {} inputs".format(
+                    num_inputs, sensors.num_inputs
+                )
+            )
+        param_dict["num_inputs"] = str(sensors.num_inputs)
+
+        genome_config = super().parse_config(param_dict)
+        genome_config.sensors = sensors
+        return genome_config
@@ -0,0 +1,58 @@
+import numpy as np
+
+from multiprocessing import shared_memory
+
+ARRAY_ALIGNMENT = 64
+
+
+class SharedArrays:
+    """
+    Named numpy arrays packed into a single shared memory block.
+
+    The owner publishes the block once, after which any process can attach to it from its small
+    handle, mapping the arrays read-only rather than receiving a copy of them.
+    """
+
+    def __init__(self, block, layout):
+        self.block = block
+        self.handle = (block.name, layout)
+        self.arrays = {}
+        for key, dtype, shape, offset in layout:
+            self.arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+
+    def _set_read_only(self):
+        for array in self.arrays.values():
+            array.flags.writeable = False
+
+    @classmethod
+    def publish(cls, arrays):
+        layout = []
+        size = 0
+        for key, array in arrays.items():
+            size = -(-size // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+            layout.append((key, array.dtype.str, array.shape, size))
+            size += array.nbytes
+
+        shared = cls(shared_memory.SharedMemory(create=True, size=max(size, 1)), layout)
+        for key, array in arrays.items():
+            shared.arrays[key][...] = array
+        shared._set_read_only()
+        return shared
+
+    @classmethod
+    def attach(cls, handle):
+        name, layout = handle
+        shared = cls(shared_memory.SharedMemory(name=name), layout)
+        shared._set_read_only()
+        return shared
+
+    def close(self):
+        # NOTE: The block can't be closed while arrays still point into it.
+        self.arrays = {}
+        self.block.close()
+
+    def unlink(self):
+        """
+        Frees the block once every process has closed it, only to be called by the owner.
+        """
+        self.block.unlink()
@@ -0,0 +1,72 @@
+import os
+import numpy as np
+
+from PIL import Image, UnidentifiedImageError
+
+IMAGE_DIR = "images"
+
+MASK_ALPHA_THRESHOLD = 127
+
+_sprite_cache = {}
+
+
+class Sprite:
+    """
+    Pure data description of an image, holding its size and collision mask.
+
+    Simulation code works with sprites alone, only the renderer needs the pixels themselves, so a
+    game can be run without initialising (or even importing) pygame.
+    """
+
+    def __init__(self, name, index, path, mask):
+        self.name = name
+        self.index = index
+        self.path = path
+        self.mask = mask
+        self.height, self.width = mask.shape
+
+    def get_width(self):
+        return self.width
+
+    def get_height(self):
+        return self.height
+
+    def get_size(self):
+        return self.width, self.height
+
+
+def read_png_alpha(path):
+    """
+    Reads the alpha channel of a PNG file, which is fully opaque for images without transparency.
+    """
+    try:
+        with Image.open(path) as image:
+            if image.format != "PNG":
+                raise ValueError("{} is not a PNG file".format(path))
+            return np.array(image.convert("RGBA").getchannel("A"))
+    except UnidentifiedImageError as error:
+        raise ValueError("{} is not a PNG file".format(path)) from error
+
+
+def sprite_path(name, index):
+    return os.path.join(IMAGE_DIR, name + "_" + str(index) + ".png")
+
+
+def add_sprites(name, sprites):
+    """
+    Caches sprites made elsewhere (e.g. from masks in shared memory), so they're used rather than
+    loaded from disk.
+    """
+    _sprite_cache[(name, len(sprites))] = sprites
+
+
+def load_sprites(name, num):
+    sprites = _sprite_cache.get((name, num))
+    if sprites is None:
+        sprites = []
+        for index in range(num):
+            path = sprite_path(name, index)
+            mask = read_png_alpha(path) > MASK_ALPHA_THRESHOLD
+            sprites.append(Sprite(name, index, path, mask))
+        _sprite_cache[(name, num)] = sprites
+    return sprites
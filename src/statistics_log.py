@@ -0,0 +1,132 @@
+import neat
+import csv
+
+from neat.math_util import mean, stdev
+
+FIELDS = ["generation", "best_fitness", "mean_fitness", "stdev_fitness", "species_sizes"]
+PROFILE_FIELDS = ["dino_frames", "network_queries", "networks_compiled"]
+
+
+def format_species_sizes(species_sizes):
+    return ";".join("{}:{}".format(sid, size) for sid, size in sorted(species_sizes.items()))
+
+
+def parse_species_sizes(text):
+    if not text:
+        return {}
+    return {
+        int(sid): int(size) for sid, size in (item.split(":") for item in text.split(";"))
+    }
+
+
+def species_size_table(species_sizes):
+    """
+    Converts per-generation {species id: size} dicts into per-generation lists of sizes for every
+    species id seen, as returned by neat.StatisticsReporter.get_species_sizes.
+    """
+    max_species = max((max(sizes, default=0) for sizes in species_sizes), default=0)
+    return [
+        [sizes.get(sid, 0) for sid in range(1, max_species + 1)] for sizes in species_sizes
+    ]
+
+
+def generation_aggregates(population, species, best_genome):
+    """
+    Returns the best fitness, mean fitness, fitness standard deviation and species sizes of a
+    generation.
+    """
+    fitnesses = [genome.fitness for genome in population.values()]
+    species_sizes = {sid: len(s.members) for sid, s in species.species.items()}
+    return best_genome.fitness, mean(fitnesses), stdev(fitnesses), species_sizes
+
+
+class _Fitness:
+    def __init__(self, fitness):
+        self.fitness = fitness
+
+
+class StatisticsLogReporter(neat.reporting.BaseReporter):
+    """
+    Appends each generation's fitness and species aggregates to a CSV log.
+
+    Unlike neat.StatisticsReporter nothing is kept in memory, so a run of any length holds only
+    the open file. profile, if given, is a dict of the PROFILE_FIELDS counters of the generation
+    being evaluated, logged alongside it.
+    """
+
+    def __init__(self, path, profile=None):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(FIELDS + PROFILE_FIELDS)
+        self.profile = profile if profile is not None else {}
+        self.generation = 0
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        best_fitness, fitness_mean, fitness_stdev, species_sizes = generation_aggregates(
+            population, species, best_genome
+        )
+        self.writer.writerow(
+            [
+                self.generation,
+                repr(best_fitness),
+                repr(fitness_mean),
+                repr(fitness_stdev),
+                format_species_sizes(species_sizes),
+            ]
+            + [self.profile.get(field, "") for field in PROFILE_FIELDS]
+        )
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class StatisticsLog:
+    """
+    Per-generation aggregates, read from a log written by StatisticsLogReporter or added as they
+    arrive.
+
+    Provides the parts of the neat.StatisticsReporter interface used by graph.plot_stats and
+    graph.plot_species.
+    """
+
+    def __init__(self, path=None):
+        self.best_fitness = []
+        self.fitness_mean = []
+        self.fitness_stdev = []
+        self.species_sizes = []
+
+        if path is None:
+            return
+
+        with open(path, newline="") as log_file:
+            for row in csv.DictReader(log_file):
+                self.add(
+                    float(row["best_fitness"]),
+                    float(row["mean_fitness"]),
+                    float(row["stdev_fitness"]),
+                    parse_species_sizes(row["species_sizes"]),
+                )
+
+    def add(self, best_fitness, fitness_mean, fitness_stdev, species_sizes):
+        self.best_fitness.append(best_fitness)
+        self.fitness_mean.append(fitness_mean)
+        self.fitness_stdev.append(fitness_stdev)
+        self.species_sizes.append(species_sizes)
+
+    @property
+    def most_fit_genomes(self):
+        # NOTE: graph.plot_stats only reads the fitness of each generation's best genome.
+        return [_Fitness(fitness) for fitness in self.best_fitness]
+
+    def get_fitness_mean(self):
+        return self.fitness_mean
+
+    def get_fitness_stdev(self):
+        return self.fitness_stdev
+
+    def get_species_sizes(self):
+        return species_size_table(self.species_sizes)
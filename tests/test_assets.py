@@ -229,6 +229,15 @@ class TestDino(unittest.TestCase):
         self.dino.update()
         self.assertNotEqual(start_img, self.dino.get_image())
 
+    def test_image_picked_from_shared_clock(self):
+        clock = assets.AnimationClock()
+        dino = assets.Dino(0, 0, frames_per_img_animate=1, clock=clock)
+        start_img = dino.get_image()
+        clock.tick()
+        self.assertNotEqual(start_img, dino.get_image())
+        dino.update()
+        self.assertEqual(clock.frame, 1)
+
     #### Get img ####
     def test_get_image_success_no_input(self):
         try:
@@ -405,6 +414,20 @@ class TestBird(unittest.TestCase):
         next_frame_image = bird.get_image()
         self.assertNotEqual(start_image, next_frame_image)
 
+    def test_animation_phase_starts_at_clock_frame(self):
+        clock = assets.AnimationClock()
+        clock.tick(7)
+        bird = assets.Bird(
+            VALID_START_X, VALID_MIN_Y, VALID_MAX_Y, frames_per_img_animate=2, clock=clock
+        )
+        images = []
+        for _ in range(4):
+            images.append(bird.get_image())
+            clock.tick()
+        self.assertEqual(images[0], images[1])
+        self.assertNotEqual(images[1], images[2])
+        self.assertEqual(images[2], images[3])
+
     def test_double_game_speed_equals_double_distance_traveled(self):
         game_speed = 10
         frame_rate = 10
@@ -588,5 +611,16 @@ class TestCactus(unittest.TestCase):
         )
 
 
+class TestAnimationClock(unittest.TestCase):
+
+    def test_get_index_cycles_images(self):
+        clock = assets.AnimationClock()
+        indexes = []
+        for _ in range(8):
+            indexes.append(clock.get_index(1, 2, 3))
+            clock.tick()
+        self.assertEqual(indexes, [2, 0, 0, 1, 1, 2, 2, 0])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,129 @@
+import unittest
+import numpy as np
+import src.course as course
+import src.game as game
+import src.assets as assets
+import src.sprites as sprites
+import src.shared_arrays as shared_arrays
+
+VALID_WIN_WIDTH = 1400
+VALID_WIN_HEIGHT = 400
+VALID_SEED = 11
+NUM_FRAMES = 6000
+SHORT_SCHEDULE_LENGTH = 8
+
+
+def _play_spawns(schedule=None):
+    spawns = []
+    course_game = game.Game(
+        1,
+        VALID_WIN_WIDTH,
+        VALID_WIN_HEIGHT,
+        seed=VALID_SEED,
+        on_obstacle_spawn=lambda kind, x, y: spawns.append((kind, x, y)),
+        headless=True,
+        schedule=schedule,
+    )
+    for _ in range(NUM_FRAMES):
+        course_game.increment_game_speed()
+        course_game.update_environment()
+    return spawns
+
+
+class TestObstacleSchedule(unittest.TestCase):
+
+    #### Generate ####
+    def test_generate_schedule_length(self):
+        schedule = course.generate_schedule(VALID_SEED, VALID_WIN_WIDTH, VALID_WIN_HEIGHT)
+        self.assertEqual(len(schedule), course.SCHEDULE_LENGTH)
+
+    def test_schedule_plays_same_course_as_seed(self):
+        schedule = course.generate_schedule(VALID_SEED, VALID_WIN_WIDTH, VALID_WIN_HEIGHT)
+        spawns = _play_spawns(schedule)
+        self.assertGreater(len(spawns), SHORT_SCHEDULE_LENGTH)
+        self.assertEqual(spawns, _play_spawns())
+
+    def test_course_continues_past_end_of_schedule(self):
+        schedule = course.generate_schedule(
+            VALID_SEED, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, SHORT_SCHEDULE_LENGTH
+        )
+        self.assertEqual(_play_spawns(schedule), _play_spawns())
+
+    #### Shared Memory ####
+    def test_shared_schedule_matches_published(self):
+        schedules = [
+            course.generate_schedule(seed, VALID_WIN_WIDTH, VALID_WIN_HEIGHT)
+            for seed in range(3)
+        ]
+        published = course.publish_schedules(schedules)
+        try:
+            attached = shared_arrays.SharedArrays.attach(published.handle)
+            shared = course.get_shared_schedule(attached, 2)
+            self.assertEqual(
+                [shared.get_spec(i) for i in range(len(shared))],
+                [schedules[2].get_spec(i) for i in range(len(schedules[2]))],
+            )
+            self.assertEqual(shared.get_rng_state(), schedules[2].get_rng_state())
+            del shared
+            attached.close()
+        finally:
+            published.close()
+            published.unlink()
+
+
+class TestSharedArrays(unittest.TestCase):
+
+    def setUp(self):
+        self.arrays = {
+            "bytes": np.arange(5, dtype=np.int8),
+            "grid": np.arange(12, dtype=np.float64).reshape(3, 4),
+            "mask": np.array([[True, False], [False, True]]),
+        }
+        self.published = shared_arrays.SharedArrays.publish(self.arrays)
+
+    def tearDown(self):
+        self.published.close()
+        self.published.unlink()
+
+    def test_attach_maps_published_arrays(self):
+        attached = shared_arrays.SharedArrays.attach(self.published.handle)
+        for key, array in self.arrays.items():
+            np.testing.assert_array_equal(attached.arrays[key], array)
+            self.assertEqual(attached.arrays[key].dtype, array.dtype)
+        attached.close()
+
+    def test_attached_arrays_read_only(self):
+        attached = shared_arrays.SharedArrays.attach(self.published.handle)
+        with self.assertRaises(ValueError):
+            attached.arrays["grid"][0, 0] = 1
+        attached.close()
+
+
+class TestSharedSprites(unittest.TestCase):
+
+    def setUp(self):
+        self.sprite_cache = dict(sprites._sprite_cache)
+        self.published = course.publish_sprites()
+
+    def tearDown(self):
+        sprites._sprite_cache.clear()
+        sprites._sprite_cache.update(self.sprite_cache)
+        course._shared_sprites.close()
+        course._shared_sprites = None
+        self.published.close()
+        self.published.unlink()
+
+    def test_installed_sprites_match_images(self):
+        loaded = {key: sprites.load_sprites(*key) for key in assets.SPRITE_SETS}
+        course.install_shared_sprites(self.published.handle)
+
+        for key, images in loaded.items():
+            shared = sprites.load_sprites(*key)
+            self.assertIsNot(shared, images)
+            for image, shared_image in zip(images, shared):
+                np.testing.assert_array_equal(shared_image.mask, image.mask)
+                self.assertEqual(shared_image.path, image.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
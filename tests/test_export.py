@@ -0,0 +1,150 @@
+import unittest
+import os
+import random
+import shutil
+import tempfile
+import neat
+import pygame
+import src.export as export
+import src.neural_net as neural_net
+
+CONFIG_PATH = "config/config-feedforward.txt"
+MAX_FRAMES = 12
+FRAME_STEP = 3
+SCALE = 0.25
+
+
+class _Snapshot:
+    score = 0
+    dinos = ()
+    dirt = ()
+    obstacles = ()
+
+
+class _FailingEncoder:
+    closed = False
+
+    def write(self, frame):
+        raise BrokenPipeError()
+
+    def close(self):
+        self.closed = True
+        raise ValueError("flush of closed file")
+
+
+class TestExport(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(2)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config = neural_net.loadConfigFile(CONFIG_PATH)
+        self.genome = next(iter(neat.Population(self.config).population.values()))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _export(self, name, max_frames=MAX_FRAMES):
+        path = os.path.join(self.temp_dir.name, name)
+        export.export_champion(
+            self.genome,
+            self.config,
+            path,
+            max_frames=max_frames,
+            frame_step=FRAME_STEP,
+            scale=SCALE,
+        )
+        return path
+
+    #### Image Sequence ####
+    def test_export_image_sequence(self):
+        path = self._export("frames")
+        frames = sorted(os.listdir(path))
+        self.assertGreater(len(frames), 0)
+        self.assertLessEqual(len(frames), MAX_FRAMES // FRAME_STEP)
+        self.assertEqual(frames[0], export.FRAME_NAME.format(0))
+
+        image = pygame.image.load(os.path.join(path, frames[0]))
+        self.assertEqual(
+            image.get_size(),
+            (neural_net.WINDOW_WIDTH * SCALE, neural_net.WINDOW_HEIGHT * SCALE),
+        )
+
+    def test_export_without_display(self):
+        pygame.display.quit()
+        self._export("frames")
+        self.assertFalse(pygame.display.get_init())
+
+    #### GIF ####
+    def test_export_gif(self):
+        from PIL import Image
+
+        path = self._export("champion.gif")
+        with Image.open(path) as clip:
+            self.assertGreater(clip.n_frames, 0)
+            self.assertLessEqual(clip.n_frames, MAX_FRAMES // FRAME_STEP)
+            self.assertEqual(clip.info["loop"], 0)
+            self.assertEqual(
+                clip.size,
+                (neural_net.WINDOW_WIDTH * SCALE, neural_net.WINDOW_HEIGHT * SCALE),
+            )
+
+    def test_gif_frames_written_as_they_arrive(self):
+        from PIL import Image
+
+        path = os.path.join(self.temp_dir.name, "frames.gif")
+        size = (8, 4)
+        encoder = export._GifEncoder(path, size, 30)
+        encoder.write(bytes(size[0] * size[1] * 3))
+        first_end = encoder.file.tell()
+        encoder.write(bytes([255]) * (size[0] * size[1] * 3))
+        self.assertGreater(encoder.file.tell(), first_end)
+        encoder.close()
+
+        with Image.open(path) as clip:
+            self.assertEqual(clip.n_frames, 2)
+            clip.seek(1)
+            self.assertEqual(clip.convert("RGB").getpixel((0, 0)), (255, 255, 255))
+
+    #### Video ####
+    @unittest.skipIf(shutil.which("ffmpeg") is None, "ffmpeg not installed")
+    def test_export_video(self):
+        path = self._export("champion.mp4")
+        self.assertGreater(os.path.getsize(path), 0)
+
+    @unittest.skipIf(shutil.which("ffmpeg") is not None, "ffmpeg installed")
+    def test_export_video_without_ffmpeg(self):
+        with self.assertRaises(ValueError):
+            self._export("champion.mp4")
+
+    #### Clip Exporter ####
+    def test_clip_exporter_invalid_frame_step(self):
+        with self.assertRaises(ValueError):
+            export.ClipExporter(self.temp_dir.name, 100, 100, 80, 30, frame_step=0)
+
+    def test_clip_exporter_frame_size_even(self):
+        exporter = export.ClipExporter(
+            os.path.join(self.temp_dir.name, "frames"), 101, 51, 40, 30
+        )
+        exporter.publish(_Snapshot(), 1)
+        exporter.close()
+        image = pygame.image.load(
+            os.path.join(self.temp_dir.name, "frames", export.FRAME_NAME.format(0))
+        )
+        self.assertEqual(image.get_size(), (100, 50))
+
+
+    def test_clip_exporter_closes_encoder_after_write_error(self):
+        exporter = export.ClipExporter(
+            os.path.join(self.temp_dir.name, "frames"), 100, 50, 40, 30
+        )
+        encoder = _FailingEncoder()
+        exporter.encoder = encoder
+        exporter.publish(_Snapshot(), 1)
+
+        with self.assertRaises(BrokenPipeError):
+            exporter.close()
+        self.assertTrue(encoder.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
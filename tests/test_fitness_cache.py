@@ -0,0 +1,80 @@
+import unittest
+import copy
+import neat
+import src.fitness_cache as fitness_cache
+import src.neural_net as neural_net
+
+CONFIG_PATH = "config/config-feedforward.txt"
+VALID_SEED = 42
+
+
+class TestGenomeHash(unittest.TestCase):
+
+    def setUp(self):
+        self.config = neural_net.loadConfigFile(CONFIG_PATH)
+        self.genome = neat.DefaultGenome(1)
+        self.genome.configure_new(self.config.genome_config)
+
+    def test_hash_equal_for_copied_genome(self):
+        clone = copy.deepcopy(self.genome)
+        clone.key = 2
+        self.assertEqual(
+            fitness_cache.genome_hash(self.genome, VALID_SEED),
+            fitness_cache.genome_hash(clone, VALID_SEED),
+        )
+
+    def test_hash_differs_on_weight_change(self):
+        clone = copy.deepcopy(self.genome)
+        next(iter(clone.connections.values())).weight += 0.5
+        self.assertNotEqual(
+            fitness_cache.genome_hash(self.genome, VALID_SEED),
+            fitness_cache.genome_hash(clone, VALID_SEED),
+        )
+
+    def test_hash_differs_on_seed_change(self):
+        self.assertNotEqual(
+            fitness_cache.genome_hash(self.genome, VALID_SEED),
+            fitness_cache.genome_hash(self.genome, VALID_SEED + 1),
+        )
+
+    def test_hash_ignores_disabled_connection_weight(self):
+        self.genome.connections[next(iter(self.genome.connections))].enabled = False
+        clone = copy.deepcopy(self.genome)
+        clone.connections[next(iter(clone.connections))].weight += 0.5
+        self.assertEqual(
+            fitness_cache.genome_hash(self.genome, VALID_SEED),
+            fitness_cache.genome_hash(clone, VALID_SEED),
+        )
+
+
+class TestFitnessCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = fitness_cache.FitnessCache(2)
+
+    def test_init_invalid_size(self):
+        with self.assertRaises(ValueError):
+            fitness_cache.FitnessCache(0)
+
+    def test_get_missing_returns_none(self):
+        self.assertIsNone(self.cache.get(b"a"))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_get_returns_stored_fitness(self):
+        self.cache.put(b"a", 1.5)
+        self.assertEqual(self.cache.get(b"a"), 1.5)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_put_evicts_least_recently_used(self):
+        self.cache.put(b"a", 1)
+        self.cache.put(b"b", 2)
+        self.cache.get(b"a")
+        self.cache.put(b"c", 3)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get(b"b"))
+        self.assertEqual(self.cache.get(b"a"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
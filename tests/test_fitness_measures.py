@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+import src.fitness_measures as fitness_measures
+
+
+class TestFitnessMeasures(unittest.TestCase):
+
+    def setUp(self):
+        self.result = fitness_measures.CourseResult(
+            np.array([10, 50, 80]),
+            np.array([True, True, False]),
+            np.array([0, 2, 3]),
+            np.array([0, 3, 0]),
+        )
+
+    #### Survival ####
+    def test_survival(self):
+        np.testing.assert_allclose(
+            fitness_measures.survival(self.result), [0.0, 4.0, 8.0]
+        )
+
+    #### Obstacles Cleared ####
+    def test_obstacles_cleared(self):
+        np.testing.assert_array_equal(
+            fitness_measures.obstacles_cleared(self.result), [0, 2, 3]
+        )
+
+    #### Jump Efficiency ####
+    def test_jump_efficiency(self):
+        np.testing.assert_allclose(
+            fitness_measures.jump_efficiency(self.result), [0.0, 0.5, 3.0]
+        )
+
+    #### Get Measure ####
+    def test_get_measure(self):
+        self.assertIs(fitness_measures.get_measure("survival"), fitness_measures.survival)
+
+    def test_get_measure_unknown(self):
+        with self.assertRaises(ValueError):
+            fitness_measures.get_measure("distance")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
+import random
 import time
 import src.game as game
+import src.mechanics as mechanics
 import tests.test_common as test_common
 
 VALID_NUM_DINOS = 3
@@ -58,6 +60,52 @@ class TestGame(unittest.TestCase):
         with self.assertRaises(ValueError):
             game.Game(0, VALID_WIN_WIDTH, VALID_WIN_HEIGHT)
 
+    def test_init_headless_without_renderer(self):
+        game_instance = game.Game(
+            VALID_NUM_DINOS, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, headless=True
+        )
+        self.assertIsNone(game_instance.get_renderer())
+        self.assertFalse(game_instance.window_closed())
+
+    #### Reset ####
+    def _course_after_frames(self, dino_game, num_frames=500):
+        for _ in range(num_frames):
+            dino_game.increment_game_speed()
+            dino_game.update_environment()
+            dino_game.update_dinos(range(len(dino_game.dinos)))
+        return [(type(obst), obst.x, obst.y) for obst in dino_game.obstacles] + [
+            (dirt.get_radius(), dirt.x, dirt.y) for dirt in dino_game.floor_dirt
+        ]
+
+    def test_reset_matches_new_game(self):
+        played = game.Game(2, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=4, headless=True)
+        self._course_after_frames(played)
+        played.reset(VALID_NUM_DINOS, seed=9)
+
+        fresh = game.Game(
+            VALID_NUM_DINOS, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=9, headless=True
+        )
+        self.assertEqual(played.score, 0)
+        self.assertEqual(played.get_game_speed(), fresh.get_game_speed())
+        self.assertEqual(self._course_after_frames(played), self._course_after_frames(fresh))
+
+    def test_reset_resizes_population(self):
+        dinos = self.game.dinos
+        self.game.reset(VALID_NUM_DINOS * 10)
+        self.assertEqual(len(self.game.dinos), VALID_NUM_DINOS * 10)
+        self.game.reset(1)
+        self.assertEqual(len(self.game.dinos), 1)
+        self.assertIs(self.game.dinos, dinos)
+
+    def test_reset_keeps_renderer(self):
+        renderer = self.game.get_renderer()
+        self.game.reset(VALID_NUM_DINOS)
+        self.assertIs(self.game.get_renderer(), renderer)
+
+    def test_reset_no_dinos(self):
+        with self.assertRaises(ValueError):
+            self.game.reset(0)
+
     # #### Restrict Game Loop Speed ####
     def test_restrict_game_loop_speed_success(self):
         try:
@@ -195,6 +243,16 @@ class TestGame(unittest.TestCase):
 
         self.assertTrue(0, "Obstacles all of same type")
 
+    def test_get_next_obstacle_same_seed_same_course(self):
+        game_1 = game.Game(VALID_NUM_DINOS, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=7)
+        game_2 = game.Game(VALID_NUM_DINOS, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=7)
+        for _ in range(1000):
+            game_1.update_environment()
+            game_2.update_environment()
+            self.assertEqual(
+                game_1.get_next_obstacle_info(0), game_2.get_next_obstacle_info(0)
+            )
+
     #### Update Environment ####
     def test_update_environment_success(self):
         try:
@@ -234,6 +292,65 @@ class TestGame(unittest.TestCase):
     def test_dino_update_success(self):
         return
 
+    #### Update Dinos ####
+    def _play_random_actions(self, grouped, num_frames=300):
+        rng = random.Random(3)
+        dino_game = game.Game(8, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=5)
+        alive = list(range(8))
+        deaths = []
+        states = []
+        for _ in range(num_frames):
+            dino_game.increment_game_speed()
+            dino_game.update_environment()
+            if grouped:
+                dino_game.update_dinos(alive)
+            else:
+                for dinoId in alive:
+                    dino_game.update_dino(dinoId)
+
+            for dinoId in alive:
+                # NOTE: Pairs of dinos act alike, so some states stay shared.
+                action = random.Random(dinoId // 2 * 1000 + len(states)).random()
+                if action < 0.05:
+                    dino_game.dino_jump(dinoId)
+                elif action < 0.1 or rng.random() < 0.01:
+                    dino_game.dino_duck(dinoId)
+
+            if grouped:
+                collided = dino_game.dino_object_collisions(alive)
+            else:
+                collided = [
+                    dinoId for dinoId in alive if dino_game.dino_object_collision(dinoId)
+                ]
+            for dinoId in collided:
+                alive.remove(dinoId)
+            deaths.append(collided)
+            states.append([dino.get_state()[1:] for dino in dino_game.dinos])
+        return deaths, states, dino_game
+
+    def test_update_dinos_matches_update_dino(self):
+        self.assertEqual(
+            self._play_random_actions(True)[:2], self._play_random_actions(False)[:2]
+        )
+
+    def test_update_dinos_shares_equal_states(self):
+        dino_game = game.Game(4, VALID_WIN_WIDTH, VALID_WIN_HEIGHT)
+        dino_game.dino_jump(1)
+        dino_game.update_dinos(range(4))
+        self.assertIs(dino_game.dinos[0], dino_game.dinos[2])
+        self.assertIsNot(dino_game.dinos[0], dino_game.dinos[1])
+        self.assertGreater(dino_game.get_dino_elevation(1), 0)
+        self.assertEqual(dino_game.get_dino_elevation(0), 0)
+
+    def test_update_dinos_joins_states_again(self):
+        _deaths, _states, dino_game = self._play_random_actions(True, num_frames=100)
+        self.assertLess(len(set(map(id, dino_game.dinos))), len(dino_game.dinos))
+
+    def test_kill_dino_leaves_shared_dinos_alive(self):
+        self.game.kill_dino(0)
+        self.assertTrue(self.game.dinos[0].is_dead())
+        self.assertFalse(self.game.dinos[1].is_dead())
+
     #### Dino Jump ####
     def test_dino_jump_success(self):
         try:
@@ -304,6 +421,136 @@ class TestGame(unittest.TestCase):
 
         self.assertTrue(0, "No collision within " + str(ITERATIONS) + " iterations")
 
+    def test_dino_object_collisions_match_mask_collision(self):
+        dino_game = game.Game(8, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=7)
+        alive = list(range(8))
+        rng = random.Random(7)
+        for _ in range(1000):
+            dino_game.update_environment()
+            dino_game.update_dinos(alive)
+            for dinoId in alive:
+                if rng.random() < 0.03:
+                    dino_game.dino_jump(dinoId)
+                elif rng.random() < 0.03:
+                    dino_game.dino_duck(dinoId)
+
+            expected = [
+                dinoId
+                for dinoId in alive
+                if any(
+                    mechanics.collision(
+                        obstacle.get_image(),
+                        obstacle.get_image_pos_x(),
+                        obstacle.get_image_pos_y(),
+                        dino_game.dinos[dinoId].get_image(),
+                        dino_game.dinos[dinoId].get_image_pos_x(),
+                        dino_game.dinos[dinoId].get_image_pos_y(),
+                    )
+                    for obstacle in dino_game.obstacles
+                )
+            ]
+            self.assertEqual(dino_game.dino_object_collisions(alive), expected)
+            for dinoId in expected:
+                alive.remove(dinoId)
+            if not alive:
+                return
+        self.fail("Not every dino collided")
+
+    def test_obstacles_cleared_as_they_pass_dinos(self):
+        dino_game = game.Game(1, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=7)
+        for _ in range(1000):
+            dino_game.update_environment()
+        self.assertGreater(dino_game.obstacles_cleared, 0)
+        self.assertLessEqual(dino_game.obstacles_cleared, dino_game.obstacles_spawned)
+
+    #### Animation ####
+    def test_animation_follows_game_clock(self):
+        dino_game = game.Game(2, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=3)
+        images = set()
+        for _ in range(20):
+            dino_game.update_environment()
+            images.add(dino_game.dinos[0].get_image())
+        self.assertEqual(dino_game.clock.frame, 20)
+        self.assertEqual(len(images), 2)
+
+    def test_birds_animate_from_spawn_frame(self):
+        dino_game = game.Game(1, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=3)
+        for _ in range(2000):
+            dino_game.update_environment()
+            for obstacle in dino_game.obstacles:
+                if isinstance(obstacle, game.assets.Bird) and obstacle.phase > 0:
+                    self.assertLess(obstacle.phase, dino_game.clock.frame)
+                    return
+        self.fail("No bird spawned")
+
+    #### Fast Forward ####
+    def _game_state(self, dino_game):
+        return (
+            dino_game.score,
+            dino_game.dino_speed,
+            dino_game.obstacles_spawned,
+            dino_game.obstacles_cleared,
+            [
+                (type(obst), obst.x, obst.y, obst.img, obst.game_speed, vars(obst).get("phase"))
+                for obst in dino_game.obstacles
+            ],
+            [(dirt.x, dirt.y, dirt.game_speed) for dirt in dino_game.floor_dirt],
+            [dino.get_state()[1:] for dino in dino_game.dinos],
+        )
+
+    def _play_jumping_near_obstacles(self, skip_distance, num_frames=1500):
+        # NOTE: Dinos only act within JUMP_DISTANCE of an obstacle, so inside the skip distance.
+        JUMP_DISTANCE = 40
+        LOW_BIRD_ELEVATION = 30
+        dino_game = game.Game(6, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=11)
+        alive = list(range(6))
+        frame = 0
+        frames_skipped = 0
+        while frame < num_frames and alive:
+            if skip_distance is not None:
+                skipped = dino_game.fast_forward(alive, num_frames - frame - 1, skip_distance)
+                frame += skipped
+                frames_skipped += skipped
+
+            frame += 1
+            dino_game.increment_game_speed()
+            dino_game.update_environment()
+            dino_game.update_dinos(alive)
+            for dinoId in alive:
+                obstacle = dino_game.get_next_obstacle_info(dinoId)
+                if obstacle.distance < JUMP_DISTANCE + dinoId * 5 and (
+                    obstacle.is_cactus or obstacle.elevation < LOW_BIRD_ELEVATION
+                ):
+                    dino_game.dino_jump(dinoId)
+            for dinoId in dino_game.dino_object_collisions(alive):
+                alive.remove(dinoId)
+            dino_game.increment_score()
+        return self._game_state(dino_game), frame, frames_skipped
+
+    def test_fast_forward_matches_stepping(self):
+        state, frame, _frames_skipped = self._play_jumping_near_obstacles(None)
+        skipped_state, skipped_frame, frames_skipped = self._play_jumping_near_obstacles(80)
+        self.assertGreater(frames_skipped, frame / 4)
+        self.assertGreater(state[3], 5)
+        self.assertEqual(skipped_frame, frame)
+        self.assertEqual(skipped_state, state)
+
+    def test_fast_forward_not_while_jumping(self):
+        self.game.dino_jump(0)
+        self.game.update_dinos(range(VALID_NUM_DINOS))
+        self.assertEqual(self.game.fast_forward(range(VALID_NUM_DINOS), 100, 0), 0)
+
+    def test_fast_forward_not_with_requests_pending(self):
+        self.game.dino_duck(1)
+        self.assertEqual(self.game.fast_forward(range(VALID_NUM_DINOS), 100, 0), 0)
+
+    def test_fast_forward_stops_short_of_next_obstacle(self):
+        SKIP_DISTANCE = 300
+        frames = self.game.fast_forward(range(VALID_NUM_DINOS), 1000, SKIP_DISTANCE)
+        self.assertGreater(frames, 0)
+        self.assertGreater(self.game.get_next_obstacle_info(0).distance, SKIP_DISTANCE)
+        self.assertEqual(self.game.score, frames)
+
     #### Draw Game ####
     def test_draw_game_success(self):
         try:
@@ -0,0 +1,98 @@
+import unittest
+import os
+import random
+import tempfile
+import neat
+import src.islands as islands
+import src.neural_net as neural_net
+
+CONFIG_PATH = "config/config-feedforward.txt"
+NUM_MIGRANTS = 3
+
+
+def _random_fitness(population, config):
+    for _genome_id, genome in population:
+        genome.fitness = random.random()
+
+
+class TestMigrationDirectory(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.exchange = islands.MigrationDirectory(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    #### Send / Receive ####
+    def test_receive_returns_sent_migrants(self):
+        self.exchange.send(1, 4, ["a", "b"])
+        self.assertEqual(self.exchange.receive(1, 4), ["a", "b"])
+
+    def test_receive_returns_none_once_island_finished(self):
+        self.exchange.finish(1, "winner")
+        self.assertIsNone(self.exchange.receive(1, 4))
+        self.assertEqual(self.exchange.load_winner(1), "winner")
+
+    def test_receive_returns_none_after_timeout(self):
+        self.assertIsNone(self.exchange.receive(1, 4, timeout=0))
+
+    def test_clear_removes_only_island_files(self):
+        self.exchange.send(1, 0, [])
+        self.exchange.send(2, 0, [])
+        self.exchange.finish(1, None)
+        self.exchange.clear(1)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["island_2_gen_0000.pkl"])
+
+    #### Island Path ####
+    def test_island_path_keeps_extension(self):
+        self.assertEqual(
+            islands.island_path("logs/statistics.csv", 2), "logs/statistics_island_2.csv"
+        )
+
+    def test_source_island_wraps_around_ring(self):
+        self.assertEqual(islands.source_island(0, 4), 3)
+        self.assertEqual(islands.source_island(3, 4), 2)
+
+
+class TestMigrationReporter(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.exchange = islands.MigrationDirectory(self.temp_dir.name)
+        self.config = neural_net.loadConfigFile(CONFIG_PATH)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_migrants_replace_offspring_and_are_speciated(self):
+        other_island = neat.Population(self.config)
+        _random_fitness(other_island.population.items(), self.config)
+        migrants = list(other_island.population.values())[:NUM_MIGRANTS]
+        self.exchange.send(1, 0, migrants)
+
+        population = neat.Population(self.config)
+        population.add_reporter(
+            islands.MigrationReporter(population, self.exchange, 0, 2, 1, NUM_MIGRANTS)
+        )
+        population.run(_random_fitness, 1)
+
+        self.assertEqual(len(population.population), self.config.pop_size)
+        self.assertEqual(set(population.species.genome_to_species), set(population.population))
+
+        newest = list(population.population.values())[-NUM_MIGRANTS:]
+        for migrant, genome in zip(migrants, newest):
+            self.assertEqual(set(genome.connections), set(migrant.connections))
+            self.assertIsNone(genome.fitness)
+
+        sent = self.exchange.receive(0, 0, timeout=0)
+        self.assertEqual(len(sent), NUM_MIGRANTS)
+        self.assertEqual(
+            [genome.fitness for genome in sent],
+            sorted((genome.fitness for genome in sent), reverse=True),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
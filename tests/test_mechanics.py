@@ -0,0 +1,136 @@
+import unittest
+import random
+import pygame
+import src.assets as assets
+import src.mechanics as mechanics
+
+NUM_SAMPLES = 20000
+SAMPLE_SEED = 1
+MAX_OFFSET = 140
+
+
+class TestCollision(unittest.TestCase):
+
+    def setUp(self):
+        self.dino_imgs = (
+            assets.load_images("dino_run", 2)
+            + assets.load_images("dino_duck", 2)
+            + assets.load_images("dino_jump", 1)
+        )
+        self.obstacle_imgs = assets.load_images("cactus", 3) + assets.load_images(
+            "bird", 2
+        )
+
+    #### Collision Shape ####
+    def test_collision_shape_outer_covers_mask(self):
+        for img in self.dino_imgs + self.obstacle_imgs:
+            shape = mechanics.get_collision_shape(img)
+            for y, x in zip(*shape.mask.nonzero()):
+                self.assertTrue(
+                    any(
+                        left <= x < right and top <= y < bottom
+                        for left, top, right, bottom in shape.outer.tolist()
+                    )
+                )
+
+    def test_collision_shape_inner_only_set_pixels(self):
+        for img in self.dino_imgs + self.obstacle_imgs:
+            shape = mechanics.get_collision_shape(img)
+            for left, top, right, bottom in shape.inner.tolist():
+                self.assertTrue(shape.mask[top:bottom, left:right].all())
+
+    def test_collision_shape_cached(self):
+        img = self.dino_imgs[0]
+        self.assertIs(
+            mechanics.get_collision_shape(img), mechanics.get_collision_shape(img)
+        )
+
+    #### Collision ####
+    def test_collision_agrees_with_exact_mask(self):
+        rng = random.Random(SAMPLE_SEED)
+        num_hits = 0
+        for _ in range(NUM_SAMPLES):
+            dino_img = rng.choice(self.dino_imgs)
+            obstacle_img = rng.choice(self.obstacle_imgs)
+            x = rng.uniform(-MAX_OFFSET, MAX_OFFSET)
+            y = rng.uniform(-MAX_OFFSET, MAX_OFFSET)
+
+            fast = mechanics.collision(obstacle_img, x, y, dino_img, 0, 0)
+            exact = mechanics.collision(obstacle_img, x, y, dino_img, 0, 0, exact=True)
+
+            self.assertEqual(fast is None, exact is None)
+            num_hits += exact is not None
+
+        self.assertGreater(num_hits, NUM_SAMPLES / 10)
+
+    def test_exact_collision_agrees_with_pygame_mask(self):
+        rng = random.Random(SAMPLE_SEED)
+        for _ in range(NUM_SAMPLES // 10):
+            dino_img = rng.choice(self.dino_imgs)
+            obstacle_img = rng.choice(self.obstacle_imgs)
+            x = rng.randint(-MAX_OFFSET, MAX_OFFSET)
+            y = rng.randint(-MAX_OFFSET, MAX_OFFSET)
+
+            mask1 = pygame.mask.from_surface(pygame.image.load(obstacle_img.path))
+            mask2 = pygame.mask.from_surface(pygame.image.load(dino_img.path))
+            self.assertEqual(
+                mask1.overlap(mask2, (-x, -y)) is None,
+                mechanics.collision(obstacle_img, x, y, dino_img, 0, 0, exact=True)
+                is None,
+            )
+
+    def test_collision_point_is_overlapping_pixel(self):
+        rng = random.Random(SAMPLE_SEED)
+        for _ in range(1000):
+            dino_img = rng.choice(self.dino_imgs)
+            obstacle_img = rng.choice(self.obstacle_imgs)
+            x = rng.randint(-MAX_OFFSET, MAX_OFFSET)
+            y = rng.randint(-MAX_OFFSET, MAX_OFFSET)
+
+            point = mechanics.collision(obstacle_img, x, y, dino_img, 0, 0)
+            if point is None:
+                continue
+
+            mask1 = mechanics.get_collision_shape(obstacle_img).mask
+            mask2 = mechanics.get_collision_shape(dino_img).mask
+            self.assertTrue(mask1[point[1], point[0]])
+            self.assertTrue(mask2[point[1] + y, point[0] + x])
+
+    #### Collisions ####
+    def test_collisions_agree_with_exact_mask(self):
+        rng = random.Random(SAMPLE_SEED)
+        num_hits = 0
+        for _ in range(NUM_SAMPLES // 20):
+            dino_img = rng.choice(self.dino_imgs)
+            obstacle_img = rng.choice(self.obstacle_imgs)
+            x = rng.uniform(-MAX_OFFSET, MAX_OFFSET)
+            y = rng.uniform(-MAX_OFFSET, MAX_OFFSET)
+            dino_ys = [rng.uniform(-MAX_OFFSET, MAX_OFFSET) for _ in range(20)] + [
+                y + 0.5,
+                y - 0.5,
+                y + rng.randint(-5, 5),
+            ]
+
+            hits = mechanics.collisions(obstacle_img, x, y, dino_img, 0, dino_ys)
+            for dino_y, hit in zip(dino_ys, hits):
+                exact = mechanics.collision(
+                    obstacle_img, x, y, dino_img, 0, dino_y, exact=True
+                )
+                self.assertEqual(bool(hit), exact is not None)
+                num_hits += exact is not None
+
+        self.assertGreater(num_hits, NUM_SAMPLES / 100)
+
+    def test_collisions_no_heights(self):
+        hits = mechanics.collisions(self.obstacle_imgs[0], 0, 0, self.dino_imgs[0], 0, [])
+        self.assertEqual(len(hits), 0)
+
+    def test_collision_table_cached(self):
+        self.assertIs(
+            mechanics.get_collision_table(self.obstacle_imgs[0], self.dino_imgs[0], 3),
+            mechanics.get_collision_table(self.obstacle_imgs[0], self.dino_imgs[0], 3),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
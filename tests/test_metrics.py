@@ -0,0 +1,82 @@
+import unittest
+import urllib.error
+import urllib.request
+import src.metrics as metrics
+
+
+class _Genome:
+    def __init__(self, fitness):
+        self.fitness = fitness
+
+
+class TestMetrics(unittest.TestCase):
+
+    #### Format ####
+    def test_format_metrics(self):
+        text = metrics.format_metrics({"generation": 3, "best_fitness": 12.5})
+        self.assertIn("# TYPE dinojump_generation gauge\n", text)
+        self.assertIn("dinojump_generation 3\n", text)
+        self.assertIn("dinojump_best_fitness 12.5\n", text)
+
+    def test_format_metrics_leaves_out_unknown_values(self):
+        text = metrics.format_metrics({"generation": 0, "mean_fitness": None})
+        self.assertNotIn("mean_fitness", text)
+
+    #### Reporter ####
+    def test_reporter_records_generation(self):
+        profile = {"dino_frames": 1000, "network_queries": 500}
+        reporter = metrics.MetricsReporter(profile)
+        population = {key: _Genome(fitness) for key, fitness in enumerate([1.0, 2.0, 6.0])}
+
+        reporter.start_generation(4)
+        reporter.post_evaluate(None, population, None, population[2])
+        reporter.end_generation(None, population, None)
+
+        values = reporter.values
+        self.assertEqual(values["generation"], 4)
+        self.assertEqual(values["best_fitness"], 6.0)
+        self.assertEqual(values["mean_fitness"], 3.0)
+        self.assertAlmostEqual(
+            values["dino_frames_per_second"] / values["network_queries_per_second"], 2
+        )
+        self.assertGreaterEqual(values["reproduction_seconds"], 0)
+
+    def test_resident_memory(self):
+        memory = metrics.get_resident_memory()
+        if memory is not None:
+            self.assertGreater(memory, 0)
+
+    def test_max_resident_memory(self):
+        memory = metrics.get_max_resident_memory()
+        if memory is not None:
+            self.assertGreater(memory, 0)
+
+    #### Server ####
+    def test_server_serves_metrics(self):
+        values = {"generation": 1}
+        server = metrics.MetricsServer(lambda: values, 0)
+        try:
+            url = "http://127.0.0.1:{}/metrics".format(server.port)
+            with urllib.request.urlopen(url, timeout=5) as response:
+                self.assertTrue(response.headers["Content-Type"].startswith("text/plain"))
+                self.assertIn("dinojump_generation 1", response.read().decode())
+
+            values["generation"] = 2
+            with urllib.request.urlopen(url, timeout=5) as response:
+                self.assertIn("dinojump_generation 2", response.read().decode())
+        finally:
+            server.close()
+
+    def test_server_unknown_path(self):
+        server = metrics.MetricsServer(dict, 0)
+        try:
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(
+                    "http://127.0.0.1:{}/other".format(server.port), timeout=5
+                )
+        finally:
+            server.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
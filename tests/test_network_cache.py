@@ -0,0 +1,82 @@
+import unittest
+import copy
+import random
+import neat
+import src.network_cache as network_cache
+import src.neural_net as neural_net
+
+CONFIG_PATH = "config/config-feedforward.txt"
+VALID_SEED = 8
+NUM_GENOMES = 40
+NUM_MUTATIONS = 10
+
+
+class TestNetworkCache(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(VALID_SEED)
+        self.config = neural_net.loadConfigFile(CONFIG_PATH)
+        self.cache = network_cache.NetworkCache()
+        self.genome = neat.DefaultGenome(1)
+        self.genome.configure_new(self.config.genome_config)
+
+    def _random_inputs(self):
+        return [random.uniform(-500, 500) for _ in self.config.genome_config.input_keys]
+
+    #### Create ####
+    def test_create_matches_neat(self):
+        genomes = list(neat.Population(self.config).population.values())[:NUM_GENOMES]
+        for genome in genomes:
+            for _ in range(NUM_MUTATIONS):
+                genome.mutate(self.config.genome_config)
+
+        for genome in genomes + genomes:
+            expected = neat.nn.FeedForwardNetwork.create(genome, self.config)
+            net = self.cache.create(genome, self.config)
+            self.assertEqual(
+                [node_eval[0] for node_eval in net.node_evals],
+                [node_eval[0] for node_eval in expected.node_evals],
+            )
+            for _ in range(5):
+                inputs = self._random_inputs()
+                self.assertEqual(net.activate(inputs), expected.activate(inputs))
+
+    def test_weight_change_reuses_topology(self):
+        self.cache.create(self.genome, self.config)
+        clone = copy.deepcopy(self.genome)
+        next(iter(clone.connections.values())).weight += 0.5
+        net = self.cache.create(clone, self.config)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        inputs = self._random_inputs()
+        self.assertEqual(
+            net.activate(inputs),
+            neat.nn.FeedForwardNetwork.create(clone, self.config).activate(inputs),
+        )
+
+    def test_disabled_connection_is_new_topology(self):
+        self.cache.create(self.genome, self.config)
+        clone = copy.deepcopy(self.genome)
+        next(iter(clone.connections.values())).enabled = False
+        self.cache.create(clone, self.config)
+        self.assertEqual(self.cache.misses, 2)
+
+    #### Eviction ####
+    def test_init_invalid_size(self):
+        with self.assertRaises(ValueError):
+            network_cache.NetworkCache(0)
+
+    def test_evicts_least_recently_used(self):
+        cache = network_cache.NetworkCache(1)
+        clone = copy.deepcopy(self.genome)
+        next(iter(clone.connections.values())).enabled = False
+
+        cache.create(self.genome, self.config)
+        cache.create(clone, self.config)
+        cache.create(self.genome, self.config)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.misses, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,333 @@
+import unittest
+import multiprocessing
+import os
+import random
+import socket
+import sys
+import tempfile
+from unittest import mock
+import neat
+import src.course as course
+import src.neural_net as neural_net
+import src.fitness_measures as fitness_measures
+
+CONFIG_PATH = "config/config-feedforward.txt"
+VALID_SEED = 21
+NUM_GENOMES = 30
+DECISION_INTERVAL = 4
+NUM_COURSES = 3
+COURSE_FITNESSES = [4.0, 1.0, 3.0, 2.0]
+
+
+class TestDecisionInterval(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(VALID_SEED)
+        self.config = neural_net.loadConfigFile(CONFIG_PATH)
+        population = neat.Population(self.config)
+        self.genomes = list(population.population.values())[:NUM_GENOMES]
+
+    def _play(self, interval=1, window=None):
+        for field in neural_net.profile:
+            neural_net.profile[field] = 0
+        fitnesses = neural_net.play_course(
+            self.genomes, self.config, VALID_SEED, interval=interval, window=window
+        )
+        return fitnesses, dict(neural_net.profile)
+
+    #### Decision Frames ####
+    def test_is_decision_frame_includes_first_frame(self):
+        self.assertEqual(
+            [neural_net.is_decision_frame(frame, 3) for frame in range(1, 8)],
+            [True, False, False, True, False, False, True],
+        )
+
+    #### Play Course ####
+    def test_every_frame_queries_every_dino(self):
+        _fitnesses, profile = self._play()
+        self.assertGreater(profile["dino_frames"], 0)
+        self.assertEqual(profile["network_queries"], profile["dino_frames"])
+
+    def test_interval_reduces_queries(self):
+        _fitnesses, profile = self._play(DECISION_INTERVAL)
+        self.assertLessEqual(
+            profile["network_queries"], profile["dino_frames"] // DECISION_INTERVAL + NUM_GENOMES
+        )
+
+    def test_window_covering_screen_matches_every_frame(self):
+        self.assertEqual(
+            self._play(DECISION_INTERVAL, neural_net.WINDOW_WIDTH), self._play()
+        )
+
+    def test_window_adds_queries_near_obstacles(self):
+        _fitnesses, interval_profile = self._play(DECISION_INTERVAL)
+        _fitnesses, window_profile = self._play(DECISION_INTERVAL, 200)
+        self.assertGreater(
+            window_profile["network_queries"] / window_profile["dino_frames"],
+            interval_profile["network_queries"] / interval_profile["dino_frames"],
+        )
+
+    def test_known_topologies_not_compiled_again(self):
+        self._play()
+        _fitnesses, profile = self._play()
+        self.assertEqual(profile["networks_compiled"], 0)
+
+    #### Fitness Measures ####
+    def _play_result(self, max_frames=None):
+        results = []
+
+        def measure(result):
+            results.append(result)
+            return fitness_measures.survival(result)
+
+        fitnesses = neural_net.play_course(
+            self.genomes, self.config, VALID_SEED, max_frames=max_frames, measure=measure
+        )
+        return fitnesses, results[0]
+
+    def test_survival_rewards_frames_played(self):
+        fitnesses, result = self._play_result()
+        self.assertTrue(result.died.all())
+        self.assertEqual(
+            fitnesses,
+            [frames * fitness_measures.SURVIVAL_REWARD - 1 for frames in result.death_frames],
+        )
+
+    def test_dinos_alive_at_max_frames_not_penalised(self):
+        fitnesses, result = self._play_result(max_frames=1)
+        self.assertFalse(result.died.any())
+        self.assertEqual(list(result.death_frames), [1] * NUM_GENOMES)
+        self.assertEqual(fitnesses, [fitness_measures.SURVIVAL_REWARD] * NUM_GENOMES)
+
+    def test_obstacles_cleared_grow_with_death_frame(self):
+        _fitnesses, result = self._play_result()
+        cleared = result.obstacles_cleared[result.death_frames.argsort()]
+        self.assertTrue((cleared[1:] >= cleared[:-1]).all())
+
+    #### Fast Forward ####
+    def test_fast_forward_matches_idle_networks(self):
+        for genome in self.genomes:
+            for node in genome.nodes.values():
+                node.bias = 0.0
+            for connection in genome.connections.values():
+                connection.weight = 0.0
+
+        fitnesses, profile = self._play()
+        for field in neural_net.profile:
+            neural_net.profile[field] = 0
+        skipped_fitnesses = neural_net.play_course(
+            self.genomes, self.config, VALID_SEED, fast_forward=100
+        )
+        self.assertEqual(skipped_fitnesses, fitnesses)
+        self.assertEqual(neural_net.profile["dino_frames"], profile["dino_frames"])
+        self.assertLess(neural_net.profile["network_queries"], profile["network_queries"])
+
+    def test_fast_forward_respects_max_frames(self):
+        MAX_FRAMES = 20
+        fitnesses = neural_net.play_course(
+            self.genomes, self.config, VALID_SEED, max_frames=MAX_FRAMES, fast_forward=0
+        )
+        self.assertEqual(
+            fitnesses, [MAX_FRAMES * fitness_measures.SURVIVAL_REWARD] * NUM_GENOMES
+        )
+
+    #### Node Names ####
+    def test_node_names_follow_sensors(self):
+        node_names = neural_net.get_node_names(self.config)
+        self.assertEqual(node_names[-1], "obst_distance")
+        self.assertEqual(node_names[-self.config.genome_config.num_inputs], "dino_elevation")
+        self.assertEqual(node_names[0], "Jump")
+
+    #### Run Options ####
+    def test_set_run_options_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            neural_net.set_run_options(interval=0)
+
+    def test_set_run_options_negative_window(self):
+        with self.assertRaises(ValueError):
+            neural_net.set_run_options(window=-1)
+
+    def test_set_run_options_unknown_measure(self):
+        with self.assertRaises(ValueError):
+            neural_net.set_run_options(measure="distance")
+
+    def test_set_run_options_negative_fast_forward(self):
+        with self.assertRaises(ValueError):
+            neural_net.set_run_options(skip_distance=-1)
+
+
+class TestAggregateFitness(unittest.TestCase):
+
+    #### Aggregate ####
+    def test_mean(self):
+        self.assertEqual(neural_net.aggregate_fitness(COURSE_FITNESSES, "mean"), 2.5)
+
+    def test_min(self):
+        self.assertEqual(neural_net.aggregate_fitness(COURSE_FITNESSES, "min"), 1.0)
+
+    def test_quantile_interpolates(self):
+        self.assertEqual(
+            neural_net.aggregate_fitness(COURSE_FITNESSES, "quantile", 0.25), 1.75
+        )
+
+    def test_quantile_bounds(self):
+        self.assertEqual(neural_net.aggregate_fitness(COURSE_FITNESSES, "quantile", 0), 1.0)
+        self.assertEqual(neural_net.aggregate_fitness(COURSE_FITNESSES, "quantile", 1), 4.0)
+
+    def test_quantile_single_course(self):
+        self.assertEqual(neural_net.aggregate_fitness([7.0], "quantile", 0.5), 7.0)
+
+    def test_quantile_out_of_range(self):
+        for quantile in (-0.1, 1.1):
+            with self.assertRaises(ValueError):
+                neural_net.aggregate_fitness(COURSE_FITNESSES, "quantile", quantile)
+
+    def test_unknown_aggregate(self):
+        with self.assertRaises(ValueError):
+            neural_net.aggregate_fitness(COURSE_FITNESSES, "median")
+
+
+class TestCourses(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(VALID_SEED)
+        self.config = neural_net.loadConfigFile(CONFIG_PATH)
+        population = neat.Population(self.config)
+        self.genomes = list(population.population.values())[:NUM_GENOMES]
+
+    def tearDown(self):
+        neural_net.set_run_options()
+
+    #### Course Seeds ####
+    def test_course_seeds_follow_course_seed(self):
+        neural_net.set_run_options(True, fixed_course_seed=VALID_SEED, courses=NUM_COURSES)
+        self.assertEqual(neural_net.get_course_seeds(), [21, 22, 23])
+
+    def test_course_seeds_wrap_around(self):
+        neural_net.set_run_options(True, fixed_course_seed=2**32 - 2, courses=NUM_COURSES)
+        self.assertEqual(neural_net.get_course_seeds(), [2**32 - 2, 2**32 - 1, 0])
+
+    def test_course_seeds_random_without_course_seed(self):
+        neural_net.set_run_options(True, courses=NUM_COURSES)
+        seeds = neural_net.get_course_seeds()
+        self.assertEqual(len(seeds), NUM_COURSES)
+        self.assertNotEqual(seeds, neural_net.get_course_seeds())
+
+    #### Play Courses ####
+    def test_play_courses_matches_each_course(self):
+        neural_net.set_run_options(True, courses=NUM_COURSES)
+        seeds = [VALID_SEED + course_index for course_index in range(NUM_COURSES)]
+
+        shared_sprites = course.publish_sprites()
+        neural_net.course_pool = multiprocessing.Pool(
+            NUM_COURSES - 1,
+            initializer=course.install_shared_sprites,
+            initargs=(shared_sprites.handle,),
+        )
+        try:
+            course_fitnesses = neural_net.play_courses(self.genomes, self.config, seeds)
+        finally:
+            neural_net.course_pool.close()
+            neural_net.course_pool.join()
+            neural_net.course_pool = None
+            shared_sprites.close()
+            shared_sprites.unlink()
+
+        expected = [
+            neural_net.play_course(self.genomes, self.config, seed) for seed in seeds
+        ]
+        self.assertNotEqual(expected[0], expected[1])
+        self.assertEqual(course_fitnesses, list(zip(*expected)))
+
+    #### Fitness Cache ####
+    def test_cached_genomes_not_played_again(self):
+        neural_net.set_run_options(True, fixed_course_seed=VALID_SEED)
+        cached = list(enumerate(self.genomes[1:]))
+        neural_net.fitness_function(cached, self.config)
+        fitnesses = [genome.fitness for _genome_id, genome in cached]
+
+        for _genome_id, genome in cached:
+            genome.fitness = None
+        population = cached + [(len(cached), self.genomes[0])]
+        with mock.patch.object(
+            neural_net, "play_courses", wraps=neural_net.play_courses
+        ) as play_courses:
+            neural_net.fitness_function(population, self.config)
+
+        self.assertEqual(play_courses.call_args[0][0], [self.genomes[0]])
+        self.assertEqual([genome.fitness for _genome_id, genome in cached], fitnesses)
+        self.assertIsNotNone(self.genomes[0].fitness)
+
+
+class TestEvolve(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        neural_net.set_run_options()
+        self.temp_dir.cleanup()
+
+    #### Run Options ####
+    def test_render_thread_rejected_on_macos(self):
+        with mock.patch.object(sys, "platform", "darwin"):
+            with self.assertRaises(ValueError):
+                neural_net.set_run_options(render_in_thread=True)
+
+    def test_fast_forward_disables_fitness_cache(self):
+        neural_net.set_run_options(True, fixed_course_seed=VALID_SEED)
+        self.assertIsNotNone(neural_net.evaluation_cache)
+
+        neural_net.set_run_options(True, fixed_course_seed=VALID_SEED, skip_distance=50)
+        self.assertIsNone(neural_net.evaluation_cache)
+
+    #### Metrics Ports ####
+    def _island_metrics_port(self, island, metrics_port):
+        with mock.patch.object(neural_net, "evolve", return_value=(None, None)) as evolve:
+            neural_net._run_island(
+                island=island,
+                num_islands=NUM_COURSES,
+                configFile=CONFIG_PATH,
+                options=dict(run_headless=False, record_replay_dir=None),
+                stats_log=os.path.join(self.temp_dir.name, "stats.csv"),
+                plot_dir=None,
+                plot_every=10,
+                migration_dir=self.temp_dir.name,
+                migration_interval=5,
+                num_migrants=2,
+                metrics_port=metrics_port,
+            )
+        self.assertTrue(neural_net.headless)
+        return evolve.call_args[0][5]
+
+    def test_island_metrics_port_offset(self):
+        self.assertEqual(self._island_metrics_port(2, 9000), 9002)
+
+    def test_island_metrics_port_zero_picks_free_port(self):
+        self.assertEqual(self._island_metrics_port(2, 0), 0)
+
+    def test_island_metrics_ports_out_of_range(self):
+        with self.assertRaises(ValueError):
+            neural_net.run(CONFIG_PATH, True, num_islands=3, metrics_port=2**16 - 2)
+
+    #### Resources ####
+    def test_busy_metrics_port_releases_resources(self):
+        neural_net.set_run_options(True, courses=2)
+        with socket.socket() as busy:
+            busy.bind(("127.0.0.1", 0))
+            busy.listen()
+
+            with self.assertRaises(OSError):
+                neural_net.evolve(
+                    CONFIG_PATH,
+                    os.path.join(self.temp_dir.name, "stats.csv"),
+                    plot_dir=os.path.join(self.temp_dir.name, "plots"),
+                    metrics_port=busy.getsockname()[1],
+                )
+
+        self.assertIsNone(neural_net.course_pool)
+        self.assertEqual(multiprocessing.active_children(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+import os
+import queue
+import sys
+import tempfile
+import types
+from unittest import mock
+import src
+import src.plot_worker as plot_worker
+import src.statistics_log as statistics_log
+
+NODE_NAMES = {-1: "distance", 0: "jump"}
+CHAMPION_INTERVAL = 2
+
+
+class _Genome:
+    def __init__(self, fitness):
+        self.fitness = fitness
+
+
+class _Species:
+    def __init__(self, members):
+        self.members = members
+
+
+class _SpeciesSet:
+    def __init__(self, species):
+        self.species = species
+
+
+def _report_generation(reporter, generation, fitnesses):
+    population = {key: _Genome(fitness) for key, fitness in enumerate(fitnesses)}
+    species = _SpeciesSet({1: _Species(population)})
+    best = max(population.values(), key=lambda genome: genome.fitness)
+
+    reporter.start_generation(generation)
+    reporter.post_evaluate(None, population, species, best)
+    return best
+
+
+def _drain(plot_queue):
+    snapshots = []
+    while not plot_queue.empty():
+        snapshots.append(plot_queue.get())
+    return snapshots
+
+
+def _stub_graph():
+    calls = []
+
+    def draw(name):
+        def record(*args, filename, **kwargs):
+            calls.append((name, args, kwargs))
+            with open(filename, "w"):
+                pass
+
+        return record
+
+    graph = types.SimpleNamespace(
+        draw_net=draw("draw_net"),
+        plot_stats=draw("plot_stats"),
+        plot_species=draw("plot_species"),
+    )
+    return graph, calls
+
+
+class TestPlotWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run_in_process(self, snapshots):
+        graph, calls = _stub_graph()
+        plot_queue = queue.Queue()
+        for snapshot in snapshots + [None]:
+            plot_queue.put(snapshot)
+
+        with mock.patch.dict(sys.modules, {"src.graph": graph}), mock.patch.object(
+            src, "graph", graph, create=True
+        ), mock.patch.dict(os.environ):
+            plot_worker._run_plot_worker(
+                plot_queue, None, self.temp_dir.name, NODE_NAMES
+            )
+        return calls
+
+    #### Reporter ####
+    def test_reporter_sends_stats_every_generation(self):
+        plot_queue = queue.Queue()
+        reporter = plot_worker.PlotReporter(plot_queue, CHAMPION_INTERVAL)
+        for generation in range(5):
+            _report_generation(reporter, generation, [1.0, generation + 2.0])
+
+        stats = [s for s in _drain(plot_queue) if s[0] == "stats"]
+        self.assertEqual([generation for _kind, generation, _data in stats], list(range(5)))
+        self.assertEqual(stats[3][2][0], 5.0)
+
+    def test_reporter_sends_champion_every_interval(self):
+        plot_queue = queue.Queue()
+        reporter = plot_worker.PlotReporter(plot_queue, CHAMPION_INTERVAL)
+        bests = [_report_generation(reporter, generation, [1.0, 3.0]) for generation in range(5)]
+
+        champions = [s for s in _drain(plot_queue) if s[0] == "champion"]
+        self.assertEqual([generation for _kind, generation, _data in champions], [0, 2, 4])
+        self.assertIsNot(champions[0][2], bests[0])
+        self.assertEqual(champions[0][2].fitness, 3.0)
+
+    def test_reporter_without_champion_interval(self):
+        plot_queue = queue.Queue()
+        reporter = plot_worker.PlotReporter(plot_queue, 0)
+        _report_generation(reporter, 0, [1.0])
+
+        self.assertEqual([s[0] for s in _drain(plot_queue)], ["stats"])
+
+    #### Worker ####
+    def test_worker_draws_champion_with_node_names(self):
+        stats = statistics_log.generation_aggregates(
+            {0: _Genome(2.0)}, _SpeciesSet({1: _Species({0: _Genome(2.0)})}), _Genome(2.0)
+        )
+        calls = self._run_in_process(
+            [("stats", 0, stats), ("champion", 0, _Genome(2.0))]
+        )
+
+        draw_net = [call for call in calls if call[0] == "draw_net"]
+        self.assertEqual(len(draw_net), 1)
+        self.assertEqual(draw_net[0][2]["node_names"], NODE_NAMES)
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir.name)),
+            ["avg_fitness.svg", "champion_0000", "speciation.svg"],
+        )
+
+    def test_worker_without_stats_draws_nothing(self):
+        self.assertEqual(self._run_in_process([]), [])
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_worker_survives_failed_plot(self):
+        def fail(*args, **kwargs):
+            raise RuntimeError("Graphviz missing")
+
+        with self.assertWarns(UserWarning):
+            plot_worker._plot(fail)
+
+    #### Close ####
+    def test_close_shuts_down_process(self):
+        worker = plot_worker.PlotWorker(None, self.temp_dir.name, champion_interval=0)
+        _report_generation(worker.reporter, 0, [1.0, 2.0])
+        worker.close()
+
+        self.assertFalse(worker.process.is_alive())
+        self.assertEqual(worker.process.exitcode, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
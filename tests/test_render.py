@@ -2,6 +2,8 @@ import unittest
 import src.render as render
 import pygame
 import os
+import unittest.mock as mock
+import src.sprites as sprites
 import tests.test_common as test_common
 
 
@@ -45,6 +47,28 @@ class TestRender(unittest.TestCase):
         with self.assertRaises(ValueError):
             render.Render("", self.width, self.height, self.floor_height)
 
+    def test_init_without_initialising_all_of_pygame(self):
+        with mock.patch("pygame.init", side_effect=AssertionError("pygame.init called")):
+            render.Render(self.title, self.width, self.height, self.floor_height)
+
+    def test_init_reuses_window_and_font(self):
+        with mock.patch("pygame.font.SysFont", side_effect=AssertionError("font looked up")):
+            second = render.Render(self.title, self.width, self.height, self.floor_height)
+        self.assertIs(second.window, self.render.window)
+        self.assertIs(second.font, self.render.font)
+
+    def test_init_new_window_on_resize(self):
+        resized = render.Render(self.title, self.width * 2, self.height, self.floor_height)
+        self.assertEqual(resized.window.get_size(), (self.width * 2, self.height))
+
+    def test_init_after_close_window(self):
+        self.render.close_window()
+        reopened = render.Render(self.title, self.width, self.height, self.floor_height)
+        try:
+            reopened.display_score(10)
+        except:
+            self.fail("Drawing after reopening the window raised an exception")
+
     #### Display Score ####
     def test_display_score_success(self):
         try:
@@ -98,6 +122,26 @@ class TestRender(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.render.draw_img("FILE", 0, 0)
 
+    #### Draw Sprites ####
+    def test_draw_sprites_matches_individual_draws(self):
+        images = sprites.load_sprites("cactus", 3) + sprites.load_sprites("bird", 2)
+        placed = [(image, 7 * i - 20, 5 * i - 10) for i, image in enumerate(images)]
+
+        self.render.set_background_white()
+        for image, pos_x, pos_y in placed:
+            self.render.draw_sprite(image, pos_x, pos_y)
+        expected = pygame.image.tobytes(self.render.window, "RGB")
+
+        self.render.set_background_white()
+        self.render.draw_sprites(placed)
+        self.assertEqual(pygame.image.tobytes(self.render.window, "RGB"), expected)
+
+    def test_draw_sprites_empty(self):
+        try:
+            self.render.draw_sprites(())
+        except:
+            self.fail("Drawing no sprites raised an exception")
+
     #### Close Window ####
     def test_close_window_success(self):
         try:
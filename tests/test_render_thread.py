@@ -0,0 +1,103 @@
+import unittest
+import sys
+from unittest import mock
+import src.game as game
+import src.render_thread as render_thread
+import tests.test_common as test_common
+
+VALID_WIN_WIDTH = 1200
+VALID_WIN_HEIGHT = 400
+VALID_FRAME_RATE = 1000
+NUM_FRAMES = 50
+
+
+class TestRenderThread(unittest.TestCase):
+
+    def setUp(self):
+        test_common.block_display_render()
+        self.game = game.Game(3, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=1, headless=True)
+        self.pipeline = render_thread.RenderThread(
+            game.TITLE,
+            VALID_WIN_WIDTH,
+            VALID_WIN_HEIGHT,
+            game.get_floor_height(VALID_WIN_HEIGHT),
+            VALID_FRAME_RATE,
+        )
+
+    def tearDown(self):
+        self.pipeline.close()
+
+    #### Publish ####
+    def test_every_frame_drawn_or_dropped(self):
+        for _ in range(NUM_FRAMES):
+            self.game.update_environment()
+            if self.pipeline.wants_frame():
+                self.pipeline.publish(self.game.get_snapshot(), 1)
+        self.pipeline.close()
+
+        self.assertGreater(self.pipeline.frames_drawn, 0)
+        self.assertEqual(
+            self.pipeline.frames_drawn + self.pipeline.frames_dropped, NUM_FRAMES
+        )
+
+    def test_full_queue_drops_frames(self):
+        snapshot = self.game.get_snapshot()
+        for _ in range(render_thread.SNAPSHOT_QUEUE_SIZE + 5):
+            self.pipeline.publish(snapshot, 1)
+        self.pipeline.close()
+        self.assertEqual(
+            self.pipeline.frames_drawn + self.pipeline.frames_dropped,
+            render_thread.SNAPSHOT_QUEUE_SIZE + 5,
+        )
+
+    def test_close_stops_drawing(self):
+        self.pipeline.close()
+        self.assertFalse(self.pipeline.window_open)
+        self.assertFalse(self.pipeline.wants_frame())
+
+    #### Snapshot ####
+    def test_snapshot_unchanged_by_game_update(self):
+        snapshot = self.game.get_snapshot()
+        obstacles = snapshot.obstacles
+        self.game.update_environment()
+        self.assertIs(snapshot.obstacles, obstacles)
+        self.assertNotEqual(self.game.get_snapshot().obstacles, obstacles)
+
+    def test_snapshot_draws_shared_dinos_once(self):
+        self.assertEqual(len(self.game.get_snapshot().dinos), 1)
+        self.game.dino_jump(1)
+        self.game.update_dinos(range(3))
+        self.assertEqual(len(self.game.get_snapshot().dinos), 2)
+
+    def test_snapshot_leaves_out_dead_dinos(self):
+        self.game.dino_jump(1)
+        self.game.update_dinos(range(3))
+        self.game.kill_dino(1)
+        self.assertEqual(len(self.game.get_snapshot().dinos), 1)
+
+    def test_snapshot_only_looks_at_given_dinos(self):
+        self.game.dino_jump(1)
+        self.game.update_dinos(range(3))
+        self.assertEqual(len(self.game.get_snapshot([0, 2]).dinos), 1)
+        self.assertEqual(len(self.game.get_snapshot([0, 1]).dinos), 2)
+
+    #### Platform ####
+    def test_is_supported(self):
+        self.assertTrue(render_thread.is_supported("linux"))
+        self.assertTrue(render_thread.is_supported("win32"))
+        self.assertFalse(render_thread.is_supported("darwin"))
+
+    def test_rejected_on_macos(self):
+        with mock.patch.object(sys, "platform", "darwin"):
+            with self.assertRaises(ValueError):
+                render_thread.RenderThread(
+                    game.TITLE,
+                    VALID_WIN_WIDTH,
+                    VALID_WIN_HEIGHT,
+                    game.get_floor_height(VALID_WIN_HEIGHT),
+                    VALID_FRAME_RATE,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
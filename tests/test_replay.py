@@ -0,0 +1,136 @@
+import unittest
+import os
+import tempfile
+import src.replay as replay
+
+VALID_SEED = 1234
+VALID_NUM_DINOS = 11
+VALID_GENERATION = 3
+VALID_WIN_WIDTH = 1200
+VALID_WIN_HEIGHT = 400
+VALID_FRAME_RATE = 30
+VALID_START_SPEED = 15
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "generation.djr")
+        self.header = replay.ReplayHeader(
+            VALID_SEED,
+            VALID_NUM_DINOS,
+            VALID_GENERATION,
+            VALID_WIN_WIDTH,
+            VALID_WIN_HEIGHT,
+            VALID_FRAME_RATE,
+            VALID_START_SPEED,
+        )
+
+    #### Pack Actions ####
+    def test_pack_actions_round_trip(self):
+        actions = [0, 1, 2, 3, 3, 0, 1, 2, 1]
+        packed = replay.pack_actions(actions)
+        self.assertEqual(len(packed), 3)
+        self.assertEqual(
+            list(replay.unpack_actions(packed, len(actions))), actions
+        )
+
+    def test_pack_actions_empty(self):
+        self.assertEqual(replay.pack_actions([]), b"")
+
+    #### Record/ Read ####
+    def test_read_replay_header_matches_recorded(self):
+        replay.ReplayRecorder(self.path, self.header).close()
+        header, _frames = replay.read_replay(self.path)
+
+        self.assertEqual(header.seed, VALID_SEED)
+        self.assertEqual(header.num_dinos, VALID_NUM_DINOS)
+        self.assertEqual(header.generation, VALID_GENERATION)
+        self.assertEqual(header.frame_rate, VALID_FRAME_RATE)
+        self.assertEqual(header.start_speed, VALID_START_SPEED)
+
+    def test_read_replay_frames_match_recorded(self):
+        recorder = replay.ReplayRecorder(self.path, self.header)
+        recorder.record_spawn(1, 1250, 300)
+        recorder.set_frame(1)
+        recorder.record_actions([replay.JUMP_BIT] * VALID_NUM_DINOS)
+        recorder.record_death(4)
+        recorder.set_frame(2)
+        recorder.record_spawn(3, 1700, 120)
+        recorder.record_actions([replay.DUCK_BIT] * (VALID_NUM_DINOS - 1))
+        recorder.close()
+
+        _header, frames = replay.read_replay(self.path)
+
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(frames[0].spawns, [(1, 1250, 300)])
+        self.assertEqual(frames[1].deaths, [4])
+        self.assertEqual(frames[1].alive, list(range(VALID_NUM_DINOS)))
+        self.assertNotIn(4, frames[2].alive)
+        self.assertEqual(frames[2].spawns, [(3, 1700, 120)])
+        self.assertTrue(all(a == replay.DUCK_BIT for a in frames[2].actions))
+
+    def test_read_replay_interrupted_recording_readable(self):
+        recorder = replay.ReplayRecorder(self.path, self.header)
+        recorder.set_frame(1)
+        recorder.record_actions([0] * VALID_NUM_DINOS)
+        recorder.file.close()
+
+        _header, frames = replay.read_replay(self.path)
+        self.assertEqual(len(frames), 2)
+
+    def test_read_replay_truncated_record_ignored(self):
+        recorder = replay.ReplayRecorder(self.path, self.header)
+        recorder.set_frame(1)
+        recorder.record_actions([0] * VALID_NUM_DINOS)
+        recorder.set_frame(2)
+        recorder.record_actions([replay.JUMP_BIT] * VALID_NUM_DINOS)
+        recorder.file.close()
+
+        # NOTE: Cuts the last frame record inside its action bytes.
+        with open(self.path, "r+b") as replay_file:
+            replay_file.truncate(os.path.getsize(self.path) - 1)
+
+        _header, frames = replay.read_replay(self.path)
+        self.assertEqual(len(frames), 2)
+
+    def test_read_replay_truncated_death_ignored(self):
+        recorder = replay.ReplayRecorder(self.path, self.header)
+        recorder.set_frame(1)
+        recorder.record_actions([0] * VALID_NUM_DINOS)
+        recorder.record_death(4)
+        recorder.file.close()
+
+        with open(self.path, "r+b") as replay_file:
+            replay_file.truncate(os.path.getsize(self.path) - 2)
+
+        _header, frames = replay.read_replay(self.path)
+        self.assertEqual(frames[1].deaths, [])
+
+    def test_read_replay_rerecorded_file_holds_latest_run(self):
+        replay.ReplayRecorder(self.path, self.header).close()
+        self.header.seed = VALID_SEED + 1
+        replay.ReplayRecorder(self.path, self.header).close()
+
+        header, _frames = replay.read_replay(self.path)
+        self.assertEqual(header.seed, VALID_SEED + 1)
+
+    def test_read_replay_invalid_file(self):
+        with open(self.path, "wb") as replay_file:
+            replay_file.write(b"0" * 100)
+
+        with self.assertRaises(ValueError):
+            replay.read_replay(self.path)
+
+    #### Play ####
+    def test_play_invalid_speed(self):
+        with self.assertRaises(ValueError):
+            replay.play(self.path, speed=0)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+import random
+import numpy as np
+import src.assets as assets
+import src.game as game
+import src.sensors as sensors
+import src.neural_net as neural_net
+
+CONFIG_PATH = "config/config-feedforward.txt"
+VALID_WIN_WIDTH = 1200
+VALID_WIN_HEIGHT = 400
+VALID_SEED = 5
+NUM_DINOS = 6
+
+
+class TestSensors(unittest.TestCase):
+
+    def setUp(self):
+        self.game = game.Game(NUM_DINOS, VALID_WIN_WIDTH, VALID_WIN_HEIGHT, seed=VALID_SEED)
+        rng = random.Random(VALID_SEED)
+        for _ in range(40):
+            self.game.update_environment()
+            self.game.update_dinos(range(NUM_DINOS))
+            for dinoId in range(NUM_DINOS):
+                if rng.random() < 0.1:
+                    self.game.dino_jump(dinoId)
+                elif rng.random() < 0.1:
+                    self.game.dino_duck(dinoId)
+
+    #### Layout ####
+    def test_default_layout(self):
+        default_sensors = sensors.Sensors()
+        self.assertEqual(default_sensors.num_inputs, 7)
+        self.assertEqual(
+            default_sensors.names,
+            [
+                "obst_distance",
+                "obst_height",
+                "obst_width",
+                "obst_elevation",
+                "obst_is_cactus",
+                "dino_speed",
+                "dino_elevation",
+            ],
+        )
+
+    def test_names_number_obstacles(self):
+        names = sensors.Sensors(2, ["distance"], []).names
+        self.assertEqual(names, ["obst1_distance", "obst2_distance"])
+
+    def test_unknown_feature(self):
+        with self.assertRaises(ValueError):
+            sensors.Sensors(obstacle_features=["colour"])
+        with self.assertRaises(ValueError):
+            sensors.Sensors(dino_features=["colour"])
+
+    #### Observe ####
+    def test_observe_matches_next_obstacle_info(self):
+        observations = sensors.Sensors().observe(self.game, range(NUM_DINOS))
+        for dinoId, row in enumerate(observations):
+            info = self.game.get_next_obstacle_info(dinoId)
+            self.assertEqual(
+                list(row),
+                [
+                    info.distance,
+                    info.height,
+                    info.width,
+                    info.elevation,
+                    float(info.is_cactus),
+                    self.game.get_game_speed(),
+                    self.game.get_dino_elevation(dinoId),
+                ],
+            )
+
+    def test_observe_subset_of_dinos(self):
+        all_observations = sensors.Sensors().observe(self.game, range(NUM_DINOS))
+        observations = sensors.Sensors().observe(self.game, [4, 1])
+        np.testing.assert_array_equal(observations, all_observations[[4, 1]])
+
+    def test_observe_later_obstacles(self):
+        obstacle_sensors = sensors.Sensors(3, ["distance", "gap", "width"], [])
+        observations = obstacle_sensors.observe(self.game, [0])
+        distance_1, gap_1, width_1, distance_2, gap_2, width_2, distance_3, gap_3, _ = (
+            observations[0]
+        )
+        self.assertEqual(gap_1, distance_1)
+        self.assertEqual(gap_2, distance_2 - distance_1 - width_1)
+        self.assertEqual(gap_3, distance_3 - distance_2 - width_2)
+        self.assertGreater(gap_2, 0)
+
+    def test_observe_pads_missing_obstacles(self):
+        num_ahead = len(self.game.get_obstacles_ahead(10))
+        obstacle_sensors = sensors.Sensors(num_ahead + 1, ["gap", "height"], [])
+        observations = obstacle_sensors.observe(self.game, [0])
+        self.assertEqual(list(observations[0, -2:]), [VALID_WIN_WIDTH, 0])
+
+    def test_observe_time_to_impact(self):
+        observations = sensors.Sensors(1, ["distance", "time_to_impact"], []).observe(
+            self.game, [0]
+        )
+        distance, time_to_impact = observations[0]
+        self.assertAlmostEqual(
+            time_to_impact
+            * self.game.get_game_speed()
+            * assets.PIX_PER_METER
+            / self.game.frame_rate,
+            distance,
+        )
+
+    def test_observe_normalized(self):
+        raw = sensors.Sensors().observe(self.game, range(NUM_DINOS))
+        normalized = sensors.Sensors(normalize=True).observe(self.game, range(NUM_DINOS))
+        np.testing.assert_allclose(normalized[:, 0], raw[:, 0] / VALID_WIN_WIDTH)
+        np.testing.assert_allclose(normalized[:, 1], raw[:, 1] / VALID_WIN_HEIGHT)
+        np.testing.assert_allclose(normalized[:, 5], raw[:, 5] / self.game.start_speed)
+
+
+class TestSensorGenome(unittest.TestCase):
+
+    #### Config ####
+    def test_num_inputs_derived_from_sensors(self):
+        config = neural_net.loadConfigFile(CONFIG_PATH)
+        genome_config = config.genome_config
+        self.assertEqual(genome_config.num_inputs, genome_config.sensors.num_inputs)
+        self.assertEqual(len(genome_config.input_keys), genome_config.sensors.num_inputs)
+
+    def test_num_inputs_mismatch(self):
+        with self.assertRaises(ValueError):
+            sensors.SensorGenome.parse_config({"num_inputs": "3"})
+
+
+if __name__ == "__main__":
+    unittest.main()
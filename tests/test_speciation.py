@@ -0,0 +1,101 @@
+import unittest
+import copy
+import random
+import neat
+import src.neural_net as neural_net
+import src.speciation as speciation
+
+CONFIG_PATH = "config/config-feedforward.txt"
+NUM_GENERATIONS = 15
+POPULATION_SIZE = 300
+LARGE_POPULATION_SIZE = 400
+KEY_OFFSET = 1000
+SEED = 5
+
+
+def _random_fitness(population, config):
+    for _genome_id, genome in population:
+        genome.fitness = random.random()
+
+
+class TestVectorizedSpeciesSet(unittest.TestCase):
+
+    def setUp(self):
+        self._record_generations(POPULATION_SIZE)
+
+    def _record_generations(self, pop_size):
+        random.seed(SEED)
+        self.config = neural_net.loadConfigFile(CONFIG_PATH)
+        self.config.pop_size = pop_size
+
+        # Record the populations of a short run to speciate again with each species set.
+        self.generations = []
+        population = neat.Population(self.config)
+        for _ in range(NUM_GENERATIONS):
+            self.generations.append(copy.deepcopy(population.population))
+            population.run(_random_fitness, 1)
+
+    def _speciate_all(self, species_set_type):
+        species_set = species_set_type(
+            self.config.species_set_config, neat.reporting.ReporterSet()
+        )
+        assignments = []
+        for generation, population in enumerate(self.generations):
+            species_set.speciate(self.config, population, generation)
+            assignments.append(dict(species_set.genome_to_species))
+        return assignments
+
+    #### Speciate ####
+    def test_speciate_matches_default_species_set(self):
+        default = self._speciate_all(neat.DefaultSpeciesSet)
+        vectorized = self._speciate_all(speciation.VectorizedSpeciesSet)
+
+        self.assertGreater(len(set(default[-1].values())), 1)
+        for default_species, vectorized_species in zip(default, vectorized):
+            self.assertEqual(default_species, vectorized_species)
+
+    def test_speciate_matches_default_species_set_offset_keys(self):
+        # NOTE: New species are founded in the order genome keys are popped from a set, which
+        # differs between set(population) and set(population.keys()) for some key ranges.
+        self._record_generations(LARGE_POPULATION_SIZE)
+        self.generations = [
+            {KEY_OFFSET + key: genome for key, genome in population.items()}
+            for population in self.generations
+        ]
+        for population in self.generations:
+            for key, genome in population.items():
+                genome.key = key
+        self.test_speciate_matches_default_species_set()
+
+    def test_speciate_distances_match_genome_distance(self):
+        population = self.generations[-1]
+        species_set = speciation.VectorizedSpeciesSet(
+            self.config.species_set_config, neat.reporting.ReporterSet()
+        )
+        genomes = list(population.values())
+        encoded = [species_set._encode(genome) for genome in genomes]
+        nodes = speciation._GeneMatrix(
+            [enc.node_ids for enc in encoded], [enc.node_values for enc in encoded]
+        )
+        connections = speciation._GeneMatrix(
+            [enc.conn_ids for enc in encoded], [enc.conn_values for enc in encoded]
+        )
+
+        genome_config = self.config.genome_config
+        coefficients = (
+            genome_config.compatibility_weight_coefficient,
+            genome_config.compatibility_disjoint_coefficient,
+        )
+        others = list(range(len(genomes)))
+        for index in range(0, len(genomes), 25):
+            distances = nodes.distances(index, others, *coefficients) + (
+                connections.distances(index, others, *coefficients)
+            )
+            for other, distance in zip(others, distances):
+                self.assertAlmostEqual(
+                    distance, genomes[index].distance(genomes[other], genome_config)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+import pygame
+import src.sprites as sprites
+
+from PIL import Image
+
+SPRITE_SETS = {"bird": 2, "cactus": 3, "dino_run": 2, "dino_duck": 2, "dino_jump": 1}
+
+
+class TestSprites(unittest.TestCase):
+
+    #### Load Sprites ####
+    def test_load_sprites_size_matches_image(self):
+        for name, num in SPRITE_SETS.items():
+            for sprite in sprites.load_sprites(name, num):
+                image = pygame.image.load(sprite.path)
+                self.assertEqual(sprite.get_size(), image.get_size())
+
+    def test_load_sprites_mask_matches_pygame_mask(self):
+        for name, num in SPRITE_SETS.items():
+            for sprite in sprites.load_sprites(name, num):
+                mask = pygame.mask.from_surface(pygame.image.load(sprite.path))
+                for x in range(sprite.get_width()):
+                    for y in range(sprite.get_height()):
+                        self.assertEqual(bool(mask.get_at((x, y))), sprite.mask[y, x])
+
+    def test_load_sprites_cached(self):
+        self.assertIs(
+            sprites.load_sprites("dino_run", 2), sprites.load_sprites("dino_run", 2)
+        )
+
+    def test_load_sprites_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            sprites.load_sprites("missing", 1)
+
+    #### Read PNG Alpha ####
+    def test_read_png_alpha_not_png(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "not_png.png")
+            with open(path, "wb") as not_png:
+                not_png.write(b"not a png file")
+
+            with self.assertRaises(ValueError):
+                sprites.read_png_alpha(path)
+
+    def test_read_png_alpha_palette_transparency(self):
+        image = Image.new("P", (3, 2))
+        image.putpalette([0, 0, 0, 255, 255, 255])
+        image.putpixel((1, 0), 1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "palette.png")
+            image.save(path, transparency=0)
+            alpha = sprites.read_png_alpha(path)
+
+        expected = np.zeros((2, 3), dtype=np.uint8)
+        expected[0, 1] = 255
+        np.testing.assert_array_equal(alpha, expected)
+
+    def test_read_png_alpha_greyscale_opaque(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "grey.png")
+            Image.new("L", (4, 5), 80).save(path)
+            alpha = sprites.read_png_alpha(path)
+
+        self.assertEqual(alpha.shape, (5, 4))
+        self.assertTrue((alpha == 255).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import subprocess
+import sys
+
+# NOTE: Wall-clock startup budgets proved flaky on loaded machines. Startup time is guarded by
+# keeping the visualisation modules, the bulk of the import time, off the training path.
+VISUALISATION_MODULES = ("matplotlib", "graphviz", "pygame")
+
+FIRST_FRAME_SCRIPT = """
+import neat
+import src.neural_net as neural_net
+import src.game as game
+
+config = neural_net.loadConfigFile("config/config-feedforward.txt")
+population = neat.Population(config)
+genomes = list(population.population.values())
+nets = [neural_net.generate_neural_network(genome, config) for genome in genomes]
+
+dinoAI = game.Game(
+    len(genomes), neural_net.WINDOW_WIDTH, neural_net.WINDOW_HEIGHT, headless=True
+)
+dinoAI.increment_game_speed()
+dinoAI.update_environment()
+for dinoId, net in enumerate(nets):
+    dinoAI.update_dino(dinoId)
+    obstacle = dinoAI.get_next_obstacle_info(dinoId)
+    neural_net.calculate_output_neuron(net, [obstacle.distance] * 7)
+    dinoAI.dino_object_collision(dinoId)
+"""
+
+
+def imported_visualisation_modules(script):
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            script
+            + "\nimport sys\nprint(sorted(set(sys.modules) & {}))".format(
+                set(VISUALISATION_MODULES)
+            ),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return output.strip()
+
+
+class TestStartup(unittest.TestCase):
+
+    #### Imports ####
+    def test_training_imports_skip_visualisation(self):
+        self.assertEqual(imported_visualisation_modules("import src.neural_net"), "[]")
+
+    def test_first_frame_imports_skip_visualisation(self):
+        self.assertEqual(imported_visualisation_modules(FIRST_FRAME_SCRIPT), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import csv
+import os
+import tempfile
+import src.statistics_log as statistics_log
+
+
+class _Genome:
+    def __init__(self, fitness):
+        self.fitness = fitness
+
+
+class _Species:
+    def __init__(self, members):
+        self.members = members
+
+
+class _SpeciesSet:
+    def __init__(self, species):
+        self.species = species
+
+
+def _report_generation(reporter, generation, fitnesses, species_members):
+    population = {key: _Genome(fitness) for key, fitness in enumerate(fitnesses)}
+    species = _SpeciesSet(
+        {
+            sid: _Species({key: population[key] for key in members})
+            for sid, members in species_members.items()
+        }
+    )
+    best = max(population.values(), key=lambda genome: genome.fitness)
+
+    reporter.start_generation(generation)
+    reporter.post_evaluate(None, population, species, best)
+
+
+class TestStatisticsLog(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "statistics.csv")
+
+        reporter = statistics_log.StatisticsLogReporter(self.path)
+        _report_generation(reporter, 0, [1.0, 2.0, 3.0], {1: [0, 1, 2]})
+        _report_generation(reporter, 1, [4.0, 2.0, 6.0], {1: [0], 2: [1, 2]})
+        reporter.close()
+
+    #### Read Log ####
+    def test_read_best_fitness(self):
+        log = statistics_log.StatisticsLog(self.path)
+        self.assertEqual(
+            [genome.fitness for genome in log.most_fit_genomes], [3.0, 6.0]
+        )
+
+    def test_read_fitness_mean(self):
+        log = statistics_log.StatisticsLog(self.path)
+        self.assertEqual(log.get_fitness_mean(), [2.0, 4.0])
+
+    def test_read_fitness_stdev(self):
+        log = statistics_log.StatisticsLog(self.path)
+        self.assertAlmostEqual(log.get_fitness_stdev()[1], (8 / 3) ** 0.5)
+
+    def test_read_species_sizes(self):
+        log = statistics_log.StatisticsLog(self.path)
+        self.assertEqual(log.get_species_sizes(), [[3, 0], [1, 2]])
+
+    def test_read_missing_log(self):
+        with self.assertRaises(FileNotFoundError):
+            statistics_log.StatisticsLog(os.path.join(self.temp_dir.name, "missing"))
+
+    def test_profile_logged_with_generation(self):
+        path = os.path.join(self.temp_dir.name, "profile.csv")
+        profile = {"dino_frames": 120, "network_queries": 40}
+        reporter = statistics_log.StatisticsLogReporter(path, profile)
+        _report_generation(reporter, 0, [1.0], {1: [0]})
+        profile["network_queries"] = 30
+        _report_generation(reporter, 1, [1.0], {1: [0]})
+        reporter.close()
+
+        with open(path, newline="") as log_file:
+            rows = list(csv.DictReader(log_file))
+        self.assertEqual([row["network_queries"] for row in rows], ["40", "30"])
+        self.assertEqual(rows[0]["dino_frames"], "120")
+
+    #### Species Sizes ####
+    def test_species_sizes_round_trip(self):
+        sizes = {1: 10, 4: 3, 12: 87}
+        self.assertEqual(
+            statistics_log.parse_species_sizes(
+                statistics_log.format_species_sizes(sizes)
+            ),
+            sizes,
+        )
+
+    def test_species_sizes_empty(self):
+        self.assertEqual(statistics_log.parse_species_sizes(""), {})
+
+    #### Plot ####
+    def test_plot_from_log(self):
+        import src.graph as graph
+
+        filename = os.path.join(self.temp_dir.name, "avg_fitness.svg")
+        graph.plot_stats(self.path, filename=filename)
+        graph.plot_species(
+            self.path, filename=os.path.join(self.temp_dir.name, "speciation.svg")
+        )
+        self.assertTrue(os.path.exists(filename))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()